@@ -0,0 +1,105 @@
+"""Benchmark: Draw Mesh Edges object-snap rebuild time vs. vertex count.
+
+Compares the batched NumPy rebuild (DrawMeshSnapCache.ensure_obj) against the
+previous per-vertex location_3d_to_region_2d loop on grid meshes.
+
+Run from repo root:
+  blender --background --python bench_snap_cache.py
+"""
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+ADDON_ROOT = Path(__file__).resolve().parent
+ADDON_PARENT = ADDON_ROOT.parent
+
+if str(ADDON_PARENT) not in sys.path:
+    sys.path.insert(0, str(ADDON_PARENT))
+
+GRID_SIZES = (32, 100, 224, 316, 448)
+REPEATS = 3
+
+
+def _fake_view():
+    from mathutils import Matrix
+
+    region = SimpleNamespace(width=1920, height=1080)
+    view = Matrix.Translation((0.0, 0.0, -60.0))
+    proj = Matrix.Identity(4)
+    proj[0][0] = 1.0
+    proj[1][1] = 1920.0 / 1080.0
+    proj[2][2] = -1.0
+    proj[2][3] = -0.2
+    proj[3][2] = -1.0
+    proj[3][3] = 0.0
+    rv3d = SimpleNamespace(view_matrix=view, perspective_matrix=proj @ view)
+    return region, rv3d
+
+
+def _grid_bmesh(size: int):
+    import bmesh
+
+    bm = bmesh.new()
+    bmesh.ops.create_grid(bm, x_segments=size - 1, y_segments=size - 1, size=40.0)
+    bm.verts.ensure_lookup_table()
+    bm.edges.ensure_lookup_table()
+    return bm
+
+
+def _legacy_rebuild(bm, mw, region, rv3d) -> int:
+    """Per-element projection as before the batched path (KD insert excluded)."""
+    from bpy_extras.view3d_utils import location_3d_to_region_2d
+
+    n = 0
+    for v in bm.verts:
+        if location_3d_to_region_2d(region, rv3d, mw @ v.co) is not None:
+            n += 1
+    for e in bm.edges:
+        mid = (e.verts[0].co + e.verts[1].co) * 0.5
+        if location_3d_to_region_2d(region, rv3d, mw @ mid) is not None:
+            n += 1
+    return n
+
+
+def _best_of(fn) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> int:
+    from mathutils import Matrix
+    from alecs_toolbox.modules import draw_mesh_snap_cache as snap_cache
+
+    region, rv3d = _fake_view()
+    mw = Matrix.Identity(4)
+    print(f"{'verts':>9} {'edges':>9} {'legacy ms':>11} {'batched ms':>11} {'speedup':>8}")
+    for size in GRID_SIZES:
+        bm = _grid_bmesh(size)
+        cache = snap_cache.DrawMeshSnapCache()
+
+        def batched():
+            cache.invalidate_mesh()
+            cache.ensure_obj(
+                bm, mw, region, rv3d, ("bench", size),
+                include_verts=True, include_edge_mids=True,
+            )
+
+        t_legacy = _best_of(lambda: _legacy_rebuild(bm, mw, region, rv3d))
+        t_batched = _best_of(batched)
+        print(
+            f"{len(bm.verts):>9} {len(bm.edges):>9} {t_legacy * 1e3:>11.1f} "
+            f"{t_batched * 1e3:>11.1f} {t_legacy / max(t_batched, 1e-9):>7.1f}x"
+        )
+        bm.free()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
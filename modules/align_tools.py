@@ -1,7 +1,13 @@
 import bpy
+import numpy as np
 from mathutils import Matrix, Vector
+from . import bounds_cache, mesh_arrays
 from .utils import get_bounds_data, apply_align_move, get_bounds_in_space, bbox_world_axis_interval
 
+# Columns of axis_projection_table rows.
+_MIN, _MAX, _CENTER, _PIVOT = range(4)
+_REF_COLUMN = {"MIN": _MIN, "MAX": _MAX, "CENTER": _CENTER, "PIVOT": _PIVOT}
+
 
 def bbox_axis_interval_world(obj, axis_dir):
     """Scalar min/max on axis_dir; uses evaluated mesh + matrix_world (scale/modifiers like Align)."""
@@ -22,6 +28,76 @@ def reference_projection_on_axis(obj, axis_dir, ref_point):
     return get_bounds_data(obj, "CENTER", space="WORLD") @ axis_dir  # fallback
 
 
+def axis_projection_table(objects, axis_dir) -> np.ndarray:
+    """
+    (N, 4) rows of bbox min, bbox max, world AABB center and pivot projected on normalized axis_dir.
+    One depsgraph update for all objects; same geometry as the per-object helpers above.
+    """
+    bpy.context.view_layer.update()
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    ax = np.array((axis_dir.x, axis_dir.y, axis_dir.z), dtype=np.float64)
+    table = np.empty((len(objects), 4), dtype=np.float64)
+    for i, obj in enumerate(objects):
+        mw = obj.matrix_world
+        pivot = mw.translation @ axis_dir
+        world_coords = bounds_cache.evaluated_world_hull(obj, depsgraph)
+        if world_coords.shape[0] == 0:
+            # Non-geometry objects: bound_box interval, pivot as center (like get_bounds_data).
+            dots = [(mw @ Vector(corner)) @ axis_dir for corner in obj.bound_box]
+            table[i] = (min(dots), max(dots), pivot, pivot)
+            continue
+        dots = world_coords @ ax
+        center = (world_coords.min(axis=0) + world_coords.max(axis=0)) * 0.5
+        table[i] = (dots.min(), dots.max(), center @ ax, pivot)
+    return table
+
+
+def reference_projections_on_axis(objects, axis_dir, ref_point) -> np.ndarray:
+    """(N,) reference_projection_on_axis for every object, in one pass."""
+    table = axis_projection_table(objects, axis_dir.normalized())
+    return table[:, _REF_COLUMN.get(ref_point, _CENTER)]
+
+
+def bbox_axis_intervals_world(objects, axis_dir) -> tuple[np.ndarray, np.ndarray]:
+    """(N,) min and max of bbox_axis_interval_world for every object, in one pass."""
+    table = axis_projection_table(objects, axis_dir.normalized())
+    return table[:, _MIN], table[:, _MAX]
+
+
+def _apply_world_moves(objects, deltas) -> None:
+    """
+    Translate each object by its (N, 3) world delta, then update the view layer once.
+
+    The nearest moved ancestor carries an object along by its whole delta, so each object
+    is written minus that delta, deepest first (before any ancestor's matrix changes):
+    a selected parent and child both land on target whatever the input order.
+    """
+    deltas = np.asarray(deltas, dtype=np.float64).reshape(-1, 3)
+    rows = {obj.as_pointer(): i for i, obj in enumerate(objects)}
+    own = deltas.copy()
+    depth = np.zeros(len(objects), dtype=np.int64)
+    for i, obj in enumerate(objects):
+        carrier = None
+        parent = obj.parent
+        while parent is not None:
+            depth[i] += 1
+            if carrier is None:
+                carrier = rows.get(parent.as_pointer())
+            parent = parent.parent
+        if carrier is not None:
+            own[i] -= deltas[carrier]
+    for i in np.argsort(-depth, kind="stable").tolist():
+        if own[i].any():
+            objects[i].matrix_world.translation += Vector(own[i].tolist())
+    bpy.context.view_layer.update()
+
+
+def _apply_axis_moves(objects, axis_dir, deltas) -> None:
+    """Translate each object by axis_dir * delta (see _apply_world_moves)."""
+    ax = np.array((axis_dir.x, axis_dir.y, axis_dir.z), dtype=np.float64)
+    _apply_world_moves(objects, np.outer(np.asarray(deltas, dtype=np.float64), ax))
+
+
 def distribute_objects_positions(objects, axis_dir, ref_point, endpoint_objs=None):
     """
     Evenly space reference points (MIN/CENTER/PIVOT/MAX) along axis_dir.
@@ -29,39 +105,35 @@ def distribute_objects_positions(objects, axis_dir, ref_point, endpoint_objs=Non
     is distributed between them. Otherwise the positional extremes are used as endpoints.
     Returns (success, message).
     """
-    bpy.context.view_layer.update()
     axis_dir = axis_dir.normalized()
     if len(objects) < 2:
         return False, "Select at least 2 objects"
 
-    data = [(obj, reference_projection_on_axis(obj, axis_dir, ref_point)) for obj in objects]
+    objects = list(objects)
+    s = reference_projections_on_axis(objects, axis_dir, ref_point)
+    pinned = []
 
     if endpoint_objs and len(endpoint_objs) == 2:
         ep_a, ep_b = endpoint_objs
-        s_a = reference_projection_on_axis(ep_a, axis_dir, ref_point)
-        s_b = reference_projection_on_axis(ep_b, axis_dir, ref_point)
+        pinned = [ep_a, ep_b]
+        s_a, s_b = reference_projections_on_axis(pinned, axis_dir, ref_point).tolist()
         if s_a > s_b:
             s_a, s_b = s_b, s_a
-            ep_a, ep_b = ep_b, ep_a
         fixed = {ep_a, ep_b}
-        interior = sorted(
-            [(obj, s) for obj, s in data if obj not in fixed],
-            key=lambda x: x[1],
-        )
-        n = len(interior) + 1
-        for i, (obj, _) in enumerate(interior, start=1):
-            new_s = s_a + (s_b - s_a) * i / n
-            delta_s = new_s - reference_projection_on_axis(obj, axis_dir, ref_point)
-            apply_align_move(obj, axis_dir * delta_s)
+        free = np.array([obj not in fixed for obj in objects], dtype=bool)
+        idx = np.nonzero(free)[0]
+        idx = idx[np.argsort(s[idx], kind="stable")]
+        n = idx.size + 1
+        targets = s_a + (s_b - s_a) * np.arange(1, n) / n
     else:
-        data.sort(key=lambda x: x[1])
-        s_min = data[0][1]
-        s_max = data[-1][1]
-        n = len(data)
-        for i, (obj, s) in enumerate(data):
-            new_s = s_min + (s_max - s_min) * i / (n - 1)
-            apply_align_move(obj, axis_dir * (new_s - s))
-
+        idx = np.argsort(s, kind="stable")
+        n = idx.size
+        s_min, s_max = s[idx[0]], s[idx[-1]]
+        targets = s_min + (s_max - s_min) * np.arange(n) / (n - 1)
+
+    # Fixed endpoints move by zero, so they stay put when their parent is distributed.
+    deltas = np.concatenate((targets - s[idx], np.zeros(len(pinned))))
+    _apply_axis_moves([objects[i] for i in idx] + pinned, axis_dir, deltas)
     return True, ""
 
 
@@ -70,8 +142,8 @@ def positions_spacing_auto_value(objects, axis_dir, ref_point):
     axis_dir = axis_dir.normalized()
     if len(objects) < 2:
         return None
-    scalars = sorted(reference_projection_on_axis(o, axis_dir, ref_point) for o in objects)
-    span = scalars[-1] - scalars[0]
+    scalars = reference_projections_on_axis(objects, axis_dir, ref_point)
+    span = float(scalars.max() - scalars.min())
     if abs(span) < 1e-12:
         return None
     return span / float(len(objects) - 1)
@@ -84,22 +156,17 @@ def distribute_objects_positions_fixed_step(objects, axis_dir, ref_point, spacin
     """
     if endpoint_objs:
         return False, "Custom spacing is not supported with fixed endpoints"
-    bpy.context.view_layer.update()
     axis_dir = axis_dir.normalized()
     if len(objects) < 2:
         return False, "Select at least 2 objects"
     if spacing < 0.0:
         return False, "Spacing cannot be negative"
 
-    data = [(obj, reference_projection_on_axis(obj, axis_dir, ref_point)) for obj in objects]
-    data.sort(key=lambda x: x[1])
-    s0 = data[0][1]
-
-    for i, (obj, _) in enumerate(data):
-        new_s = s0 + spacing * float(i)
-        delta_s = new_s - reference_projection_on_axis(obj, axis_dir, ref_point)
-        apply_align_move(obj, axis_dir * delta_s)
-
+    objects = list(objects)
+    s = reference_projections_on_axis(objects, axis_dir, ref_point)
+    idx = np.argsort(s, kind="stable")
+    targets = s[idx[0]] + spacing * np.arange(idx.size, dtype=np.float64)
+    _apply_axis_moves([objects[i] for i in idx], axis_dir, targets - s[idx])
     return True, ""
 
 
@@ -110,7 +177,6 @@ def distribute_objects_positions_fixed_step_anchor_active(
     Same step between consecutive references after sort, but the active object's reference stays put.
     Targets: s_k = s_active + (k - i_act) * spacing for k in sorted order.
     """
-    bpy.context.view_layer.update()
     axis_dir = axis_dir.normalized()
     if active_obj not in objects:
         return False, "Active object must be part of the selection"
@@ -119,26 +185,16 @@ def distribute_objects_positions_fixed_step_anchor_active(
     if spacing < 0.0:
         return False, "Spacing cannot be negative"
 
-    snapshots = [
-        (obj, reference_projection_on_axis(obj, axis_dir, ref_point)) for obj in objects
-    ]
-    snapshots.sort(key=lambda x: x[1])
-
-    ia = None
-    for idx, (obj, _) in enumerate(snapshots):
-        if obj is active_obj:
-            ia = idx
-            break
+    objects = list(objects)
+    s = reference_projections_on_axis(objects, axis_dir, ref_point)
+    idx = np.argsort(s, kind="stable")
+    order = [objects[i] for i in idx]
+    ia = next((k for k, obj in enumerate(order) if obj is active_obj), None)
     if ia is None:
         return False, "Active object must be part of the selection"
 
-    s_act = snapshots[ia][1]
-    targets = [s_act + (k - ia) * spacing for k in range(len(snapshots))]
-
-    for (obj, s_snap), new_s in zip(snapshots, targets):
-        delta_s = new_s - s_snap
-        apply_align_move(obj, axis_dir * delta_s)
-
+    targets = s[idx[ia]] + (np.arange(idx.size) - ia) * spacing
+    _apply_axis_moves(order, axis_dir, targets - s[idx])
     return True, ""
 
 
@@ -147,19 +203,13 @@ def gaps_spacing_auto_value(objects, axis_dir):
     axis_dir = axis_dir.normalized()
     if len(objects) < 2:
         return None
-    data = []
-    for obj in objects:
-        mn, mx = bbox_axis_interval_world(obj, axis_dir)
-        data.append((mn, mx, mx - mn))
-    data.sort(key=lambda x: x[0])
-    min_first = data[0][0]
-    max_last = data[-1][1]
-    total_span = max_last - min_first
-    total_width = sum(d[2] for d in data)
-    n = len(data)
-    if n < 2:
-        return None
-    return (total_span - total_width) / float(n - 1)
+    mn, mx = bbox_axis_intervals_world(objects, axis_dir)
+    # Same endpoints as the sorted-by-min stack: first slab's min, last slab's max.
+    order = np.argsort(mn, kind="stable")
+    first, last = order[0], order[-1]
+    total_span = mx[last] - mn[first]
+    total_width = float((mx - mn).sum())
+    return float(total_span - total_width) / float(len(objects) - 1)
 
 
 def gaps_spacing_lower_bound_for_overlap(objects, axis_dir) -> float | None:
@@ -171,20 +221,16 @@ def gaps_spacing_lower_bound_for_overlap(objects, axis_dir) -> float | None:
     """
     if len(objects) < 2:
         return None
-    u = axis_dir.normalized()
-    w_min = float("inf")
-    for obj in objects:
-        mn, mx = bbox_axis_interval_world(obj, u)
-        w_min = min(w_min, mx - mn)
-    w_min = max(w_min, 1e-9)
+    mn, mx = bbox_axis_intervals_world(objects, axis_dir.normalized())
+    w_min = max(float((mx - mn).min()), 1e-9)
     return -w_min
 
 
-def _scalar_on_distribute_axis(obj, axis_dir_u: Vector, mode: str, reference_point: str) -> float:
-    """Same 1D coordinate used for Positions (ref) / Gaps (bbox min) distribution."""
+def _scalars_on_distribute_axis(objects, axis_dir_u: Vector, mode: str, reference_point: str) -> np.ndarray:
+    """Same 1D coordinates used for Positions (ref) / Gaps (bbox min) distribution."""
     if mode == "POSITIONS":
-        return reference_projection_on_axis(obj, axis_dir_u, reference_point)
-    return bbox_axis_interval_world(obj, axis_dir_u)[0]
+        return reference_projections_on_axis(objects, axis_dir_u, reference_point)
+    return bbox_axis_intervals_world(objects, axis_dir_u)[0]
 
 
 def interpolate_rotations_active_to_farthest_slerp(
@@ -201,10 +247,10 @@ def interpolate_rotations_active_to_farthest_slerp(
     """
     if active_obj is None or active_obj not in objects or len(objects) < 2:
         return False
-    bpy.context.view_layer.update()
     u = axis_dir.normalized()
     try:
-        snap = {o.as_pointer(): _scalar_on_distribute_axis(o, u, mode, reference_point) for o in objects}
+        scalars = _scalars_on_distribute_axis(objects, u, mode, reference_point)
+        snap = {o.as_pointer(): float(s) for o, s in zip(objects, scalars)}
     except ReferenceError:
         return False
     eps = 1e-9
@@ -242,29 +288,34 @@ def interpolate_rotations_active_to_farthest_slerp(
     return True
 
 
+def _gap_stack(objects, axis_dir):
+    """(objects, mn, mx) sorted by bbox min on axis_dir."""
+    objects = list(objects)
+    mn, mx = bbox_axis_intervals_world(objects, axis_dir)
+    idx = np.argsort(mn, kind="stable")
+    return [objects[i] for i in idx], mn[idx], mx[idx]
+
+
+def _stack_from(start, mn, mx, gap) -> np.ndarray:
+    """Min targets packing slabs (in order) from start with a constant gap."""
+    widths = mx - mn
+    offsets = np.concatenate(((0.0,), np.cumsum(widths[:-1] + gap)))
+    return start + offsets
+
+
 def distribute_objects_gaps_fixed_gap(objects, axis_dir, gap, endpoint_objs=None):
     """
     Same stacking as distribute_objects_gaps but with a caller-chosen gap (can be negative = overlap).
     """
     if endpoint_objs:
         return False, "Custom gap is not supported with fixed endpoints"
-    bpy.context.view_layer.update()
     axis_dir = axis_dir.normalized()
     if len(objects) < 2:
         return False, "Select at least 2 objects"
 
-    data = []
-    for obj in objects:
-        mn, mx = bbox_axis_interval_world(obj, axis_dir)
-        data.append((mn, mx, mx - mn, obj))
-
-    data.sort(key=lambda x: x[0])
-    current = data[0][0]
-    for mn, mx, w, obj in data:
-        delta_s = current - mn
-        apply_align_move(obj, axis_dir * delta_s)
-        current += w + gap
-
+    order, mn, mx = _gap_stack(objects, axis_dir)
+    targets = _stack_from(mn[0], mn, mx, gap)
+    _apply_axis_moves(order, axis_dir, targets - mn)
     return True, ""
 
 
@@ -273,51 +324,28 @@ def distribute_objects_gaps_fixed_gap_anchor_active(objects, axis_dir, gap, acti
     Fixed gap stacking along axis while the active object's bbox projection stays unmoved on that axis:
     slab order is by bbox min (mn); objects left of active pack backward, objects right pack forward.
     """
-    bpy.context.view_layer.update()
     axis_dir = axis_dir.normalized()
     if active_obj not in objects:
         return False, "Active object must be part of the selection"
     if len(objects) < 2:
         return False, "Select at least 2 objects"
 
-    data = []
-    for obj in objects:
-        mn, mx = bbox_axis_interval_world(obj, axis_dir)
-        data.append((mn, mx, mx - mn, obj))
-
-    data.sort(key=lambda x: x[0])
-
-    ia = None
-    for idx, row in enumerate(data):
-        if row[3] is active_obj:
-            ia = idx
-            break
+    order, mn, mx = _gap_stack(objects, axis_dir)
+    ia = next((k for k, obj in enumerate(order) if obj is active_obj), None)
     if ia is None:
         return False, "Active object must be part of the selection"
 
-    mn_active, _, _, _ = data[ia]
-
-    # Pack toward smaller mn: keep mx_j + gap == mn of slab to the right.
-    next_right_mn = mn_active
-    for j in range(ia - 1, -1, -1):
-        mn_j, mx_j, _w_unused, obj_j = data[j]
-        mx_target = next_right_mn - gap
-        delta_s = mx_target - mx_j
-        apply_align_move(obj_j, axis_dir * delta_s)
-        next_right_mn = mn_j + delta_s
-
-    bpy.context.view_layer.update()
-
-    mn_a2, mx_a2 = bbox_axis_interval_world(active_obj, axis_dir)
-    current = mx_a2 + gap
-    for j in range(ia + 1, len(data)):
-        obj_j = data[j][3]
-        mn_j, mx_j = bbox_axis_interval_world(obj_j, axis_dir)
-        w_j = mx_j - mn_j
-        delta_s = current - mn_j
-        apply_align_move(obj_j, axis_dir * delta_s)
-        current += w_j + gap
-
+    deltas = np.zeros(mn.size, dtype=np.float64)
+    # Pack toward smaller mn: keep mx_j + gap == mn of slab to the right (walk the reversed left part).
+    if ia > 0:
+        left = slice(ia - 1, None, -1)
+        mx_targets = _stack_from(gap - mn[ia], -mx[left], -mn[left], gap)
+        deltas[left] = -mx_targets - mx[left]
+    if ia + 1 < mn.size:
+        right = slice(ia + 1, None)
+        targets = _stack_from(mx[ia] + gap, mn[right], mx[right], gap)
+        deltas[right] = targets - mn[right]
+    _apply_axis_moves(order, axis_dir, deltas)
     return True, ""
 
 
@@ -328,52 +356,37 @@ def distribute_objects_gaps(objects, axis_dir, endpoint_objs=None):
     Otherwise the positional extremes are used.
     Returns (success, message).
     """
-    bpy.context.view_layer.update()
     axis_dir = axis_dir.normalized()
     if len(objects) < 2:
         return False, "Select at least 2 objects"
 
-    data = []
-    for obj in objects:
-        mn, mx = bbox_axis_interval_world(obj, axis_dir)
-        data.append((mn, mx, mx - mn, obj))
-
-    data.sort(key=lambda x: x[0])
+    order, mn, mx = _gap_stack(objects, axis_dir)
+    pinned = []
 
     if endpoint_objs and len(endpoint_objs) == 2:
         ep_a, ep_b = endpoint_objs
-        mn_a, mx_a = bbox_axis_interval_world(ep_a, axis_dir)
-        mn_b, mx_b = bbox_axis_interval_world(ep_b, axis_dir)
+        pinned = [ep_a, ep_b]
+        (mn_a, mn_b), (mx_a, mx_b) = (a.tolist() for a in bbox_axis_intervals_world(pinned, axis_dir))
         if mn_a > mn_b:
             mn_a, mx_a, mn_b, mx_b = mn_b, mx_b, mn_a, mx_a
-            ep_a, ep_b = ep_b, ep_a
         fixed = {ep_a, ep_b}
-        interior = [(mn, mx, w, obj) for mn, mx, w, obj in data if obj not in fixed]
-        interior.sort(key=lambda x: x[0])
+        free = np.array([obj not in fixed for obj in order], dtype=bool)
+        order = [obj for obj, keep in zip(order, free) if keep]
+        mn, mx = mn[free], mx[free]
+        if not order:
+            return True, ""
         total_span = mx_b - mn_a
-        total_width = (mx_a - mn_a) + (mx_b - mn_b) + sum(w for _, _, w, _ in interior)
-        n_gaps = len(interior) + 1
-        gap = (total_span - total_width) / n_gaps
-        current = mx_a + gap
-        for mn, mx, w, obj in interior:
-            delta_s = current - mn
-            apply_align_move(obj, axis_dir * delta_s)
-            current += w + gap
+        total_width = (mx_a - mn_a) + (mx_b - mn_b) + float((mx - mn).sum())
+        gap = (total_span - total_width) / (len(order) + 1)
+        targets = _stack_from(mx_a + gap, mn, mx, gap)
     else:
-        min_first = data[0][0]
-        max_last = data[-1][1]
-        total_span = max_last - min_first
-        total_width = sum(d[2] for d in data)
-        n = len(data)
-        if n < 2:
-            return False, "Select at least 2 objects"
-        gap = (total_span - total_width) / (n - 1)
-        current = min_first
-        for mn, mx, w, obj in data:
-            delta_s = current - mn
-            apply_align_move(obj, axis_dir * delta_s)
-            current += w + gap
+        total_span = mx[-1] - mn[0]
+        total_width = float((mx - mn).sum())
+        gap = (total_span - total_width) / (mn.size - 1)
+        targets = _stack_from(mn[0], mn, mx, gap)
 
+    # Fixed endpoints move by zero, so they stay put when their parent is distributed.
+    _apply_axis_moves(order + pinned, axis_dir, np.concatenate((targets - mn, np.zeros(len(pinned)))))
     return True, ""
 
 def align_position(source, target, x=True, y=True, z=True, 
@@ -452,6 +465,79 @@ def match_scale(source, target, x=True, y=True, z=True,
         source.scale.z = target.scale.z + offset_z
 
 
+def _align_reference_points(objects, depsgraph, point, frame_inv=None) -> np.ndarray:
+    """
+    (N, 3) PIVOT/MIN/MAX/CENTER of every object from the shared bounds cache, in world space or,
+    with frame_inv, in that frame's local space (like get_bounds_data / get_bounds_in_space).
+    """
+    out = np.empty((len(objects), 3), dtype=np.float64)
+    for i, obj in enumerate(objects):
+        mw = obj.evaluated_get(depsgraph).matrix_world
+        if point == "PIVOT":
+            pivot = mw.translation if frame_inv is None else frame_inv @ mw.translation
+            out[i] = (pivot.x, pivot.y, pivot.z)
+            continue
+        hull = bounds_cache.evaluated_local_hull(obj, depsgraph)
+        if hull.shape[0] == 0:
+            # Non-geometry objects: pivot in world, zero bounds in a frame (as the per-object helpers).
+            out[i] = tuple(mw.translation) if frame_inv is None else (0.0, 0.0, 0.0)
+            continue
+        co = mesh_arrays.transform_points(mw if frame_inv is None else frame_inv @ mw, hull)
+        if point == "MIN":
+            out[i] = co.min(axis=0)
+        elif point == "MAX":
+            out[i] = co.max(axis=0)
+        else:  # CENTER
+            out[i] = (co.min(axis=0) + co.max(axis=0)) / 2
+    return out
+
+
+def align_to_target(
+    sources,
+    target,
+    *,
+    position=(True, True, True),
+    position_offset=(0.0, 0.0, 0.0),
+    source_point="PIVOT",
+    target_point="PIVOT",
+    use_active_orient=False,
+    rotation=(False, False, False),
+    rotation_offset=(0.0, 0.0, 0.0),
+    scale=(False, False, False),
+    scale_offset=(0.0, 0.0, 0.0),
+):
+    """
+    align_orientation, match_scale then align_position for every source in one pass:
+    one view layer update before reading bounds (from the shared cache), deltas solved as
+    arrays, translations assigned together (parented sources compensated, see
+    _apply_world_moves), one update at the end.
+    """
+    sources = [o for o in sources if o is not target]
+    if not sources:
+        return
+    if any(rotation):
+        for source in sources:
+            align_orientation(source, target, *rotation, *rotation_offset)
+    if any(scale):
+        for source in sources:
+            match_scale(source, target, *scale, *scale_offset)
+    bpy.context.view_layer.update()
+    if not any(position):
+        return
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    frame_inv = target.matrix_world.inverted() if use_active_orient else None
+    src = _align_reference_points(sources, depsgraph, source_point, frame_inv)
+    tgt = _align_reference_points([target], depsgraph, target_point, frame_inv)[0]
+    if use_active_orient and target_point == "PIVOT":
+        tgt = np.zeros(3)
+    mask = np.array(position, dtype=np.float64)
+    delta = (tgt - src + np.array(position_offset, dtype=np.float64)) * mask
+    if use_active_orient:
+        delta = delta @ np.array(target.matrix_world.to_3x3(), dtype=np.float64).T
+    _apply_world_moves(sources, delta)
+
+
 def distribute_perpendicular_toggle_labels(axis_mode: str) -> tuple[str, str]:
     """Short labels for perpendicular plane axes (WORLD = world XYZ; LOCAL = active local components)."""
     if axis_mode in ("WORLD_X", "LOCAL_X"):
@@ -502,20 +588,12 @@ def distribute_plane_align_to_active(
     if cfg is None or active is None:
         return False, ""
     align_x, align_y, align_z, use_act = cfg
-    for src in objects:
-        if src is active:
-            continue
-        align_position(
-            src,
-            active,
-            x=align_x,
-            y=align_y,
-            z=align_z,
-            source_point=source_point,
-            target_point=target_point,
-            use_active_orient=use_act,
-            offset_x=0.0,
-            offset_y=0.0,
-            offset_z=0.0,
-        )
+    align_to_target(
+        objects,
+        active,
+        position=(align_x, align_y, align_z),
+        source_point=source_point,
+        target_point=target_point,
+        use_active_orient=use_act,
+    )
     return True, ""
\ No newline at end of file
@@ -0,0 +1,111 @@
+"""Arc-length reparameterisation of vertex chains (Equalize Edge Lengths, Distribute Vertices).
+
+Chains are given as ordered point rows concatenated into one array with start offsets, so
+many loops are resampled in one batch: segment lengths, one cumulative sum and a single
+searchsorted place every vertex at its target distance. Chains are ordered from plain
+integer edge pairs (walk_chain). Nothing here touches bmesh.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+# Chains shorter than this are left as they are.
+_MIN_TOTAL = 1e-6
+# Source segments shorter than this cannot place a vertex (it keeps its position).
+_MIN_SEGMENT = 1e-9
+
+
+def walk_chain(edge_pairs: np.ndarray, start: int) -> np.ndarray | None:
+    """Vertex ids of a simple path or cycle in walk order from start.
+
+    edge_pairs is (E, 2) ids of one connected component. Returns None when start is not on
+    it, a vertex has more than two edges, or the edges do not form one chain.
+    """
+    edge_pairs = np.asarray(edge_pairs, dtype=np.int64).reshape(-1, 2)
+    ids, local = np.unique(edge_pairs, return_inverse=True)
+    local = local.reshape(-1, 2)
+    pos = int(np.searchsorted(ids, start))
+    if pos >= ids.size or ids[pos] != start:
+        return None
+    src = np.concatenate((local[:, 0], local[:, 1]))
+    dst = np.concatenate((local[:, 1], local[:, 0]))
+    degree = np.bincount(src, minlength=ids.size)
+    if degree.max() > 2:
+        return None
+    # Neighbours in edge order, so the walk leaves start along its first listed edge.
+    order = np.lexsort((np.tile(np.arange(local.shape[0]), 2), src))
+    first = np.searchsorted(src[order], np.arange(ids.size))
+    nbr = np.full((ids.size, 2), -1, dtype=np.int64)
+    nbr[:, 0] = dst[order][first]
+    has_two = degree == 2
+    nbr[has_two, 1] = dst[order][first[has_two] + 1]
+
+    nbr_list = nbr.tolist()
+    walk = [pos]
+    prev, cur = -1, pos
+    while len(walk) <= ids.size:
+        a, b = nbr_list[cur]
+        nxt = b if a == prev else a
+        if nxt < 0 or nxt == pos:
+            break
+        walk.append(nxt)
+        prev, cur = cur, nxt
+    if len(walk) != ids.size:
+        return None
+    return ids[walk]
+
+
+def equalize_chains(points: np.ndarray, offsets: np.ndarray, closed: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """(new points, moved mask) with every chain's vertices at equal arc-length spacing.
+
+    points holds the ordered vertices of all chains back to back; chain k is
+    points[offsets[k]:offsets[k + 1]]. Closed chains include the closing segment and get
+    spacing perimeter / n; open chains keep both ends and get length / (n - 1). The first
+    vertex of each chain stays fixed. Chains with fewer than 3 vertices or no length are
+    left unchanged.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    closed = np.asarray(closed, dtype=bool)
+    out = points.copy()
+    moved = np.zeros(points.shape[0], dtype=bool)
+    counts = np.diff(offsets)
+    use = counts >= 3
+    if not use.any():
+        return out, moved
+    offsets, counts, closed = offsets[:-1][use], counts[use], closed[use]
+
+    # Segment a -> b of every chain, back to back; closed chains add last -> first.
+    n_seg = counts - 1 + closed
+    seg_start = np.concatenate(((0,), np.cumsum(n_seg)[:-1]))
+    chain_of_seg = np.repeat(np.arange(counts.size), n_seg)
+    local = np.arange(int(n_seg.sum())) - seg_start[chain_of_seg]
+    a = offsets[chain_of_seg] + local
+    b = offsets[chain_of_seg] + (local + 1) % counts[chain_of_seg]
+    seg_vec = points[b] - points[a]
+    seg_len = np.sqrt(np.einsum("ij,ij->i", seg_vec, seg_vec))
+    seg_end = np.cumsum(seg_len)
+    chain_base = seg_end[seg_start] - seg_len[seg_start]
+    total = seg_end[seg_start + n_seg - 1] - chain_base
+
+    # Vertex i > 0 (and, for open chains, i < n - 1) of each chain gets a target distance.
+    n_free = counts - 1 - (~closed)
+    ok = total >= _MIN_TOTAL
+    n_free = np.where(ok, n_free, 0)
+    chain_of_vert = np.repeat(np.arange(counts.size), n_free)
+    i = np.arange(int(n_free.sum())) - np.repeat(np.cumsum(n_free) - n_free, n_free) + 1
+    step = total / n_seg
+    target = chain_base[chain_of_vert] + i * step[chain_of_vert]
+
+    # First segment (within the chain) whose end reaches the target.
+    seg = np.searchsorted(seg_end, target - 1e-9, side="left")
+    lo = seg_start[chain_of_vert]
+    seg = np.clip(seg, lo, lo + n_seg[chain_of_vert] - 1)
+    length = seg_len[seg]
+    placed = length >= _MIN_SEGMENT
+    seg, length = seg[placed], length[placed]
+    t = (target[placed] - (seg_end[seg] - length)) / length
+    rows = offsets[chain_of_vert[placed]] + i[placed]
+    out[rows] = points[a[seg]] + seg_vec[seg] * t[:, None]
+    moved[rows] = True
+    return out, moved
@@ -1,6 +1,8 @@
 import bpy
+import numpy as np
 from mathutils import Vector, Matrix
-from .utils import move_to_collection, get_or_create_collection
+from . import bounds_cache, convex_hull, mesh_arrays, oriented_box
+from .utils import get_or_create_collection
 
 # Viewport wire object-color (RGBA) for bbox helper cages
 BBOX_HELPER_COLOR = (0.0, 1.0, 0.2, 1.0)
@@ -8,38 +10,6 @@ BBOX_HELPER_COLOR = (0.0, 1.0, 0.2, 1.0)
 BBOX_HELPER_COLOR_PADDED = (0 / 255, 231 / 255, 255 / 255, 1.0)
 
 
-def _apply_bbox_finish(
-    context,
-    bbox,
-    apply_extras,
-    *,
-    anchor_obj,
-    mesh_objects_restore,
-    restore_active,
-    wire_color,
-):
-    bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-
-    tint = wire_color if wire_color is not None else BBOX_HELPER_COLOR
-    if apply_extras:
-        setup_bbox_visibility(bbox, color=tint)
-        set_shading_to_object(context)
-
-    if apply_extras:
-        helpers_coll = get_or_create_collection(context)
-        move_to_collection(bbox, helpers_coll)
-    else:
-        move_to_same_collections(bbox, anchor_obj)
-
-    bpy.ops.object.select_all(action="DESELECT")
-    for ob in mesh_objects_restore:
-        if ob.name in bpy.data.objects:
-            bpy.data.objects[ob.name].select_set(True)
-    if restore_active and restore_active.name in bpy.data.objects:
-        context.view_layer.objects.active = bpy.data.objects[restore_active.name]
-
-    return bbox
-
 def setup_bbox_visibility(bbox, color=BBOX_HELPER_COLOR):
     bbox.display_type = 'WIRE'
     bbox.color = color
@@ -60,19 +30,6 @@ def set_shading_to_object(context):
                     space.shading.wireframe_color_type = 'OBJECT'
 
 
-def move_to_same_collections(obj, source_obj):
-    source_collections = list(source_obj.users_collection)
-    if not source_collections:
-        return
-
-    for coll in list(obj.users_collection):
-        coll.objects.unlink(obj)
-
-    for coll in source_collections:
-        if obj.name not in coll.objects:
-            coll.objects.link(obj)
-
-
 def _pad_min_max(mn: Vector, mx: Vector, margin: float):
     """Expand bounds by margin along each axis; avoid degenerate size."""
     pad = Vector((margin, margin, margin))
@@ -88,6 +45,158 @@ def _pad_min_max(mn: Vector, mx: Vector, margin: float):
     return out_min, out_max
 
 
+# Cube faces over the 8 corners indexed 4 * ix + 2 * iy + iz (0 = min side, 1 = max side).
+_CUBE_FACES = (
+    (0, 1, 3, 2),
+    (4, 6, 7, 5),
+    (0, 4, 5, 1),
+    (2, 3, 7, 6),
+    (0, 2, 6, 4),
+    (1, 5, 7, 3),
+)
+_CUBE_SIGNS = np.array(
+    [(sx, sy, sz) for sx in (-1.0, 1.0) for sy in (-1.0, 1.0) for sz in (-1.0, 1.0)],
+    dtype=np.float64,
+)
+
+
+def _bounds_in_frame(objects, depsgraph, frame_inv) -> tuple[Vector, Vector] | None:
+    """Min/max of the objects' evaluated geometry in the space of frame_inv (None = world)."""
+    mins = []
+    maxs = []
+    for obj in objects:
+        local = bounds_cache.evaluated_local_hull(obj, depsgraph)
+        if local.shape[0] == 0:
+            continue
+        mw = obj.matrix_world if frame_inv is None else frame_inv @ obj.matrix_world
+        co = mesh_arrays.transform_points(mw, local)
+        mins.append(co.min(axis=0))
+        maxs.append(co.max(axis=0))
+    if not mins:
+        return None
+    return Vector(np.min(mins, axis=0).tolist()), Vector(np.max(maxs, axis=0).tolist())
+
+
+def _cage_spec(name, frame, mn, mx, margin, wire_color, anchor_obj):
+    """(name, loc/rot matrix, half extents, wire color, anchor) for bounds mn..mx in frame (None = world)."""
+    mn, mx = _pad_min_max(mn, mx, margin)
+    center = (mn + mx) / 2
+    size = mx - mn
+    if frame is None:
+        return (name, Matrix.Translation(center), size / 2, wire_color, anchor_obj)
+    # Same split as transform_apply(scale=True) after placing a unit cube: scale goes into the mesh.
+    loc, rot, sca = (frame @ Matrix.LocRotScale(center, None, size)).decompose()
+    half = Vector((abs(sca.x), abs(sca.y), abs(sca.z))) / 2
+    return (name, Matrix.LocRotScale(loc, rot, None), half, wire_color, anchor_obj)
+
+
+def _oriented_bounds(objects, depsgraph) -> tuple[Matrix, Vector, Vector] | None:
+    """(rotation frame, min, max) of the minimum-volume box around the objects' world hulls."""
+    hulls = [bounds_cache.evaluated_world_hull(obj, depsgraph) for obj in objects]
+    points = np.concatenate([h for h in hulls if h.shape[0]] or [np.empty((0, 3))])
+    if points.shape[0] == 0:
+        return None
+    if len(hulls) > 1:
+        points = points[convex_hull.hull_vertices(points)]
+    rows, mn, mx = oriented_box.minimum_volume_box(points)
+    frame = Matrix(rows.T.tolist()).to_4x4()
+    return frame, Vector(mn.tolist()), Vector(mx.tolist())
+
+
+def _cage_specs_for(anchor_obj, objects, depsgraph, mode, margins):
+    """One spec per (margin, name suffix, wire color) in margins; [] when there is no geometry."""
+    if mode == "OBB":
+        fit = _oriented_bounds(objects, depsgraph)
+        if fit is None:
+            return []
+        frame, mn, mx = fit
+        bounds = (mn, mx)
+    else:
+        frame = anchor_obj.matrix_world if mode == "LOCAL" else None
+        bounds = _bounds_in_frame(objects, depsgraph, None if frame is None else frame.inverted())
+        if bounds is None:
+            return []
+    tag = {"LOCAL": "_bbox", "OBB": "_bbox_o"}.get(mode, "_bbox_w")
+    return [
+        _cage_spec(f"{anchor_obj.name}{tag}{suffix}", frame, bounds[0], bounds[1], margin, color, anchor_obj)
+        for margin, suffix, color in margins
+    ]
+
+
+def _new_cage_object(name, basis, half):
+    corners = _CUBE_SIGNS * np.array((half.x, half.y, half.z), dtype=np.float64)
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(corners.tolist(), [], _CUBE_FACES)
+    mesh.update()
+    bbox = bpy.data.objects.new(name, mesh)
+    bbox.matrix_world = basis
+    return bbox
+
+
+def _build_cages(context, specs, apply_extras, *, restore_meshes, restore_active):
+    """Create every cage from specs, link them, then restore the mesh selection and active object once."""
+    if not specs:
+        return []
+    helpers_coll = get_or_create_collection(context) if apply_extras else None
+    cages = []
+    for name, basis, half, wire_color, anchor_obj in specs:
+        bbox = _new_cage_object(name, basis, half)
+        if apply_extras:
+            helpers_coll.objects.link(bbox)
+            setup_bbox_visibility(bbox, color=wire_color if wire_color is not None else BBOX_HELPER_COLOR)
+        else:
+            target_colls = list(anchor_obj.users_collection) or [context.collection]
+            for coll in target_colls:
+                coll.objects.link(bbox)
+        cages.append(bbox)
+    if apply_extras:
+        set_shading_to_object(context)
+
+    keep = {ob.name for ob in restore_meshes}
+    for ob in context.selected_objects:
+        if ob.name not in keep:
+            ob.select_set(False)
+    for name in keep:
+        ob = bpy.data.objects.get(name)
+        if ob is not None:
+            ob.select_set(True)
+    if restore_active and restore_active.name in bpy.data.objects:
+        context.view_layer.objects.active = bpy.data.objects[restore_active.name]
+    return cages
+
+
+def _margins(pad, dual, name_suffix="", wire_color=None):
+    if dual:
+        return [(0.0, name_suffix, wire_color), (pad, "_p", BBOX_HELPER_COLOR_PADDED)]
+    return [(pad, name_suffix, wire_color)]
+
+
+def build_bbox_helpers(context, *, mode, each_object, apply_extras, pad, dual):
+    """
+    All cages for the current selection in one pass: Combined (one cage in active's space, world or
+    a minimum-volume orientation) or Each object (one per mesh). dual adds a padded copy next to every tight cage.
+    Evaluated geometry is read once per object (shared bounds cache); no bpy.ops per cage.
+    """
+    selected_meshes = [o for o in context.selected_objects if o.type == "MESH"]
+    active = context.active_object
+    if not selected_meshes or active is None:
+        return []
+    if each_object and active.type != "MESH":
+        return []
+
+    depsgraph = context.evaluated_depsgraph_get()
+    margins = _margins(pad, dual)
+    specs = []
+    if each_object:
+        for mesh_obj in selected_meshes:
+            specs.extend(_cage_specs_for(mesh_obj, [mesh_obj], depsgraph, mode, margins))
+    else:
+        specs = _cage_specs_for(active, selected_meshes, depsgraph, mode, margins)
+    return _build_cages(
+        context, specs, apply_extras, restore_meshes=selected_meshes, restore_active=active
+    )
+
+
 def create_bbox(
     context,
     mode='LOCAL',
@@ -102,63 +211,13 @@ def create_bbox(
         return None
 
     depsgraph = context.evaluated_depsgraph_get()
-    inv_matrix = active.matrix_world.inverted()
-    
-    all_coords_local = []
-    all_coords_world = []
-
-    for obj in selected_meshes:
-        obj_eval = obj.evaluated_get(depsgraph)
-        mesh = obj_eval.to_mesh()
-        mat = obj.matrix_world
-        
-        for v in mesh.vertices:
-            world_co = mat @ v.co
-            all_coords_world.append(world_co)
-            all_coords_local.append(inv_matrix @ world_co)
-            
-        obj_eval.to_mesh_clear()
-
-    if not all_coords_world: 
-        return None
-
-    if mode == 'LOCAL':
-        l_min = Vector((min(v.x for v in all_coords_local), min(v.y for v in all_coords_local), min(v.z for v in all_coords_local)))
-        l_max = Vector((max(v.x for v in all_coords_local), max(v.y for v in all_coords_local), max(v.z for v in all_coords_local)))
-        l_min, l_max = _pad_min_max(l_min, l_max, margin)
-
-        center_local = (l_min + l_max) / 2
-        size = l_max - l_min
-
-        bpy.ops.mesh.primitive_cube_add(size=1.0)
-        bbox = context.active_object
-        bbox.name = f"{active.name}_bbox{name_suffix}"
-
-        local_mat = Matrix.LocRotScale(center_local, None, size)
-        bbox.matrix_world = active.matrix_world @ local_mat
-
-    else:  # WORLD
-        w_min = Vector((min(v.x for v in all_coords_world), min(v.y for v in all_coords_world), min(v.z for v in all_coords_world)))
-        w_max = Vector((max(v.x for v in all_coords_world), max(v.y for v in all_coords_world), max(v.z for v in all_coords_world)))
-        w_min, w_max = _pad_min_max(w_min, w_max, margin)
-
-        center_world = (w_min + w_max) / 2
-        size_world = w_max - w_min
-
-        bpy.ops.mesh.primitive_cube_add(size=1.0, location=center_world)
-        bbox = context.active_object
-        bbox.name = f"{active.name}_bbox_w{name_suffix}"
-        bbox.dimensions = size_world
-
-    return _apply_bbox_finish(
-        context,
-        bbox,
-        apply_extras,
-        anchor_obj=active,
-        mesh_objects_restore=selected_meshes,
-        restore_active=active,
-        wire_color=wire_color,
+    specs = _cage_specs_for(
+        active, selected_meshes, depsgraph, mode, _margins(margin, False, name_suffix, wire_color)
     )
+    cages = _build_cages(
+        context, specs, apply_extras, restore_meshes=selected_meshes, restore_active=active
+    )
+    return cages[0] if cages else None
 
 
 def create_bbox_for_mesh_object(
@@ -175,85 +234,17 @@ def create_bbox_for_mesh_object(
 ):
     """
     One cage for a single evaluated mesh object. LOCAL = obj's local axes / mesh space bounds;
-    WORLD = world-axis AABB from that object's geometry.
+    WORLD = world-axis AABB from that object's geometry; OBB = minimum-volume oriented box.
     """
     if obj is None or obj.type != "MESH":
         return None
 
     depsgraph = context.evaluated_depsgraph_get()
-    obj_eval = obj.evaluated_get(depsgraph)
-    mesh = obj_eval.to_mesh()
-    if not mesh.vertices:
-        obj_eval.to_mesh_clear()
-        return None
-
-    mw = obj.matrix_world
-    verts_loc = []
-    verts_world = []
-    for rv in mesh.vertices:
-        lc = rv.co.copy()
-        verts_loc.append(lc)
-        verts_world.append(mw @ lc)
-
-    obj_eval.to_mesh_clear()
-
-    if mode == "LOCAL":
-        l_min = Vector(
-            (
-                min(v.x for v in verts_loc),
-                min(v.y for v in verts_loc),
-                min(v.z for v in verts_loc),
-            )
-        )
-        l_max = Vector(
-            (
-                max(v.x for v in verts_loc),
-                max(v.y for v in verts_loc),
-                max(v.z for v in verts_loc),
-            )
-        )
-        l_min, l_max = _pad_min_max(l_min, l_max, margin)
-        center_local = (l_min + l_max) / 2
-        size = l_max - l_min
-
-        bpy.ops.mesh.primitive_cube_add(size=1.0)
-        bbox = context.active_object
-        bbox.name = f"{obj.name}_bbox{name_suffix}"
-        bbox.matrix_world = mw @ Matrix.LocRotScale(center_local, None, size)
-    else:
-        w_min = Vector(
-            (
-                min(v.x for v in verts_world),
-                min(v.y for v in verts_world),
-                min(v.z for v in verts_world),
-            )
-        )
-        w_max = Vector(
-            (
-                max(v.x for v in verts_world),
-                max(v.y for v in verts_world),
-                max(v.z for v in verts_world),
-            )
-        )
-        w_min, w_max = _pad_min_max(w_min, w_max, margin)
-
-        center_world = (w_min + w_max) / 2
-        size_world = w_max - w_min
-
-        bpy.ops.mesh.primitive_cube_add(size=1.0, location=center_world)
-        bbox = context.active_object
-        bbox.name = f"{obj.name}_bbox_w{name_suffix}"
-        bbox.dimensions = size_world
-
-    return _apply_bbox_finish(
-        context,
-        bbox,
-        apply_extras,
-        anchor_obj=obj,
-        mesh_objects_restore=restore_meshes,
-        restore_active=restore_active,
-        wire_color=wire_color,
+    specs = _cage_specs_for(obj, [obj], depsgraph, mode, _margins(margin, False, name_suffix, wire_color))
+    cages = _build_cages(
+        context, specs, apply_extras, restore_meshes=restore_meshes, restore_active=restore_active
     )
+    return cages[0] if cages else None
 
 
 def iter_bbox_helpers_for_selected(
@@ -265,49 +256,11 @@ def iter_bbox_helpers_for_selected(
     dual,
 ):
     """Yield cages for each selected mesh (tight, then optionally padded helper). Names follow per-object naming."""
-    selected_meshes = [o for o in context.selected_objects if o.type == "MESH"]
-    active = context.active_object
-    if not selected_meshes or active is None or active.type != "MESH":
-        return
-
-    eps = 1e-20
-    for mesh_obj in selected_meshes:
-        if dual and abs(pad) > eps:
-            t = create_bbox_for_mesh_object(
-                context,
-                mesh_obj,
-                mode,
-                apply_extras=apply_extras,
-                margin=0.0,
-                name_suffix="",
-                restore_meshes=selected_meshes,
-                restore_active=active,
-            )
-            if t is not None:
-                yield t
-            o = create_bbox_for_mesh_object(
-                context,
-                mesh_obj,
-                mode,
-                apply_extras=apply_extras,
-                margin=pad,
-                name_suffix="_p",
-                wire_color=BBOX_HELPER_COLOR_PADDED,
-                restore_meshes=selected_meshes,
-                restore_active=active,
-            )
-            if o is not None:
-                yield o
-        else:
-            b = create_bbox_for_mesh_object(
-                context,
-                mesh_obj,
-                mode,
-                apply_extras=apply_extras,
-                margin=pad,
-                name_suffix="",
-                restore_meshes=selected_meshes,
-                restore_active=active,
-            )
-            if b is not None:
-                yield b
\ No newline at end of file
+    yield from build_bbox_helpers(
+        context,
+        mode=mode,
+        each_object=True,
+        apply_extras=apply_extras,
+        pad=pad,
+        dual=dual and abs(pad) > 1e-20,
+    )
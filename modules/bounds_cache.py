@@ -0,0 +1,106 @@
+"""Evaluated convex-hull vertices per object, shared by align, distribute, bbox and bounds helpers.
+
+Every consumer only needs min/max projections (world AABB, slabs on arbitrary axes,
+active-relative OBBs), which the hull vertices give exactly; they are reduced once per
+geometry state (see convex_hull), so queries cost O(hull) instead of O(verts).
+
+Objects are keyed by their original pointer (plus name and data pointer). An entry is
+dropped when depsgraph_update_post reports a geometry update for the object or its data
+(objects whose modifiers depend on other IDs are flagged by the depsgraph themselves).
+Transform-only updates keep entries, since they hold local coordinates and callers apply
+the current matrix_world. Callers must evaluate the depsgraph (evaluated_depsgraph_get or
+view_layer.update) before reading, so pending updates reach the handler first.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from . import convex_hull, mesh_arrays
+
+_EMPTY_CO = np.empty((0, 3), dtype=np.float64)
+_EMPTY_CO.flags.writeable = False
+
+# key -> (H, 3) float64 local hull vertices (empty when the object has no geometry)
+_entries: dict[tuple, np.ndarray] = {}
+# Entries kept at most; the oldest are dropped first.
+_MAX_ENTRIES = 4096
+
+
+def invalidate() -> None:
+    """Drop every cached array."""
+    _entries.clear()
+
+
+def _object_key(obj) -> tuple:
+    data = obj.data
+    return (obj.as_pointer(), obj.name, data.as_pointer() if data is not None else 0)
+
+
+def _drop_pointers(pointers: set) -> None:
+    for key in [k for k in _entries if k[0] in pointers or k[2] in pointers]:
+        del _entries[key]
+
+
+def invalidate_object(obj) -> None:
+    _drop_pointers({obj.as_pointer()})
+
+
+def depsgraph_update_handler(scene, depsgraph=None):
+    """Drop entries of objects (or object data) whose evaluated geometry changed."""
+    if depsgraph is None:
+        invalidate()
+        return
+    try:
+        changed = {u.id.original.as_pointer() for u in depsgraph.updates if u.is_updated_geometry}
+    except Exception:
+        invalidate()
+        return
+    if changed and _entries:
+        _drop_pointers(changed)
+
+
+def _read_evaluated(obj, depsgraph) -> np.ndarray:
+    obj_eval = obj.evaluated_get(depsgraph)
+    try:
+        mesh_eval = obj_eval.to_mesh()
+    except RuntimeError:
+        # Objects like EMPTY do not provide geometry data.
+        return _EMPTY_CO
+    try:
+        n = len(mesh_eval.vertices)
+        if n == 0:
+            return _EMPTY_CO
+        coords = np.empty(n * 3, dtype=np.float32)
+        mesh_eval.vertices.foreach_get("co", coords)
+        return coords.reshape(n, 3).astype(np.float64)
+    finally:
+        obj_eval.to_mesh_clear()
+
+
+def evaluated_local_hull(obj, depsgraph) -> np.ndarray:
+    """(H, 3) read-only hull vertices of obj's evaluated geometry in local space; empty without geometry."""
+    key = _object_key(obj)
+    hull = _entries.get(key)
+    if hull is None:
+        coords = _read_evaluated(obj, depsgraph)
+        if coords.shape[0] == 0:
+            hull = coords
+        else:
+            hull = coords[convex_hull.hull_vertices(coords)]
+            hull.flags.writeable = False
+        if len(_entries) >= _MAX_ENTRIES:
+            del _entries[next(iter(_entries))]
+        _entries[key] = hull
+    return hull
+
+
+def evaluated_world_hull(obj, depsgraph) -> np.ndarray:
+    """(H, 3) hull vertices in world space (current evaluated matrix_world; hulls are affine-invariant)."""
+    local = evaluated_local_hull(obj, depsgraph)
+    if local.shape[0] == 0:
+        return local
+    return mesh_arrays.transform_points(obj.evaluated_get(depsgraph).matrix_world, local)
+
+
+def clear() -> None:
+    invalidate()
@@ -0,0 +1,115 @@
+"""Convex-hull vertex reduction of evaluated geometry for arbitrary-axis bounds.
+
+Min/max projections along any direction (and of any affine image of the points) only
+depend on the hull vertices. The extreme points along a fixed set of directions span an
+inner polytope, hulled with bmesh.ops.convex_hull (a few dozen points); every point
+strictly inside its facet planes is dropped in NumPy blocks, and the survivors are hulled
+once more when few enough. Coplanar input uses a 2D hull, collinear input its two ends.
+The result is always a subset of the input with the same convex hull.
+"""
+from __future__ import annotations
+
+import bmesh
+import numpy as np
+
+from .farthest_pair import fibonacci_directions, hull_2d
+
+_N_DIRECTIONS = 64
+_DIRECTIONS = fibonacci_directions(_N_DIRECTIONS)
+# Points × planes evaluated per NumPy block.
+_PROJ_BLOCK = 1 << 20
+# Survivors hulled exactly; larger survivor sets are returned as they are.
+_FINAL_HULL_MAX = 20000
+# Off-plane / off-line distance (relative to the extent) treated as flat.
+_FLAT_RATIO = 1e-9
+
+
+def _bmesh_hull(points: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+    """(hull vertex rows, (F, 3) outward facet normals, (F,) offsets); None when degenerate."""
+    bm = bmesh.new()
+    try:
+        verts = [bm.verts.new(co) for co in points.tolist()]
+        bm.verts.index_update()
+        result = bmesh.ops.convex_hull(bm, input=verts)
+        faces = [ele for ele in result["geom"] if isinstance(ele, bmesh.types.BMFace)]
+        if len(faces) < 4:
+            return None
+        face_rows = [[v.index for v in f.verts] for f in faces]
+    except (RuntimeError, ValueError):
+        return None
+    finally:
+        bm.free()
+
+    rows = np.unique(np.fromiter((i for fr in face_rows for i in fr), dtype=np.int64))
+    inner = points[rows].mean(axis=0)
+    normals = np.empty((len(face_rows), 3), dtype=np.float64)
+    for k, fr in enumerate(face_rows):
+        poly = points[fr]
+        # Newell normal: robust for ngons and slightly non-planar faces.
+        normals[k] = np.cross(poly, np.roll(poly, -1, axis=0)).sum(axis=0)
+    anchors = points[[fr[0] for fr in face_rows]]
+    length = np.linalg.norm(normals, axis=1)
+    ok = length > 0.0
+    normals, anchors = normals[ok] / length[ok, None], anchors[ok]
+    flip = np.einsum("ij,ij->i", normals, inner - anchors) > 0.0
+    normals[flip] *= -1.0
+    offsets = np.einsum("ij,ij->i", normals, anchors)
+    return rows, normals, offsets
+
+
+def _outside(points: np.ndarray, normals: np.ndarray, offsets: np.ndarray, tol: float) -> np.ndarray:
+    """(N,) bool: not strictly inside every facet plane."""
+    keep = np.empty(points.shape[0], dtype=bool)
+    step = max(1, _PROJ_BLOCK // normals.shape[0])
+    for s in range(0, points.shape[0], step):
+        keep[s:s + step] = (points[s:s + step] @ normals.T - offsets).max(axis=1) > -tol
+    return keep
+
+
+def _extreme_rows(points: np.ndarray) -> np.ndarray:
+    step = max(1, _PROJ_BLOCK // _N_DIRECTIONS)
+    support = np.full(_N_DIRECTIONS, -np.inf)
+    extreme = np.zeros(_N_DIRECTIONS, dtype=np.int64)
+    for s in range(0, points.shape[0], step):
+        proj = points[s:s + step] @ _DIRECTIONS.T
+        rows = np.argmax(proj, axis=0)
+        vals = proj[rows, np.arange(_N_DIRECTIONS)]
+        better = vals > support
+        support[better] = vals[better]
+        extreme[better] = rows[better] + s
+    return np.unique(extreme)
+
+
+def hull_vertices(points: np.ndarray) -> np.ndarray:
+    """Sorted row indices of points that keep their convex hull (the hull vertices when resolved)."""
+    points = np.asarray(points, dtype=np.float64)
+    n = points.shape[0]
+    if n <= 4:
+        return np.arange(n)
+
+    centered = points - points.mean(axis=0)
+    _w, axes = np.linalg.eigh(centered.T @ centered)
+    spread = centered @ axes
+    extent = np.abs(spread).max(axis=0)
+    if extent[2] <= 0.0:
+        return np.zeros(1, dtype=np.int64)
+    tol = extent[2] * _FLAT_RATIO
+    if extent[1] <= tol:
+        return np.unique((np.argmin(spread[:, 2]), np.argmax(spread[:, 2])))
+    if extent[0] <= tol:
+        return np.unique(hull_2d(spread[:, 1:]))
+
+    extreme = _extreme_rows(points)
+    inner = _bmesh_hull(points[extreme])
+    if inner is None:
+        cand = np.arange(n)
+    else:
+        _rows, normals, offsets = inner
+        keep = _outside(points, normals, offsets, tol)
+        keep[extreme] = True
+        cand = np.nonzero(keep)[0]
+    if cand.size <= _FINAL_HULL_MAX:
+        hull = _bmesh_hull(points[cand])
+        if hull is not None:
+            return cand[hull[0]]
+    return cand
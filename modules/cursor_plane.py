@@ -8,6 +8,7 @@ with any plane defined by `(origin, u_axis, v_axis)`.
 from __future__ import annotations
 
 import bpy
+import numpy as np
 from mathutils import Vector
 
 Context = bpy.types.Context
@@ -95,4 +96,23 @@ def segment_segment_2d(
     diff = (b0[0] - a0[0], b0[1] - a0[1])
     t = (diff[0] * db[1] - diff[1] * db[0]) / denom
     s = (diff[0] * da[1] - diff[1] * da[0]) / denom
-    return (t, s)
\ No newline at end of file
+    return (t, s)
+
+
+def segment_segment_2d_many(
+    a0: np.ndarray,
+    a1: np.ndarray,
+    b0: np.ndarray,
+    b1: np.ndarray,
+    eps: float = 1e-9,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Batched segment_segment_2d over (N, 2) arrays. Returns (t, s, ok); ok is False where parallel."""
+    da = a1 - a0
+    db = b1 - b0
+    denom = da[:, 0] * db[:, 1] - da[:, 1] * db[:, 0]
+    ok = np.abs(denom) >= eps
+    safe = np.where(ok, denom, 1.0)
+    diff = b0 - a0
+    t = (diff[:, 0] * db[:, 1] - diff[:, 1] * db[:, 0]) / safe
+    s = (diff[:, 0] * da[:, 1] - diff[:, 1] * da[:, 0]) / safe
+    return t, s, ok
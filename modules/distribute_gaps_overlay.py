@@ -7,8 +7,8 @@ import blf
 from bpy_extras.view3d_utils import location_3d_to_region_2d
 from mathutils import Vector
 
-from . import align_tools
-from .drawing_tools import _draw_simple_lines
+from . import align_tools, overlay_buffers
+from .drawing_tools import CachedLineBatch
 from .utils import tag_view3d_redraw_all_windows
 
 _PREVIEW_CORNERS: list[list[Vector]] = []
@@ -35,22 +35,9 @@ _preview_draw_drive_enabled = False
 _OVERLAY_COLOR = (0.15, 0.85, 0.45, 0.55)
 _DIM_COLOR = (0.95, 0.95, 1.0, 0.9)
 _DIM_WIDTH = 1.5
-_CUBE_EDGES = (
-    (0, 1),
-    (1, 2),
-    (2, 3),
-    (3, 0),
-    (4, 5),
-    (5, 6),
-    (6, 7),
-    (7, 4),
-    (0, 4),
-    (1, 5),
-    (2, 6),
-    (3, 7),
-)
-
-
+# GPU batches rebuilt from _PREVIEW_CORNERS / _GAP_LINE_SEGMENTS only when those change.
+_preview_wire_batch = CachedLineBatch()
+_gap_line_batch = CachedLineBatch()
 
 
 def mark_alive() -> None:
@@ -188,14 +175,9 @@ def _rebuild_positions_visual(
     _GAP_LINE_SEGMENTS.clear()
     _GAP_LABELS.clear()
 
-    bpy.context.view_layer.update()
     u = axis_dir.normalized()
 
-    projections: list[tuple[float, object]] = [
-        (align_tools.reference_projection_on_axis(o, u, ref_point), o) for o in objects
-    ]
-    projections.sort(key=lambda x: x[0])
-    s_sorted = [p[0] for p in projections]
+    s_sorted = sorted(align_tools.reference_projections_on_axis(objects, u, ref_point).tolist())
     if len(s_sorted) < 2:
         return
 
@@ -287,17 +269,10 @@ def _rebuild_gap_visual(
     _GAP_LINE_SEGMENTS.clear()
     _GAP_LABELS.clear()
 
-    bpy.context.view_layer.update()
     u = axis_dir.normalized()
 
-    objs_u = objects
-    intervals: list[tuple[float, float]] = []
-    for obj in objs_u:
-        mn, mx = align_tools.bbox_axis_interval_world(obj, u)
-        if mn > mx:
-            mn, mx = mx, mn
-        intervals.append((mn, mx))
-    intervals.sort(key=lambda x: x[0])
+    mns, mxs = align_tools.bbox_axis_intervals_world(objects, u)
+    intervals: list[tuple[float, float]] = sorted(zip(mns.tolist(), mxs.tolist()))
 
     if len(intervals) < 2:
         return
@@ -314,9 +289,9 @@ def _rebuild_gap_visual(
     if ncorner > 0:
         cen /= float(ncorner)
     else:
-        for obj in objs_u:
+        for obj in objects:
             cen += obj.matrix_world.translation
-        cen /= max(len(objs_u), 1)
+        cen /= max(len(objects), 1)
 
     span = 0.05
     for box in corner_boxes:
@@ -353,21 +328,15 @@ def _rebuild_gap_visual(
         _GAP_LABELS.append((_gap_label(context, g), label_anchor))
 
 
+def _sync_batches() -> None:
+    """Repack wire / dimension buffers after the preview geometry changed."""
+    _preview_wire_batch.set(overlay_buffers.box_wire_lines(_PREVIEW_CORNERS))
+    _gap_line_batch.set(overlay_buffers.segment_lines(_GAP_LINE_SEGMENTS))
+
+
 def _draw_preview():
-    lines: list[Vector] = []
-    for corners in _PREVIEW_CORNERS:
-        for i, j in _CUBE_EDGES:
-            lines.append(corners[i])
-            lines.append(corners[j])
-    if lines:
-        _draw_simple_lines(lines, _OVERLAY_COLOR, width=1.25)
-
-    gap_pts: list[Vector] = []
-    for a, b in _GAP_LINE_SEGMENTS:
-        gap_pts.append(a.copy())
-        gap_pts.append(b.copy())
-    if gap_pts:
-        _draw_simple_lines(gap_pts, _DIM_COLOR, width=_DIM_WIDTH)
+    _preview_wire_batch.draw(_OVERLAY_COLOR, width=1.25)
+    _gap_line_batch.draw(_DIM_COLOR, width=_DIM_WIDTH)
 
 
 def _draw_gap_labels_px():
@@ -491,6 +460,7 @@ def set_preview_corner_boxes(
         )
         _ensure_px_handler()
 
+    _sync_batches()
     _ensure_handler()
     _register_depsgraph()
     tag_view3d_redraw_all_windows()
@@ -504,6 +474,8 @@ def clear_preview() -> None:
     _PREVIEW_CORNERS.clear()
     _GAP_LINE_SEGMENTS.clear()
     _GAP_LABELS.clear()
+    _preview_wire_batch.clear()
+    _gap_line_batch.clear()
     _last_alive_monotonic = None
     _last_distribute_execute_mono = None
     _preview_draw_drive_enabled = False
@@ -1,15 +1,131 @@
-"""Screen-space snap acceleration for draw-mesh-edges (KD-tree + rebuild limits)."""
+"""Snap acceleration for draw-mesh-edges (screen KD-tree or world index + rebuild limits).
+
+Rebuilds project all candidates in one NumPy pass (see mesh_arrays) and keep hits as
+parallel arrays; a SnapHit is only created for the candidate that wins a query.
+
+Index modes (addon preference draw_mesh_snap_index_mode):
+  SCREEN — 2D KD-tree of projected candidates; rebuilt on every view change.
+  WORLD  — world-space point index (snap_point_index) queried with the mouse pick cone;
+           built once per mesh / scene state, so navigation costs no rebuild.
+Both rank candidates by the same screen distance.
+
+ensure_obj / ensure_world(background=True) read arrays on the calling (main) thread and,
+in WORLD mode, build the point index on a worker thread (NumPy sorts and reductions,
+which release the GIL); until poll_warmup() installs it, queries scan the arrays brute
+force. The SCREEN KD-tree is always built on the calling thread: KDTree.insert runs one
+Python call per point and would hold the GIL on the worker as well.
+
+World-snap arrays are read per evaluated datablock and kept across refreshes;
+depsgraph_update_handler records which IDs changed geometry or transform, and
+ensure_world drops the arrays of changed sources (and re-collects instance matrices)
+before the next query.
+
+ensure_intersections adds edge–edge crossings in the cursor-plane frame (edge_intersections);
+they are view-independent, kept in a world index and updated in place by append_obj /
+remove_obj.
+"""
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+
+import numpy as np
 from mathutils import Vector
 from mathutils.kdtree import KDTree
 from bpy_extras.view3d_utils import location_3d_to_region_2d
 
+from . import mesh_arrays
+from .edge_intersections import EdgeCrossings
+from .snap_point_index import PickCone, WorldPointIndex, screen_rank
+
 # Defaults when addon preferences are unavailable.
 _DEFAULT_OBJ_SNAP_KDTREE_MIN = 256
 _DEFAULT_WORLD_SNAP_MAX_VERTS_PER_OBJECT = 12_000
 _DEFAULT_WORLD_SNAP_MAX_VERTS_TOTAL = 40_000
+_DEFAULT_SNAP_INDEX_MODE = 'WORLD'
+
+SNAP_INDEX_SCREEN = 'SCREEN'
+SNAP_INDEX_WORLD = 'WORLD'
+
+_EMPTY_XYZ = np.empty((0, 3), dtype=np.float64)
+_EMPTY_IDX = np.empty(0, dtype=np.int64)
+
+# Incremental edits (overflow rows + tombstones) are merged by a full rebuild once they
+# exceed max(_MERGE_MIN_PENDING, indexed rows / _MERGE_FRACTION).
+_MERGE_MIN_PENDING = 256
+_MERGE_FRACTION = 8
+
+
+# Original ID pointer -> _update_revision of its last geometry / transform update.
+_id_revisions: dict[int, int] = {}
+_update_revision = 0
+# Revision at which _id_revisions was last emptied; older readers must drop everything.
+_reset_revision = 0
+# IDs tracked at most before the table is emptied.
+_MAX_TRACKED_IDS = 4096
+
+_warmup_executor: ThreadPoolExecutor | None = None
+
+
+def _warmup_submit(fn, *args) -> Future:
+    """Run fn(*args) on the shared snap warm-up thread (NumPy work only, no bpy)."""
+    global _warmup_executor
+    if _warmup_executor is None:
+        _warmup_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="alec_snap_warmup")
+    return _warmup_executor.submit(fn, *args)
+
+
+def shutdown_warmup() -> None:
+    global _warmup_executor
+    if _warmup_executor is not None:
+        _warmup_executor.shutdown(wait=False, cancel_futures=True)
+        _warmup_executor = None
+
+
+def reset_updates() -> None:
+    """Forget tracked updates; every world-snap reader re-reads its arrays (file load)."""
+    global _update_revision, _reset_revision
+    _update_revision += 1
+    _reset_revision = _update_revision
+    _id_revisions.clear()
+
+
+def depsgraph_update_handler(scene, depsgraph=None):
+    """Record IDs whose evaluated geometry or transform changed (see ids_updated_since)."""
+    global _update_revision
+    if depsgraph is None:
+        reset_updates()
+        return
+    try:
+        changed = [
+            u.id.original.as_pointer()
+            for u in depsgraph.updates
+            if u.is_updated_geometry or u.is_updated_transform
+        ]
+    except Exception:
+        reset_updates()
+        return
+    if not changed:
+        return
+    if len(_id_revisions) + len(changed) > _MAX_TRACKED_IDS:
+        reset_updates()
+        return
+    _update_revision += 1
+    for ptr in changed:
+        _id_revisions[ptr] = _update_revision
+
+
+def update_revision() -> int:
+    return _update_revision
+
+
+def ids_updated_since(revision: int) -> set[int] | None:
+    """Pointers updated after revision; None when the table was reset since (assume all)."""
+    if revision < _reset_revision:
+        return None
+    if revision >= _update_revision:
+        return set()
+    return {ptr for ptr, rev in _id_revisions.items() if rev > revision}
 
 
 def _snap_prefs():
@@ -42,6 +158,15 @@ def world_snap_max_verts_total() -> int:
     return _DEFAULT_WORLD_SNAP_MAX_VERTS_TOTAL
 
 
+def snap_index_mode() -> str:
+    p = _snap_prefs()
+    if p is not None:
+        mode = str(getattr(p, "draw_mesh_snap_index_mode", _DEFAULT_SNAP_INDEX_MODE))
+        if mode in {SNAP_INDEX_SCREEN, SNAP_INDEX_WORLD}:
+            return mode
+    return _DEFAULT_SNAP_INDEX_MODE
+
+
 @dataclass(frozen=True)
 class SnapHit:
     world: Vector
@@ -53,17 +178,7 @@ class SnapHit:
 SNAP_IDX_EDGE_MID = -2
 SNAP_IDX_WORLD_VERT = -3
 SNAP_IDX_EDGE_PERP = -4
-
-
-def _view_cache_key(region, rv3d) -> tuple:
-    if region is None or rv3d is None:
-        return ()
-    try:
-        vm = tuple(rv3d.view_matrix[i][j] for i in range(4) for j in range(4))
-        pm = tuple(rv3d.perspective_matrix[i][j] for i in range(4) for j in range(4))
-        return (id(region), vm, pm, region.width, region.height)
-    except Exception:
-        return (id(region),)
+SNAP_IDX_EDGE_ISECT = -5
 
 
 def _project(region, rv3d, world_co: Vector):
@@ -117,6 +232,14 @@ def pick_closer_snap_hit(
     return a if da <= db else b
 
 
+def obj_edge_ends_world(bm, matrix_world) -> tuple[np.ndarray, np.ndarray]:
+    """(E, 3) world positions of the first and second vertex of every bm edge."""
+    bm.verts.index_update()
+    world_v = mesh_arrays.transform_points(matrix_world, mesh_arrays.bmesh_vert_coords(bm))
+    ev = mesh_arrays.bmesh_edge_vert_indices(bm)
+    return world_v[ev[:, 0]], world_v[ev[:, 1]]
+
+
 def best_obj_perpendicular_snap(
     bm,
     matrix_world,
@@ -126,35 +249,54 @@ def best_obj_perpendicular_snap(
     radius_px: float,
     prev_world: Vector,
     occludes_fn,
-    occlusion_t: float | None,
-    origin_w: Vector,
-    dir_w: Vector,
-    context,
+    *,
+    edge_ends: tuple[np.ndarray, np.ndarray] | None = None,
+    occluded_mask_fn=None,
 ) -> SnapHit | None:
-    """Screen-closest perpendicular foot on any mesh edge (from prev_world onto edge line)."""
-    radius_sq = radius_px * radius_px
-    best_d2 = radius_sq
-    best: SnapHit | None = None
-    mw = matrix_world
+    """Screen-closest perpendicular foot on any mesh edge (from prev_world onto edge line).
 
-    for e in bm.edges:
-        try:
-            v0w = mw @ e.verts[0].co
-            v1w = mw @ e.verts[1].co
-        except Exception:
-            continue
-        foot = edge_line_perpendicular_foot(prev_world, v0w, v1w)
-        if foot is None:
-            continue
-        if occludes_fn(occlusion_t, origin_w, dir_w, foot, context):
-            continue
-        d2 = screen_dist_sq(region, rv3d, coord, foot)
-        if d2 is None or d2 >= best_d2:
-            continue
-        best_d2 = d2
-        best = SnapHit(foot, SNAP_IDX_EDGE_PERP, None)
+    Feet and screen positions are computed for all edges at once. Visibility is tested
+    only for in-radius candidates: in one batch via occluded_mask_fn((N, 3) world) when
+    given, else by occludes_fn(world_co) per candidate, nearest first.
+    edge_ends: cached obj_edge_ends_world arrays (else read from bm).
+    """
+    if edge_ends is None:
+        edge_ends = obj_edge_ends_world(bm, matrix_world)
+    a, b = edge_ends
+    if a.shape[0] == 0:
+        return None
+    d = b - a
+    ll = np.einsum("ij,ij->i", d, d)
+    valid = ll >= 1e-20
+    a = a[valid]
+    d = d[valid]
+    t = np.einsum("ij,ij->i", np.asarray(prev_world, dtype=np.float64) - a, d) / ll[valid]
+    feet = a + d * t[:, None]
+
+    screen, ok = mesh_arrays.project_points_to_region(region, rv3d, feet)
+    delta = screen[ok] - (float(coord[0]), float(coord[1]))
+    d2 = np.einsum("ij,ij->i", delta, delta)
+    rows = np.nonzero(ok)[0]
+    inside = d2 < radius_px * radius_px
+    rows = rows[inside]
+    d2 = d2[inside]
 
-    return best
+    if occluded_mask_fn is not None:
+        if rows.size:
+            visible = ~occluded_mask_fn(feet[rows])
+            rows = rows[visible]
+            d2 = d2[visible]
+        if rows.size == 0:
+            return None
+        best = int(rows[int(np.argmin(d2))])
+        return SnapHit(Vector(feet[best].tolist()), SNAP_IDX_EDGE_PERP, None)
+
+    for i in np.argsort(d2, kind="stable").tolist():
+        foot = Vector(feet[rows[i]].tolist())
+        if occludes_fn(foot):
+            continue
+        return SnapHit(foot, SNAP_IDX_EDGE_PERP, None)
+    return None
 
 
 def _occlusion_test_co(hit: SnapHit) -> Vector:
@@ -169,102 +311,580 @@ def world_snap_cache_key(context) -> tuple:
     cur = context.scene.cursor
     loc = tuple(round(c, 5) for c in cur.location)
     try:
-        rot = tuple(round(cur.rotation_euler[i], 5) for i in range(3))
+        # Full matrix so quaternion / axis-angle cursor rotation modes also invalidate.
+        rot = tuple(round(v, 5) for row in cur.matrix.to_3x3() for v in row)
     except Exception:
         rot = ()
     return (loc, rot, tuple(context.scene.objects.keys()))
 
 
-def _build_kdtree(screen_pts: list[tuple[float, float]]) -> KDTree | None:
+def _build_point_indexes(coords: dict[tuple, np.ndarray]) -> dict[tuple, WorldPointIndex]:
+    return {key: WorldPointIndex(co) for key, co in coords.items()}
+
+
+def _build_kdtree(screen_xy: np.ndarray) -> KDTree | None:
     """Blender KDTree requires capacity = insert count (set at construction)."""
-    n = len(screen_pts)
+    n = int(screen_xy.shape[0])
     if n == 0:
         return None
     tree = KDTree(n)
-    for i, (sx, sy) in enumerate(screen_pts):
-        tree.insert((sx, sy, 0.0), i)
+    insert = tree.insert
+    for i, (sx, sy) in enumerate(screen_xy.tolist()):
+        insert((sx, sy, 0.0), i)
     tree.balance()
     return tree
 
 
+class _SnapPoints:
+    """Snap candidates as parallel arrays (row i ↔ KD-tree / world index row i).
+
+    world: (N, 3) snap positions; snap_idx: (N,) vertex index or SNAP_IDX_* sentinel;
+    raw: (N, 3) pre-projection positions for world snap on the cursor plane, else None.
+    Screen distance is measured at raw when present (where the vertex appears on screen).
+
+    Incremental edits do not touch the index: appended candidates go to an overflow
+    buffer that is scanned brute force (rows N.. in hit()), removed rows are tombstoned.
+    """
+
+    __slots__ = ("tree", "index", "world", "snap_idx", "raw", "removed", "extra_world", "extra_idx")
+
+    def __init__(self) -> None:
+        self.tree: KDTree | None = None
+        self.index: WorldPointIndex | None = None
+        self.world = _EMPTY_XYZ
+        self.snap_idx = _EMPTY_IDX
+        self.raw: np.ndarray | None = None
+        self._reset_overflow()
+
+    def _reset_overflow(self) -> None:
+        self.removed: np.ndarray | None = None
+        self.extra_world = _EMPTY_XYZ
+        self.extra_idx = _EMPTY_IDX
+
+    def clear(self) -> None:
+        self.tree = None
+        self.index = None
+        self.world = _EMPTY_XYZ
+        self.snap_idx = _EMPTY_IDX
+        self.raw = None
+        self._reset_overflow()
+
+    def assign(self, world: np.ndarray, snap_idx: np.ndarray, raw: np.ndarray | None, screen_xy: np.ndarray) -> None:
+        """SCREEN mode: rows already culled to the view; screen_xy feeds the KD-tree."""
+        self.world = world
+        self.snap_idx = snap_idx
+        self.raw = raw
+        self.tree = _build_kdtree(screen_xy)
+        self.index = None
+        self._reset_overflow()
+
+    def assign_unindexed(self, world: np.ndarray, snap_idx: np.ndarray, raw: np.ndarray | None) -> None:
+        """Rows whose index is still being built; queries scan them brute force meanwhile."""
+        self.world = world
+        self.snap_idx = snap_idx
+        self.raw = raw
+        self.tree = None
+        self.index = None
+        self._reset_overflow()
+
+    def install(self, built) -> None:
+        """Attach a background-built WorldPointIndex to the current rows."""
+        self.index = built
+
+    def assign_world_index(self, world: np.ndarray, snap_idx: np.ndarray, raw: np.ndarray | None) -> None:
+        """WORLD mode: all rows kept; the index covers the screen-test positions."""
+        self.world = world
+        self.snap_idx = snap_idx
+        self.raw = raw
+        self.tree = None
+        self.index = WorldPointIndex(world if raw is None else raw)
+        self._reset_overflow()
+
+    def __len__(self) -> int:
+        return int(self.world.shape[0])
+
+    @property
+    def pending(self) -> int:
+        """Overflow rows plus tombstones not yet merged into the index."""
+        n_removed = 0 if self.removed is None else int(self.removed.sum())
+        return int(self.extra_world.shape[0]) + n_removed
+
+    def needs_merge(self) -> bool:
+        return self.pending > max(_MERGE_MIN_PENDING, len(self) // _MERGE_FRACTION)
+
+    def append(self, world: np.ndarray, snap_idx: np.ndarray) -> None:
+        """Add candidates (no raw positions) without rebuilding the index."""
+        self.extra_world = np.concatenate((self.extra_world, world))
+        self.extra_idx = np.concatenate((self.extra_idx, snap_idx))
+
+    def remove(self, snap_idx: int, world_co: np.ndarray | None = None) -> bool:
+        """Drop one candidate by vertex index (or sentinel + position); False if not found."""
+        for arr_world, arr_idx, is_extra in (
+            (self.extra_world, self.extra_idx, True),
+            (self.world, self.snap_idx, False),
+        ):
+            match = arr_idx == snap_idx
+            if world_co is not None:
+                match &= np.all(np.abs(arr_world - world_co) <= 1e-6 * (1.0 + np.abs(world_co)), axis=1)
+            if not is_extra and self.removed is not None:
+                match &= ~self.removed
+            rows = np.nonzero(match)[0]
+            if rows.size == 0:
+                continue
+            if is_extra:
+                keep = np.ones(arr_idx.shape[0], dtype=bool)
+                keep[rows[-1]] = False
+                self.extra_world = self.extra_world[keep]
+                self.extra_idx = self.extra_idx[keep]
+            else:
+                if self.removed is None:
+                    self.removed = np.zeros(len(self), dtype=bool)
+                self.removed[rows[-1]] = True
+            return True
+        return False
+
+    def live_rows(self) -> tuple[np.ndarray, np.ndarray]:
+        """(world, snap_idx) of indexed rows that were not removed plus the overflow (raw dropped)."""
+        world, snap_idx = self.world, self.snap_idx
+        if self.removed is not None:
+            world, snap_idx = world[~self.removed], snap_idx[~self.removed]
+        return np.concatenate((world, self.extra_world)), np.concatenate((snap_idx, self.extra_idx))
+
+    def hit(self, row: int) -> SnapHit:
+        n = len(self)
+        if row >= n:
+            return SnapHit(Vector(self.extra_world[row - n].tolist()), int(self.extra_idx[row - n]), None)
+        raw = None if self.raw is None else Vector(self.raw[row].tolist())
+        return SnapHit(Vector(self.world[row].tolist()), int(self.snap_idx[row]), raw)
+
+    def _indexed_candidates(self, region, rv3d, coord, radius_px: float):
+        if self.index is not None:
+            rows, d2 = self.index.query(region, rv3d, coord, radius_px)
+            return zip(rows.tolist(), d2.tolist())
+        if self.tree is not None:
+            found = self.tree.find_range((float(coord[0]), float(coord[1]), 0.0), radius_px)
+            found.sort(key=lambda r: r[2])
+            return ((row, dist * dist) for _co, row, dist in found)
+        if len(self) == 0:
+            return ()
+        rows, d2 = screen_rank(self.world if self.raw is None else self.raw, None, region, rv3d, coord, radius_px)
+        return zip(rows.tolist(), d2.tolist())
+
+    def _ranked_candidates(self, region, rv3d, coord, radius_px: float):
+        """(row, d²) pairs within radius_px on screen, nearest first."""
+        ranked = self._indexed_candidates(region, rv3d, coord, radius_px)
+        if self.removed is None and self.extra_world.shape[0] == 0:
+            return ranked
+        removed = self.removed
+        pairs = [(row, d2) for row, d2 in ranked if removed is None or not removed[row]]
+        if self.extra_world.shape[0]:
+            rows, d2 = screen_rank(self.extra_world, None, region, rv3d, coord, radius_px)
+            pairs.extend(zip((rows + len(self)).tolist(), d2.tolist()))
+            pairs.sort(key=lambda p: p[1])
+        return pairs
+
+    def nearest_unoccluded(
+        self,
+        region,
+        rv3d,
+        coord,
+        radius_px: float,
+        best_d2: float,
+        occluded,
+    ) -> tuple[float, SnapHit] | None:
+        """Closest candidate with d² < best_d2 that survives occluded(hit)."""
+        for row, d2 in self._ranked_candidates(region, rv3d, coord, radius_px):
+            if d2 >= best_d2:
+                break
+            hit = self.hit(row)
+            if occluded(hit):
+                continue
+            return d2, hit
+        return None
+
+
+def _screen_filter(region, rv3d, world_xyz: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Project world points; returns (screen_xy of visible rows, bool mask of visible rows)."""
+    screen, ok = mesh_arrays.project_points_to_region(region, rv3d, world_xyz)
+    return screen[ok], ok
+
+
+def iter_world_mesh_instances(context, depsgraph, draw_obj):
+    """Yield (ordinal, obj_inst, obj_eval, eval_mesh) for visible evaluated mesh instances.
+
+    ordinal is the position in depsgraph.object_instances (stable for one depsgraph state).
+    """
+    vl = getattr(context, 'view_layer', None)
+    for ordinal, obj_inst in enumerate(depsgraph.object_instances):
+        obj_eval = obj_inst.object
+        if obj_eval is None or obj_eval.type != 'MESH':
+            continue
+        try:
+            obj_orig = obj_eval.original
+        except Exception:
+            obj_orig = obj_eval
+        if obj_orig is draw_obj:
+            continue
+        try:
+            if vl is None:
+                vis_ok = obj_orig.visible_get()
+            else:
+                try:
+                    vis_ok = obj_orig.visible_get(view_layer=vl)
+                except TypeError:
+                    vis_ok = obj_orig.visible_get()
+            if not vis_ok:
+                continue
+        except Exception:
+            pass
+        try:
+            eval_mesh = obj_eval.data
+        except Exception:
+            continue
+        if eval_mesh is None:
+            continue
+        yield ordinal, obj_inst, obj_eval, eval_mesh
+
+
+def instance_sources(obj_inst, obj_eval) -> set[int]:
+    """Original ID pointers whose updates can change this instance's matrix or geometry."""
+    sources: set[int] = set()
+    try:
+        obj_orig = obj_eval.original
+        sources.add(obj_orig.as_pointer())
+        if obj_orig.data is not None:
+            sources.add(obj_orig.data.as_pointer())
+    except Exception:
+        pass
+    try:
+        if obj_inst.is_instance and obj_inst.parent is not None:
+            sources.add(obj_inst.parent.original.as_pointer())
+    except Exception:
+        pass
+    return sources
+
+
+def mesh_data_key(eval_mesh) -> tuple | None:
+    """Evaluated mesh datablock identity: instances of one mesh share this key."""
+    try:
+        return (eval_mesh.as_pointer(), len(eval_mesh.vertices))
+    except Exception:
+        return None
+
+
+class _WorldInstances:
+    """World-snap instances (matrix + evaluated bounds) over per-datablock local arrays.
+
+    Local vertex arrays, and in WORLD mode their point indexes, are keyed by the evaluated
+    mesh data pointer so instanced geometry shares one copy. Arrays are read only for
+    instances whose bounds can reach the screen (view frustum widened by the snap radius).
+    Arrays are dropped when one of their sources (see instance_sources) is updated.
+    """
+
+    def __init__(self) -> None:
+        self.coords: dict[tuple, np.ndarray] = {}
+        self.indexes: dict[tuple, WorldPointIndex] = {}
+        # Datablocks whose index is being built in the background (queried brute force).
+        self.pending: set[tuple] = set()
+        # Datablock key -> original ID pointers of the instances using it.
+        self.sources: dict[tuple, set[int]] = {}
+        self.clear()
+
+    def clear(self) -> None:
+        self.ordinals: list[int] = []
+        self.data_keys: list[tuple] = []
+        self.matrices = np.empty((0, 4, 4), dtype=np.float64)
+        self.corners = np.empty((0, 8, 3), dtype=np.float64)
+        self.centers = _EMPTY_XYZ
+        self.radii = np.empty(0, dtype=np.float64)
+        self.visible = np.zeros(0, dtype=bool)
+        self.plane: tuple[np.ndarray, np.ndarray] | None = None
+
+    def clear_data(self) -> None:
+        self.coords.clear()
+        self.indexes.clear()
+        self.pending.clear()
+        self.sources.clear()
+
+    def _drop_key(self, key: tuple) -> None:
+        self.coords.pop(key, None)
+        self.indexes.pop(key, None)
+        self.pending.discard(key)
+
+    def drop_updated(self, changed: set[int]) -> None:
+        """Drop arrays of datablocks with a source in changed (ID pointers)."""
+        for key in [k for k, src in self.sources.items() if not src.isdisjoint(changed)]:
+            self._drop_key(key)
+
+    def collect(self, context, depsgraph, draw_obj) -> None:
+        """One pass over depsgraph instances: matrices and world bound-box corners only."""
+        self.clear()
+        old_keys = set(self.sources)
+        self.sources = {}
+        if depsgraph is None:
+            self.clear_data()
+            return
+        mats: list[np.ndarray] = []
+        corners: list[np.ndarray] = []
+        for ordinal, obj_inst, obj_eval, eval_mesh in iter_world_mesh_instances(context, depsgraph, draw_obj):
+            key = mesh_data_key(eval_mesh)
+            if key is None or key[1] == 0:
+                continue
+            try:
+                bb = np.array([tuple(c) for c in obj_eval.bound_box], dtype=np.float64)
+            except Exception:
+                continue
+            mw = mesh_arrays.matrix_np(obj_inst.matrix_world)
+            self.ordinals.append(ordinal)
+            self.data_keys.append(key)
+            self.sources.setdefault(key, set()).update(instance_sources(obj_inst, obj_eval))
+            mats.append(mw)
+            corners.append(mesh_arrays.transform_points(mw, bb))
+        # Datablocks no longer instanced (their pointer may be reused by a new mesh).
+        for key in old_keys | set(self.coords):
+            if key not in self.sources:
+                self._drop_key(key)
+        if not mats:
+            return
+        self.matrices = np.stack(mats)
+        self.corners = np.stack(corners)
+        self.centers = self.corners.mean(axis=1)
+        self.radii = np.linalg.norm(self.corners - self.centers[:, None, :], axis=2).max(axis=1)
+        self.visible = np.zeros(len(mats), dtype=bool)
+
+    def unindexed_visible(self) -> dict[tuple, np.ndarray]:
+        """Local arrays of visible datablocks that have no index and no pending build."""
+        out: dict[tuple, np.ndarray] = {}
+        for i in np.nonzero(self.visible)[0].tolist():
+            key = self.data_keys[i]
+            co = self.coords.get(key)
+            if co is not None and key not in self.indexes and key not in self.pending:
+                out[key] = co
+        return out
+
+    def load_visible(self, context, depsgraph, draw_obj, region, rv3d, margin_px: float) -> None:
+        """Cull instances by bounds vs. view; read vertex arrays of newly visible datablocks."""
+        self.visible = mesh_arrays.boxes_in_view(region, rv3d, self.corners, margin_px)
+        missing: dict[int, tuple] = {}
+        for i in np.nonzero(self.visible)[0].tolist():
+            key = self.data_keys[i]
+            if key not in self.coords:
+                missing[self.ordinals[i]] = key
+        if not missing or depsgraph is None:
+            return
+        for ordinal, _obj_inst, _obj_eval, eval_mesh in iter_world_mesh_instances(context, depsgraph, draw_obj):
+            key = missing.pop(ordinal, None)
+            if key is not None and key not in self.coords and mesh_data_key(eval_mesh) == key:
+                self.coords[key] = mesh_arrays.mesh_vert_coords(eval_mesh)
+            if not missing:
+                break
+
+    def _index(self, key: tuple) -> WorldPointIndex | None:
+        index = self.indexes.get(key)
+        if index is None:
+            co = self.coords.get(key)
+            if co is None or key in self.pending:
+                return None
+            index = WorldPointIndex(co)
+            self.indexes[key] = index
+        return index
+
+    def hit(self, inst: int, row: int) -> SnapHit:
+        raw = mesh_arrays.transform_points(self.matrices[inst], self.coords[self.data_keys[inst]][row:row + 1])
+        if self.plane is None:
+            return SnapHit(Vector(raw[0].tolist()), SNAP_IDX_WORLD_VERT, None)
+        world = mesh_arrays.project_points_onto_plane(raw, *self.plane)
+        return SnapHit(Vector(world[0].tolist()), SNAP_IDX_WORLD_VERT, Vector(raw[0].tolist()))
+
+    def nearest_unoccluded(
+        self,
+        region,
+        rv3d,
+        coord,
+        radius_px: float,
+        best_d2: float,
+        occluded,
+    ) -> tuple[float, SnapHit] | None:
+        """WORLD mode query: pick cone vs. instance bounds, then per-datablock index lookups."""
+        if not self.data_keys:
+            return None
+        cone = PickCone(region, rv3d, coord, radius_px)
+        touched = self.visible & cone.touches_spheres(self.centers, self.radii)
+        ranked: list[tuple[float, int, int]] = []
+        for i in np.nonzero(touched)[0].tolist():
+            key = self.data_keys[i]
+            index = self._index(key)
+            if index is not None:
+                rows, d2 = index.query(region, rv3d, coord, radius_px, matrix=self.matrices[i], cone=cone)
+            elif key in self.pending:
+                rows, d2 = screen_rank(self.coords[key], None, region, rv3d, coord, radius_px, matrix=self.matrices[i])
+            else:
+                continue
+            ranked.extend((d, i, r) for d, r in zip(d2.tolist(), rows.tolist()))
+        ranked.sort()
+        for d2, i, row in ranked:
+            if d2 >= best_d2:
+                break
+            hit = self.hit(i, row)
+            if occluded(hit):
+                continue
+            return d2, hit
+        return None
+
+
 class DrawMeshSnapCache:
-    """2D KD-trees for object / world snap; invalidated on view or mesh topology change."""
+    """Object / world snap candidates; SCREEN mode also rebuilds on view change (see module doc)."""
 
     def __init__(self) -> None:
-        self._obj_tree: KDTree | None = None
-        self._obj_hits: list[SnapHit] = []
+        self._obj = _SnapPoints()
         self._obj_key: tuple = ()
-        self._world_tree: KDTree | None = None
-        self._world_hits: list[SnapHit] = []
+        self._world = _SnapPoints()
         self._world_key: tuple = ()
         self._world_truncated: bool = False
+        self._world_inst = _WorldInstances()
+        self._world_inst_key: tuple = ()
+        self._world_vis_key: tuple = ()
+        self._world_mode: str = SNAP_INDEX_SCREEN
+        # update_revision() when the world instances were last checked against updates.
+        self._world_revision: int = update_revision()
+        self._edge_ends: tuple[np.ndarray, np.ndarray] | None = None
+        self._edge_ends_key: tuple = ()
+        self._isect = _SnapPoints()
+        self._isect_key: tuple = ()
+        self._crossings: EdgeCrossings | None = None
+        # (install(result or None), future) for background index builds.
+        self._jobs: list[tuple] = []
 
     @property
     def world_snap_truncated(self) -> bool:
         return self._world_truncated
 
+    @property
+    def intersections_truncated(self) -> bool:
+        """Edge crossings hit the pair cap (see EdgeCrossings.truncated); some are missing."""
+        return self._crossings is not None and self._crossings.truncated
+
+    @property
+    def is_warming(self) -> bool:
+        return bool(self._jobs)
+
+    def poll_warmup(self) -> bool:
+        """Install finished background builds; True when none is pending."""
+        if not self._jobs:
+            return True
+        pending = []
+        for install, future in self._jobs:
+            if not future.done():
+                pending.append((install, future))
+                continue
+            try:
+                built = future.result()
+            except Exception:
+                built = None
+            install(built)
+        self._jobs = pending
+        return not pending
+
+    def _cancel_jobs(self) -> None:
+        for _install, future in self._jobs:
+            future.cancel()
+        self._jobs = []
+
+    def _build_obj_in_background(self, rows: np.ndarray, fn, arg) -> None:
+        def install(built) -> None:
+            # Rows may have been replaced by a newer rebuild meanwhile.
+            if built is not None and self._obj.world is rows:
+                self._obj.install(built)
+
+        self._jobs.append((install, _warmup_submit(fn, arg)))
+
+    def _clear_intersections(self) -> None:
+        self._isect.clear()
+        self._isect_key = ()
+        self._crossings = None
+
     def invalidate_all(self) -> None:
-        self._obj_tree = None
-        self._obj_hits.clear()
+        self._cancel_jobs()
+        self._obj.clear()
         self._obj_key = ()
-        self._world_tree = None
-        self._world_hits.clear()
+        self._edge_ends = None
+        self._edge_ends_key = ()
+        self._clear_intersections()
+        self._world.clear()
         self._world_key = ()
         self._world_truncated = False
+        self._world_inst.clear()
+        self._world_inst.clear_data()
+        self._world_inst_key = ()
+        self._world_vis_key = ()
 
     def invalidate_mesh(self) -> None:
-        self._obj_tree = None
-        self._obj_hits.clear()
+        self._obj.clear()
         self._obj_key = ()
+        self._edge_ends = None
+        self._edge_ends_key = ()
+        self._clear_intersections()
 
     def invalidate_world(self) -> None:
-        self._world_tree = None
-        self._world_hits.clear()
+        self._world.clear()
         self._world_key = ()
+        self._world_inst.clear()
+        self._world_inst.clear_data()
+        self._world_inst_key = ()
+        self._world_vis_key = ()
 
     def find_best(
         self,
+        region,
+        rv3d,
         coord,
         radius_px: float,
-        occlusion_t: float | None,
-        origin_w: Vector,
-        dir_w: Vector,
-        context,
         occludes_fn,
         *,
         use_obj: bool,
         use_world: bool,
+        use_isect: bool = False,
     ) -> SnapHit | None:
-        radius_sq = radius_px * radius_px
-        mx, my = float(coord[0]), float(coord[1])
-        center = (mx, my, 0.0)
-        best_d2 = radius_sq
+        best_d2 = radius_px * radius_px
         best: SnapHit | None = None
 
-        if use_obj and self._obj_tree is not None:
-            for _co, idx, dist in self._obj_tree.find_range(center, radius_px):
-                d2 = dist * dist
-                if d2 >= best_d2:
-                    continue
-                hit = self._obj_hits[idx]
-                if occludes_fn(occlusion_t, origin_w, dir_w, _occlusion_test_co(hit), context):
-                    continue
-                best_d2 = d2
-                best = hit
-
-        if use_world and self._world_tree is not None:
-            for _co, idx, dist in self._world_tree.find_range(center, radius_px):
-                d2 = dist * dist
-                if d2 >= best_d2:
-                    continue
-                hit = self._world_hits[idx]
-                if occludes_fn(occlusion_t, origin_w, dir_w, _occlusion_test_co(hit), context):
-                    continue
-                best_d2 = d2
-                best = hit
+        def occluded(hit: SnapHit) -> bool:
+            return occludes_fn(_occlusion_test_co(hit))
+
+        world = self._world_inst if self._world_mode == SNAP_INDEX_WORLD else self._world
+        for use, points in ((use_obj, self._obj), (use_world, world), (use_isect, self._isect)):
+            if not use:
+                continue
+            found = points.nearest_unoccluded(region, rv3d, coord, radius_px, best_d2, occluded)
+            if found is not None:
+                best_d2, best = found
 
         return best
 
+    def band_intersection_snap(
+        self,
+        region,
+        rv3d,
+        coord,
+        radius_px: float,
+        band_start: Vector,
+        band_end: Vector,
+        occludes_fn,
+    ) -> SnapHit | None:
+        """Nearest point where the rubber band band_start–band_end crosses an existing edge."""
+        if self._crossings is None:
+            return None
+        pts = self._crossings.band_crossings(band_start, band_end)
+        if pts.shape[0] == 0:
+            return None
+        rows, _d2 = screen_rank(pts, None, region, rv3d, coord, radius_px)
+        for row in rows.tolist():
+            co = Vector(pts[row].tolist())
+            if occludes_fn(co):
+                continue
+            return SnapHit(co, SNAP_IDX_EDGE_ISECT, None)
+        return None
+
     def ensure_obj(
         self,
         bm,
@@ -275,37 +895,199 @@ class DrawMeshSnapCache:
         *,
         include_verts: bool,
         include_edge_mids: bool,
+        background: bool = False,
     ) -> None:
-        view_key = _view_cache_key(region, rv3d)
-        key = (view_key, mesh_key, include_verts, include_edge_mids)
-        if self._obj_tree is not None and key == self._obj_key:
+        """Object snap candidates for bm; background=True builds a WORLD index on the warm-up thread."""
+        self.poll_warmup()
+        mode = snap_index_mode()
+        view_key = mesh_arrays.view_cache_key(region, rv3d) if mode == SNAP_INDEX_SCREEN else ()
+        key = (mode, view_key, mesh_key, include_verts, include_edge_mids)
+        if key == self._obj_key and not self._obj.needs_merge():
             return
 
-        hits: list[SnapHit] = []
-        screen_pts: list[tuple[float, float]] = []
-        mw = matrix_world
+        bm.verts.index_update()
+        world_v = mesh_arrays.transform_points(matrix_world, mesh_arrays.bmesh_vert_coords(bm))
+        parts_world: list[np.ndarray] = []
+        parts_idx: list[np.ndarray] = []
 
         if include_verts:
-            for v in bm.verts:
-                p2 = _project(region, rv3d, mw @ v.co)
-                if p2 is None:
-                    continue
-                hits.append(SnapHit(mw @ v.co, v.index, None))
-                screen_pts.append((p2.x, p2.y))
+            parts_world.append(world_v)
+            parts_idx.append(np.arange(world_v.shape[0], dtype=np.int64))
 
         if include_edge_mids:
-            for e in bm.edges:
-                mid = (e.verts[0].co + e.verts[1].co) * 0.5
-                p2 = _project(region, rv3d, mw @ mid)
-                if p2 is None:
-                    continue
-                hits.append(SnapHit(mw @ mid, SNAP_IDX_EDGE_MID, None))
-                screen_pts.append((p2.x, p2.y))
-
-        self._obj_tree = _build_kdtree(screen_pts)
-        self._obj_hits = hits
+            ev = mesh_arrays.bmesh_edge_vert_indices(bm)
+            parts_world.append((world_v[ev[:, 0]] + world_v[ev[:, 1]]) * 0.5)
+            parts_idx.append(np.full(ev.shape[0], SNAP_IDX_EDGE_MID, dtype=np.int64))
+
+        world = np.concatenate(parts_world) if parts_world else _EMPTY_XYZ
+        snap_idx = np.concatenate(parts_idx) if parts_idx else _EMPTY_IDX
+        if mode == SNAP_INDEX_WORLD:
+            if background:
+                self._obj.assign_unindexed(world, snap_idx, None)
+                self._build_obj_in_background(self._obj.world, WorldPointIndex, world)
+            else:
+                self._obj.assign_world_index(world, snap_idx, None)
+        else:
+            screen_xy, ok = _screen_filter(region, rv3d, world)
+            self._obj.assign(world[ok], snap_idx[ok], None, screen_xy)
         self._obj_key = key
 
+    def obj_edge_ends(self, bm, matrix_world, mesh_key: tuple) -> tuple[np.ndarray, np.ndarray]:
+        """Cached obj_edge_ends_world for perpendicular snapping (same mesh key as ensure_obj)."""
+        key = (mesh_key, mesh_arrays.matrix_key(matrix_world))
+        if self._edge_ends is None or key != self._edge_ends_key:
+            self._edge_ends = obj_edge_ends_world(bm, matrix_world)
+            self._edge_ends_key = key
+        return self._edge_ends
+
+    def ensure_intersections(self, bm, matrix_world, mesh_key: tuple, plane: tuple) -> None:
+        """Edge crossings of bm seen along the normal of plane (origin, u_axis, v_axis)."""
+        ends = self.obj_edge_ends(bm, matrix_world, mesh_key)
+        plane_key = tuple(round(float(x), 6) for axis in plane for x in axis)
+        key = (self._edge_ends_key, plane_key)
+        if key == self._isect_key and self._crossings is not None:
+            if self._isect.needs_merge():
+                self._isect.assign_world_index(*self._isect.live_rows(), None)
+            return
+        origin, u_axis, v_axis = plane
+        self._crossings = EdgeCrossings(ends[0], ends[1], origin, u_axis, v_axis)
+        pts = self._crossings.points
+        self._isect.assign_world_index(pts, np.full(pts.shape[0], SNAP_IDX_EDGE_ISECT, dtype=np.int64), None)
+        self._isect_key = key
+
+    def _advance_intersections(self, old_edge_ends_key: tuple) -> bool:
+        """True when crossings match old_edge_ends_key and can be edited in place."""
+        if self._crossings is None:
+            return False
+        if self._edge_ends is None or self._isect_key[0] != old_edge_ends_key:
+            self._clear_intersections()
+            return False
+        return True
+
+    def _advance_obj_key(self, old_mesh_key: tuple, new_mesh_key: tuple, matrix_world) -> bool:
+        """Retarget cached object keys from old_mesh_key to new_mesh_key; False if out of sync."""
+        if not self._obj_key or self._obj_key[2] != old_mesh_key:
+            self.invalidate_mesh()
+            return False
+        mode, view_key, _mesh_key, include_verts, include_edge_mids = self._obj_key
+        self._obj_key = (mode, view_key, new_mesh_key, include_verts, include_edge_mids)
+        if self._edge_ends is not None and self._edge_ends_key != (old_mesh_key, mesh_arrays.matrix_key(matrix_world)):
+            self._edge_ends = None
+            self._edge_ends_key = ()
+        return True
+
+    def append_obj(self, bm, matrix_world, old_mesh_key: tuple, new_mesh_key: tuple) -> None:
+        """Add verts / edges appended to bm since old_mesh_key (mesh_topology_key) in place.
+
+        Falls back to a full rebuild on the next ensure_obj when the cache does not match
+        old_mesh_key or elements were not appended at the end of the sequences.
+        """
+        n_verts, n_edges = old_mesh_key[1], old_mesh_key[2]
+        if new_mesh_key[1] < n_verts or new_mesh_key[2] < n_edges:
+            self.invalidate_mesh()
+            return
+        if not self._advance_obj_key(old_mesh_key, new_mesh_key, matrix_world):
+            return
+        include_verts, include_edge_mids = self._obj_key[3], self._obj_key[4]
+        track_isect = self._advance_intersections(self._edge_ends_key)
+        bm.verts.index_update()
+        bm.verts.ensure_lookup_table()
+        bm.edges.ensure_lookup_table()
+        mw = mesh_arrays.matrix_np(matrix_world)
+
+        new_verts = [bm.verts[i] for i in range(n_verts, len(bm.verts))]
+        if include_verts and new_verts:
+            co = np.array([tuple(v.co) for v in new_verts], dtype=np.float64)
+            self._obj.append(mesh_arrays.transform_points(mw, co), np.array([v.index for v in new_verts], dtype=np.int64))
+
+        new_edges = [bm.edges[i] for i in range(n_edges, len(bm.edges))]
+        if new_edges:
+            ends = np.array([[tuple(v.co) for v in e.verts] for e in new_edges], dtype=np.float64)
+            a = mesh_arrays.transform_points(mw, ends[:, 0])
+            b = mesh_arrays.transform_points(mw, ends[:, 1])
+            if include_edge_mids:
+                self._obj.append((a + b) * 0.5, np.full(len(new_edges), SNAP_IDX_EDGE_MID, dtype=np.int64))
+            if self._edge_ends is not None:
+                self._edge_ends = (
+                    np.concatenate((self._edge_ends[0], a)),
+                    np.concatenate((self._edge_ends[1], b)),
+                )
+            if track_isect:
+                for wa, wb in zip(a, b):
+                    pts = self._crossings.add_edge(wa, wb)
+                    if pts.shape[0]:
+                        self._isect.append(pts, np.full(pts.shape[0], SNAP_IDX_EDGE_ISECT, dtype=np.int64))
+        if self._edge_ends is not None:
+            self._edge_ends_key = (new_mesh_key, mesh_arrays.matrix_key(matrix_world))
+        if track_isect:
+            self._isect_key = (self._edge_ends_key, self._isect_key[1])
+
+    def remove_obj(
+        self,
+        matrix_world,
+        old_mesh_key: tuple,
+        new_mesh_key: tuple,
+        removed_verts: list[int],
+        removed_edges: list[tuple[Vector, Vector]],
+    ) -> None:
+        """Drop deleted verts (by former index) and edges (by local end coordinates) in place.
+
+        Only tail vertices may be removed (surviving indices must not shift); anything else
+        falls back to a full rebuild on the next ensure_obj.
+        """
+        n_left = new_mesh_key[1]
+        if (
+            old_mesh_key[1] - len(removed_verts) != n_left
+            or old_mesh_key[2] - len(removed_edges) != new_mesh_key[2]
+            or any(i < n_left for i in removed_verts)
+        ):
+            self.invalidate_mesh()
+            return
+        if not self._advance_obj_key(old_mesh_key, new_mesh_key, matrix_world):
+            return
+        include_verts, include_edge_mids = self._obj_key[3], self._obj_key[4]
+        track_isect = self._advance_intersections(self._edge_ends_key)
+        ok = True
+        if include_verts:
+            for i in removed_verts:
+                ok &= self._obj.remove(i)
+        if removed_edges:
+            ends = np.array([(tuple(a), tuple(b)) for a, b in removed_edges], dtype=np.float64)
+            mw = mesh_arrays.matrix_np(matrix_world)
+            a = mesh_arrays.transform_points(mw, ends[:, 0])
+            b = mesh_arrays.transform_points(mw, ends[:, 1])
+            if include_edge_mids:
+                for mid in (a + b) * 0.5:
+                    ok &= self._obj.remove(SNAP_IDX_EDGE_MID, mid)
+            if self._edge_ends is not None:
+                ea, eb = self._edge_ends
+                keep = np.ones(ea.shape[0], dtype=bool)
+                for wa, wb in zip(a, b):
+                    tol = 1e-6 * (1.0 + np.abs(wa) + np.abs(wb))
+                    same = np.all(np.abs(ea - wa) <= tol, axis=1) & np.all(np.abs(eb - wb) <= tol, axis=1)
+                    flip = np.all(np.abs(ea - wb) <= tol, axis=1) & np.all(np.abs(eb - wa) <= tol, axis=1)
+                    rows = np.nonzero((same | flip) & keep)[0]
+                    if rows.size == 0:
+                        ok = False
+                        continue
+                    keep[rows[-1]] = False
+                self._edge_ends = (ea[keep], eb[keep])
+            if track_isect:
+                for wa, wb in zip(a, b):
+                    pts = self._crossings.pop_edge(wa, wb)
+                    if pts is None:
+                        self._clear_intersections()
+                        track_isect = False
+                        break
+                    for pt in pts:
+                        self._isect.remove(SNAP_IDX_EDGE_ISECT, pt)
+        if self._edge_ends is not None:
+            self._edge_ends_key = (new_mesh_key, mesh_arrays.matrix_key(matrix_world))
+        if track_isect:
+            self._isect_key = (self._edge_ends_key, self._isect_key[1])
+        if not ok:
+            self.invalidate_mesh()
+
     def ensure_world(
         self,
         context,
@@ -316,87 +1098,129 @@ class DrawMeshSnapCache:
         *,
         ignore_draw_plane: bool,
         world_key: tuple,
+        radius_px: float = 0.0,
+        background: bool = False,
     ) -> None:
+        """Collect world-snap instances, cull by evaluated bounds vs. the view, load visible arrays.
+
+        SCREEN mode builds the KD-tree from on-screen instances only (caps count on-screen
+        vertices); WORLD mode queries per-datablock indexes at find time and builds nothing,
+        unless background=True, which builds the visible datablocks' indexes on the warm-up
+        thread.
+        """
         from . import cursor_plane as cp
 
-        view_key = _view_cache_key(region, rv3d)
-        key = (view_key, world_key, ignore_draw_plane, id(draw_obj))
-        if self._world_tree is not None and key == self._world_key:
+        self.poll_warmup()
+
+        inst = self._world_inst
+        self._drop_updated_world(draw_obj)
+        inst_key = (world_key, id(draw_obj))
+        if inst_key != self._world_inst_key:
+            inst.collect(context, depsgraph, draw_obj)
+            self._world_inst_key = inst_key
+            self._world_vis_key = ()
+        if ignore_draw_plane:
+            inst.plane = None
+        else:
+            normal, _u, _v = cp.cursor_plane_axes(context)
+            inst.plane = (np.array(context.scene.cursor.location, dtype=np.float64), np.array(normal, dtype=np.float64))
+
+        view_key = mesh_arrays.view_cache_key(region, rv3d)
+        vis_key = (view_key, inst_key, float(radius_px))
+        if vis_key != self._world_vis_key:
+            inst.load_visible(context, depsgraph, draw_obj, region, rv3d, radius_px)
+            self._world_vis_key = vis_key
+
+        mode = snap_index_mode()
+        self._world_mode = mode
+        if mode == SNAP_INDEX_WORLD:
+            self._world.clear()
+            self._world_key = ()
+            self._world_truncated = False
+            if background:
+                self._build_world_indexes_in_background(inst.unindexed_visible())
             return
 
-        hits: list[SnapHit] = []
-        screen_pts: list[tuple[float, float]] = []
+        key = (mode, view_key, world_key, ignore_draw_plane, id(draw_obj))
+        if key == self._world_key:
+            return
+
+        parts: list[np.ndarray] = []
         total = 0
         truncated = False
+        max_per_object = world_snap_max_verts_per_object()
+        max_total = world_snap_max_verts_total()
 
-        if depsgraph is not None:
-            for obj_inst in depsgraph.object_instances:
-                if total >= world_snap_max_verts_total():
-                    truncated = True
-                    break
-                obj_eval = obj_inst.object
-                if obj_eval is None or obj_eval.type != 'MESH':
-                    continue
-                try:
-                    obj_orig = obj_eval.original
-                except Exception:
-                    obj_orig = obj_eval
-                if obj_orig is draw_obj:
-                    continue
-                try:
-                    vl = getattr(context, 'view_layer', None)
-                    if vl is None:
-                        vis_ok = obj_orig.visible_get()
-                    else:
-                        try:
-                            vis_ok = obj_orig.visible_get(view_layer=vl)
-                        except TypeError:
-                            vis_ok = obj_orig.visible_get()
-                    if not vis_ok:
-                        continue
-                except Exception:
-                    pass
-                try:
-                    eval_mesh = obj_eval.data
-                except Exception:
-                    continue
-                if eval_mesh is None:
-                    continue
-                try:
-                    verts = eval_mesh.vertices
-                except Exception:
-                    continue
-                n = len(verts)
-                if n > world_snap_max_verts_per_object():
-                    truncated = True
-                    continue
-                max_total = world_snap_max_verts_total()
-                if total + n > max_total:
-                    truncated = True
-                    n = max_total - total
-                inst_mw = obj_inst.matrix_world
-                for i in range(n):
-                    v = verts[i]
-                    v_world = inst_mw @ v.co
-                    if ignore_draw_plane:
-                        snap_w = v_world.copy()
-                        raw = None
-                    else:
-                        snap_w = cp.project_onto_cursor_plane(context, v_world)
-                        raw = v_world.copy()
-                    # KD search by where the vertex appears on screen (not plane projection).
-                    p2 = _project(region, rv3d, v_world)
-                    if p2 is None:
-                        continue
-                    hits.append(SnapHit(snap_w, SNAP_IDX_WORLD_VERT, raw))
-                    screen_pts.append((p2.x, p2.y))
-                total += n
+        for i in np.nonzero(inst.visible)[0].tolist():
+            co = inst.coords.get(inst.data_keys[i])
+            if co is None:
+                continue
+            if total >= max_total:
+                truncated = True
+                break
+            n = co.shape[0]
+            if n > max_per_object:
+                truncated = True
+                continue
+            if total + n > max_total:
+                truncated = True
+                n = max_total - total
+            parts.append(mesh_arrays.transform_points(inst.matrices[i], co[:n]))
+            total += n
 
-        self._world_tree = _build_kdtree(screen_pts)
-        self._world_hits = hits
+        raw = np.concatenate(parts) if parts else _EMPTY_XYZ
+        # KD search by where the vertex appears on screen (not plane projection).
+        screen_xy, ok = _screen_filter(region, rv3d, raw)
+        raw = raw[ok]
+        if inst.plane is None:
+            world = raw
+            raw_out = None
+        else:
+            world = mesh_arrays.project_points_onto_plane(raw, *inst.plane)
+            raw_out = raw
+        snap_idx = np.full(world.shape[0], SNAP_IDX_WORLD_VERT, dtype=np.int64)
+        self._world.assign(world, snap_idx, raw_out, screen_xy)
         self._world_key = key
         self._world_truncated = truncated
 
+    def _drop_updated_world(self, draw_obj) -> None:
+        """Drop world arrays whose sources changed since the last check; re-collect instances.
+
+        Updates of draw_obj itself (every edit of the drawn mesh) are ignored: it is never
+        part of the world snap set.
+        """
+        changed = ids_updated_since(self._world_revision)
+        self._world_revision = update_revision()
+        if changed is None:
+            self._world_inst.clear_data()
+        else:
+            try:
+                changed.discard(draw_obj.as_pointer())
+                if draw_obj.data is not None:
+                    changed.discard(draw_obj.data.as_pointer())
+            except Exception:
+                pass
+            if not changed:
+                return
+            self._world_inst.drop_updated(changed)
+        self._world_inst_key = ()
+        self._world_vis_key = ()
+        self._world_key = ()
+
+    def _build_world_indexes_in_background(self, coords: dict[tuple, np.ndarray]) -> None:
+        if not coords:
+            return
+        inst = self._world_inst
+        inst.pending.update(coords)
+
+        def install(built) -> None:
+            for key, co in coords.items():
+                inst.pending.discard(key)
+                if built is not None and inst.coords.get(key) is co:
+                    inst.indexes[key] = built[key]
+
+        self._jobs.append((install, _warmup_submit(_build_point_indexes, coords)))
+
 
 def mesh_topology_key(me, bm) -> tuple:
     try:
@@ -3,6 +3,17 @@ from gpu_extras.batch import batch_for_shader
 import math
 from mathutils import Vector, Matrix
 
+_UNIFORM_COLOR_SHADER = None
+
+
+def _uniform_color_shader():
+    """Built-in UNIFORM_COLOR shader, looked up once (needs a GPU context: call from draw code)."""
+    global _UNIFORM_COLOR_SHADER
+    if _UNIFORM_COLOR_SHADER is None:
+        _UNIFORM_COLOR_SHADER = gpu.shader.from_builtin('UNIFORM_COLOR')
+    return _UNIFORM_COLOR_SHADER
+
+
 def draw_wire_sphere(center, radius, color=(1.0, 0.6, 0.1, 0.4), segments=32):
     """Draws a simple 3D wireframe sphere (3 intersecting circles) in the viewport."""
     verts = []
@@ -25,7 +36,7 @@ def draw_wire_sphere(center, radius, color=(1.0, 0.6, 0.1, 0.4), segments=32):
         a_next = (i + 1) * 2 * math.pi / segments
         verts.append(center + Vector((0, math.cos(a_next)*radius, math.sin(a_next)*radius)))
 
-    shader = gpu.shader.from_builtin('UNIFORM_COLOR')
+    shader = _uniform_color_shader()
     batch = batch_for_shader(shader, 'LINES', {"pos": verts})
 
     gpu.state.blend_set('ALPHA')
@@ -51,7 +62,7 @@ def draw_angle_pie(center, dir_base, normal, angle, radius, color=(0.1, 0.6, 1.0
     for i in range(1, segments + 1):
         indices.append((0, i, i + 1))
         
-    shader = gpu.shader.from_builtin('UNIFORM_COLOR')
+    shader = _uniform_color_shader()
     batch_tris = batch_for_shader(shader, 'TRIS', {"pos": verts}, indices=indices)
     
     gpu.state.blend_set('ALPHA')
@@ -119,7 +130,7 @@ def draw_mesh_wireframe(world_matrix, coords, normals, edges, offset, color=(0.0
     """Draws a wireframe of a mesh with a normal-based offset."""
     new_coords = [world_matrix @ (co + normal * offset) for co, normal in zip(coords, normals)]
     
-    shader = gpu.shader.from_builtin('UNIFORM_COLOR')
+    shader = _uniform_color_shader()
     batch = batch_for_shader(shader, 'LINES', {"pos": new_coords}, indices=edges)
     
     gpu.state.blend_set('ALPHA')
@@ -130,7 +141,7 @@ def draw_mesh_wireframe(world_matrix, coords, normals, edges, offset, color=(0.0
 
 def _draw_simple_lines(points, color, width=1.0):
     """Draws straight LINES from a flat list of vertex pairs."""
-    shader = gpu.shader.from_builtin('UNIFORM_COLOR')
+    shader = _uniform_color_shader()
     batch = batch_for_shader(shader, 'LINES', {"pos": points})
     gpu.state.blend_set('ALPHA')
     gpu.state.line_width_set(width)
@@ -140,9 +151,38 @@ def _draw_simple_lines(points, color, width=1.0):
     gpu.state.line_width_set(1.0)
     gpu.state.blend_set('NONE')
 
+class CachedLineBatch:
+    """LINES batch kept across redraws; set() stores new float32 vertices, draw() rebuilds only then."""
+
+    def __init__(self):
+        self._coords = None
+        self._batch = None
+
+    def set(self, coords):
+        self._coords = coords if len(coords) else None
+        self._batch = None
+
+    def clear(self):
+        self._coords = None
+        self._batch = None
+
+    def draw(self, color, width=1.0):
+        if self._coords is None:
+            return
+        shader = _uniform_color_shader()
+        if self._batch is None:
+            self._batch = batch_for_shader(shader, 'LINES', {"pos": self._coords})
+        gpu.state.blend_set('ALPHA')
+        gpu.state.line_width_set(width)
+        shader.bind()
+        shader.uniform_float("color", color)
+        self._batch.draw(shader)
+        gpu.state.line_width_set(1.0)
+        gpu.state.blend_set('NONE')
+
 def _draw_simple_points(points, color, size=4.0):
     """Draws GL POINTS at the given world positions."""
-    shader = gpu.shader.from_builtin('UNIFORM_COLOR')
+    shader = _uniform_color_shader()
     batch = batch_for_shader(shader, 'POINTS', {"pos": points})
     gpu.state.blend_set('ALPHA')
     gpu.state.point_size_set(size)
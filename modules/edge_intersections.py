@@ -0,0 +1,263 @@
+"""Edge crossing points for intersection snapping (uniform grid in a 2D plane frame).
+
+Edges are expressed in (u, v) coordinates of a plane (the cursor work plane for Draw Mesh
+Edges) and bucketed into a grid sized for about one edge per cell, so only edges sharing
+a cell are tested against each other. Crossings are therefore view-independent: they are
+computed once per edge set / plane and ranked by screen distance like any other snap.
+"""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from . import cursor_plane as cp
+
+# Segments spanning more cells than this are tested against every edge instead of bucketed.
+_LONG_SEGMENT_CELLS = 64
+_MAX_GRID_CELLS = 1 << 20
+_MAX_PAIRS = 4_000_000
+# Crossings this close to an endpoint (in edge parameter) are shared vertices, not crossings.
+_END_EPS = 1e-6
+# Edges whose points at a plane crossing are further apart than this (relative to the longer
+# edge) pass over / under each other: skew edges seen overlapping, not crossings.
+_GAP_RATIO = 1e-3
+
+_EMPTY_XYZ = np.empty((0, 3), dtype=np.float64)
+_EMPTY_IDX = np.empty(0, dtype=np.int64)
+_NEIGHBOURS = np.array([(dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1)], dtype=np.int64)
+
+
+def _meeting_points(on_i: np.ndarray, on_j: np.ndarray, len_i, len_j) -> np.ndarray:
+    """(M, 3) midpoints of on_i / on_j for the pairs whose edges actually meet in 3D."""
+    gap = np.linalg.norm(on_i - on_j, axis=1)
+    meet = gap <= _GAP_RATIO * np.maximum(len_i, len_j)
+    return (on_i[meet] + on_j[meet]) * 0.5
+
+
+def _clip_segment(p0: np.ndarray, p1: np.ndarray, lo: np.ndarray, hi: np.ndarray):
+    """Liang–Barsky clip of 2D segment p0–p1 to box [lo, hi]; None when it misses the box."""
+    d = p1 - p0
+    t0, t1 = 0.0, 1.0
+    for axis in range(2):
+        if abs(d[axis]) < 1e-30:
+            if p0[axis] < lo[axis] or p0[axis] > hi[axis]:
+                return None
+            continue
+        ta = (lo[axis] - p0[axis]) / d[axis]
+        tb = (hi[axis] - p0[axis]) / d[axis]
+        t0 = max(t0, min(ta, tb))
+        t1 = min(t1, max(ta, tb))
+        if t0 > t1:
+            return None
+    return p0 + d * t0, p0 + d * t1
+
+
+class EdgeCrossings:
+    """Crossings of 3D edges (a[i], b[i]) seen along the normal of plane (origin, u, v).
+
+    points: (K, 3) world crossing points of edge pairs that also meet in 3D (midway between
+    the two edges' points, which agree within _GAP_RATIO); edges lying off the plane that only
+    overlap in projection, like front and back edges of a solid, are skipped. band_crossings() intersects one extra segment,
+    e.g. the rubber band, with the same grid. Edges drawn later are kept in a short
+    "recent" list (add_edge / pop_edge) instead of rebuilding the grid.
+    """
+
+    def __init__(self, a: np.ndarray, b: np.ndarray, origin, u_axis, v_axis) -> None:
+        self._a = a
+        self._b = b
+        self._origin = np.asarray(origin, dtype=np.float64)
+        self._uv_axes = np.stack((np.asarray(u_axis, dtype=np.float64), np.asarray(v_axis, dtype=np.float64)))
+        self._a2 = self._to_uv(a)
+        self._b2 = self._to_uv(b)
+        self.truncated = False
+        self._recent_a = _EMPTY_XYZ
+        self._recent_b = _EMPTY_XYZ
+        self._recent_points: list[np.ndarray] = []
+        self._build_grid()
+        self.points = self._self_crossings()
+
+    def _to_uv(self, pts: np.ndarray) -> np.ndarray:
+        return (pts - self._origin) @ self._uv_axes.T
+
+    def _build_grid(self) -> None:
+        n = self._a2.shape[0]
+        self._long = _EMPTY_IDX
+        self._cell_starts = np.zeros(1, dtype=np.int64)
+        self._cell_of_entry = _EMPTY_IDX
+        self._entry_edges = _EMPTY_IDX
+        self._cols = self._rows = 1
+        self._cell = 1.0
+        self._lo = np.zeros(2)
+        self._edge_lo = self._edge_hi = np.empty((0, 2), dtype=np.float64)
+        if n == 0:
+            return
+        lo = np.minimum(self._a2, self._b2)
+        hi = np.maximum(self._a2, self._b2)
+        self._lo = lo.min(axis=0)
+        extent = np.maximum(hi.max(axis=0) - self._lo, 1e-12)
+        # About one edge per cell, but no smaller than a typical edge so most span 1-2 cells.
+        cell = max(
+            math.sqrt(extent[0] * extent[1] / n),
+            float(np.median((hi - lo).max(axis=1))),
+            float(extent.max()) / math.sqrt(_MAX_GRID_CELLS),
+            1e-12,
+        )
+        self._cell = cell
+        self._cols = max(1, int(math.ceil(extent[0] / cell)))
+        self._rows = max(1, int(math.ceil(extent[1] / cell)))
+
+        cx0, cy0 = self._cell_xy(lo)
+        cx1, cy1 = self._cell_xy(hi)
+        nx = cx1 - cx0 + 1
+        spans = nx * (cy1 - cy0 + 1)
+        is_long = spans > _LONG_SEGMENT_CELLS
+        eids = np.arange(n, dtype=np.int64)
+        self._long = eids[is_long]
+        short = ~is_long
+        eids, cx0, cy0, nx, spans = eids[short], cx0[short], cy0[short], nx[short], spans[short]
+        rep = np.repeat(np.arange(eids.shape[0]), spans)
+        k = np.arange(rep.shape[0]) - np.repeat(np.cumsum(spans) - spans, spans)
+        cells = (cy0[rep] + k // nx[rep]) * self._cols + (cx0[rep] + k % nx[rep])
+        order = np.argsort(cells, kind="stable")
+        self._cell_of_entry = cells[order]
+        self._entry_edges = eids[rep][order]
+        self._edge_lo = lo
+        self._edge_hi = hi
+        self._cell_starts = np.searchsorted(self._cell_of_entry, np.arange(self._cols * self._rows + 1))
+
+    def _cell_xy(self, uv: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        c = np.floor((uv - self._lo) / self._cell).astype(np.int64)
+        return np.clip(c[..., 0], 0, self._cols - 1), np.clip(c[..., 1], 0, self._rows - 1)
+
+    def _candidate_pairs(self) -> tuple[np.ndarray, np.ndarray]:
+        """Edge pairs with overlapping bounds, each emitted once.
+
+        A bucketed pair is kept only in the cell holding the low corner of the overlap of
+        the two edge bounds (no dedupe pass); long edges are paired with every edge.
+        """
+        n = self._a2.shape[0]
+        firsts: list[np.ndarray] = []
+        seconds: list[np.ndarray] = []
+        total = 0
+        cells = self._cell_of_entry
+        if cells.size:
+            group_end = self._cell_starts[cells + 1]
+            pos = np.arange(cells.shape[0])
+            max_group = int(np.diff(self._cell_starts).max())
+            for offset in range(1, max_group):
+                pos = pos[pos + offset < group_end[pos]]
+                if pos.size == 0:
+                    break
+                i = self._entry_edges[pos]
+                j = self._entry_edges[pos + offset]
+                lo = np.maximum(self._edge_lo[i], self._edge_lo[j])
+                hi = np.minimum(self._edge_hi[i], self._edge_hi[j])
+                cx, cy = self._cell_xy(lo)
+                keep = np.all(lo <= hi, axis=1) & (cy * self._cols + cx == cells[pos])
+                firsts.append(i[keep])
+                seconds.append(j[keep])
+                total += int(keep.sum())
+                if total > _MAX_PAIRS:
+                    self.truncated = True
+                    break
+        is_long = np.zeros(n, dtype=bool)
+        is_long[self._long] = True
+        for i in self._long.tolist():
+            if total > _MAX_PAIRS:
+                self.truncated = True
+                break
+            others = np.arange(n, dtype=np.int64)
+            # Long–long pairs once (i < j).
+            others = others[~is_long | (others > i)]
+            firsts.append(np.full(others.shape[0], i, dtype=np.int64))
+            seconds.append(others)
+            total += others.size
+        if not firsts:
+            return _EMPTY_IDX, _EMPTY_IDX
+        return np.concatenate(firsts), np.concatenate(seconds)
+
+    def _self_crossings(self) -> np.ndarray:
+        i, j = self._candidate_pairs()
+        if i.size == 0:
+            return _EMPTY_XYZ
+        t, s, ok = cp.segment_segment_2d_many(self._a2[i], self._b2[i], self._a2[j], self._b2[j])
+        hit = ok & (t > _END_EPS) & (t < 1.0 - _END_EPS) & (s > _END_EPS) & (s < 1.0 - _END_EPS)
+        i, j, t, s = i[hit], j[hit], t[hit], s[hit]
+        d_i = self._b[i] - self._a[i]
+        d_j = self._b[j] - self._a[j]
+        on_i = self._a[i] + d_i * t[:, None]
+        on_j = self._a[j] + d_j * s[:, None]
+        return _meeting_points(on_i, on_j, np.linalg.norm(d_i, axis=1), np.linalg.norm(d_j, axis=1))
+
+    def _grid_edges_near(self, q0: np.ndarray, q1: np.ndarray) -> np.ndarray:
+        """Base edges whose cells the 2D segment q0–q1 passes through (plus long edges)."""
+        box_hi = self._lo + self._cell * np.array((self._cols, self._rows), dtype=np.float64)
+        clipped = _clip_segment(q0, q1, self._lo - self._cell, box_hi + self._cell)
+        cand = [self._long]
+        if clipped is not None:
+            c0, c1 = clipped
+            steps = max(1, int(math.ceil(float(np.linalg.norm(c1 - c0)) / (0.5 * self._cell))))
+            samples = c0 + (c1 - c0) * np.linspace(0.0, 1.0, steps + 1)[:, None]
+            # Samples are half a cell apart; the 3x3 neighbourhood covers cells the segment
+            # only clips between two samples.
+            c = np.floor((samples - self._lo) / self._cell).astype(np.int64)
+            near = (c[:, None, :] + _NEIGHBOURS[None, :, :]).reshape(-1, 2)
+            near = near[
+                (near[:, 0] >= 0) & (near[:, 0] < self._cols) & (near[:, 1] >= 0) & (near[:, 1] < self._rows)
+            ]
+            for cell in np.unique(near[:, 1] * self._cols + near[:, 0]).tolist():
+                cand.append(self._entry_edges[self._cell_starts[cell]:self._cell_starts[cell + 1]])
+        return np.unique(np.concatenate(cand))
+
+    def _segment_hits(self, p0, p1) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Segment p0–p1 (world) vs. base and recent edges: (edge a, edge b, t on segment, s on edge, ok)."""
+        q = self._to_uv(np.array((tuple(p0), tuple(p1)), dtype=np.float64))
+        base = self._grid_edges_near(q[0], q[1]) if self._a2.shape[0] else _EMPTY_IDX
+        ea = np.concatenate((self._a[base], self._recent_a))
+        eb = np.concatenate((self._b[base], self._recent_b))
+        if ea.shape[0] == 0:
+            empty = np.empty(0, dtype=np.float64)
+            return ea, eb, empty, empty, np.zeros(0, dtype=bool)
+        a2 = self._to_uv(ea)
+        b2 = self._to_uv(eb)
+        t, s, ok = cp.segment_segment_2d_many(np.broadcast_to(q[0], a2.shape), np.broadcast_to(q[1], a2.shape), a2, b2)
+        ok &= (s > _END_EPS) & (s < 1.0 - _END_EPS)
+        return ea, eb, t, s, ok
+
+    def add_edge(self, p0, p1) -> np.ndarray:
+        """Register an edge added after the build; returns its (M, 3) crossing points."""
+        ea, eb, t, s, ok = self._segment_hits(p0, p1)
+        ok &= (t > _END_EPS) & (t < 1.0 - _END_EPS)
+        a = np.asarray(tuple(p0), dtype=np.float64)
+        b = np.asarray(tuple(p1), dtype=np.float64)
+        d_old = eb[ok] - ea[ok]
+        on_new = a + (b - a) * t[ok, None]
+        on_old = ea[ok] + d_old * s[ok, None]
+        pts = _meeting_points(on_new, on_old, float(np.linalg.norm(b - a)), np.linalg.norm(d_old, axis=1))
+        self._recent_a = np.concatenate((self._recent_a, a[None, :]))
+        self._recent_b = np.concatenate((self._recent_b, b[None, :]))
+        self._recent_points.append(pts)
+        return pts
+
+    def pop_edge(self, p0, p1) -> np.ndarray | None:
+        """Forget the latest added edge p0–p1 (either direction); returns its crossings or None."""
+        a = np.asarray(tuple(p0), dtype=np.float64)
+        b = np.asarray(tuple(p1), dtype=np.float64)
+        tol = 1e-6 * (1.0 + np.abs(a) + np.abs(b))
+        same = np.all(np.abs(self._recent_a - a) <= tol, axis=1) & np.all(np.abs(self._recent_b - b) <= tol, axis=1)
+        flip = np.all(np.abs(self._recent_a - b) <= tol, axis=1) & np.all(np.abs(self._recent_b - a) <= tol, axis=1)
+        rows = np.nonzero(same | flip)[0]
+        if rows.size == 0:
+            return None
+        row = int(rows[-1])
+        keep = np.arange(self._recent_a.shape[0]) != row
+        self._recent_a = self._recent_a[keep]
+        self._recent_b = self._recent_b[keep]
+        return self._recent_points.pop(row)
+
+    def band_crossings(self, p0, p1) -> np.ndarray:
+        """(M, 3) points on existing edges where segment p0–p1 (world) crosses them in the plane."""
+        ea, eb, t, s, ok = self._segment_hits(p0, p1)
+        ok &= (t >= 0.0) & (t <= 1.0)
+        return ea[ok] + (eb[ok] - ea[ok]) * s[ok, None]
@@ -1,7 +1,11 @@
 """Edit-mode curve: selected control points, handles, and NURBS/Poly points."""
 
+import numpy as np
 from mathutils import Vector
 
+from . import mesh_arrays, plane_fit
+from .farthest_pair import farthest_pair_indices
+
 
 def poll_active_curve_edit_mode(context):
     return (
@@ -196,47 +200,31 @@ def curve_farthest_pair_targets(targets):
     """Return the two targets that are farthest apart."""
     if len(targets) < 2:
         return None, None
-    max_d = -1.0
-    ia, ib = 0, 1
-    cos = [t.get_co() for t in targets]
-    for i in range(len(targets)):
-        for j in range(i + 1, len(targets)):
-            d = (cos[i] - cos[j]).length_squared
-            if d > max_d:
-                max_d = d
-                ia, ib = i, j
+    cos = np.array([tuple(t.get_co()) for t in targets], dtype=np.float64)
+    ia, ib = farthest_pair_indices(cos)
     return targets[ia], targets[ib]
 
 
 def curve_best_fit_plane_local_vectors(targets):
-    """Return (v_a, v_b, v_c) local coords that define the best-fit plane, or None."""
+    """Return (v_a, v_b, v_c) local coords of the three most defining targets, or None."""
     if len(targets) < 3:
         return None
     cos = [t.get_co() for t in targets]
-    max_dist_sq = -1.0
-    ia, ib = 0, 1
-    for i in range(len(cos)):
-        for j in range(i + 1, len(cos)):
-            dist_sq = (cos[i] - cos[j]).length_squared
-            if dist_sq > max_dist_sq:
-                max_dist_sq = dist_sq
-                ia, ib = i, j
-    v_a, v_b = cos[ia], cos[ib]
-    line_vec = v_b - v_a
-    if line_vec.length_squared < 1e-9:
+    picked = plane_fit.three_point_indices(np.array([tuple(co) for co in cos], dtype=np.float64))
+    if picked is None:
+        return None
+    return tuple(cos[i] for i in picked)
+
+
+def curve_fit_plane_world(targets, world_mx, robust=plane_fit.FIT_LEAST_SQUARES):
+    """Return (plane point, unit normal) world Vectors of the least-squares plane, or None."""
+    if len(targets) < 3:
         return None
-    v_c = None
-    max_line_dist_sq = -1.0
-    for k, co in enumerate(cos):
-        if k == ia or k == ib:
-            continue
-        dist_sq = (co - v_a).cross(line_vec).length_squared
-        if dist_sq > max_line_dist_sq:
-            max_line_dist_sq = dist_sq
-            v_c = co
-    if v_c is None:
+    local = np.array([tuple(t.get_co()) for t in targets], dtype=np.float64)
+    fit = plane_fit.fit_plane(mesh_arrays.transform_points(world_mx, local), robust)
+    if fit is None:
         return None
-    return v_a, v_b, v_c
+    return Vector(fit[0].tolist()), Vector(fit[1].tolist())
 
 
 def execute_make_collinear_curve(op, context):
@@ -301,27 +289,30 @@ def execute_make_coplanar_curve(op, context):
     if len(targets) < 3:
         op.report({'WARNING'}, "Select at least 3 curve points or handles")
         return {'CANCELLED'}
-    if op.mode != 'BEST_FIT':
-        op.report({'WARNING'}, "For curves only Best Fit is supported")
-        return {'CANCELLED'}
-
-    plane_locals = curve_best_fit_plane_local_vectors(targets)
-    if plane_locals is None:
-        op.report({'WARNING'}, "Could not define a plane from selection (collinear?)")
+    if op.mode not in {'BEST_FIT', 'THREE_POINT'}:
+        op.report({'WARNING'}, "For curves only Best Fit and Three Vertices are supported")
         return {'CANCELLED'}
-    v_a, v_b, v_c = plane_locals
 
     world_mx = obj.matrix_world
     inv_world_mx = world_mx.inverted()
-    p1_w = world_mx @ v_a
-    p2_w = world_mx @ v_b
-    p3_w = world_mx @ v_c
-    plane_normal = (p2_w - p1_w).cross(p3_w - p1_w)
-    if plane_normal.length_squared < 1e-9:
-        op.report({'WARNING'}, "Defining points are collinear")
-        return {'CANCELLED'}
-    plane_normal.normalize()
-    plane_point = p1_w
+    if op.mode == 'BEST_FIT':
+        fit = curve_fit_plane_world(targets, world_mx, op.fit_method)
+        if fit is None:
+            op.report({'WARNING'}, "Could not define a plane from selection (collinear?)")
+            return {'CANCELLED'}
+        plane_point, plane_normal = fit
+    else:
+        plane_locals = curve_best_fit_plane_local_vectors(targets)
+        if plane_locals is None:
+            op.report({'WARNING'}, "Could not define a plane from selection (collinear?)")
+            return {'CANCELLED'}
+        p1_w, p2_w, p3_w = (world_mx @ co for co in plane_locals)
+        plane_normal = (p2_w - p1_w).cross(p3_w - p1_w)
+        if plane_normal.length_squared < 1e-9:
+            op.report({'WARNING'}, "Defining points are collinear")
+            return {'CANCELLED'}
+        plane_normal.normalize()
+        plane_point = p1_w
 
     for t in targets:
         co = t.get_co()
@@ -265,6 +265,8 @@ def draw_callback_px(context):
                 col = (0.85, 0.35, 1.0, 0.9)
             elif snap_kind == -4:
                 col = (0.25, 0.85, 1.0, 0.92)
+            elif snap_kind == -5:
+                col = (1.0, 0.35, 0.6, 0.92)
             else:
                 col = (0.15, 1.0, 0.45, 0.92)
             gpu_state.blend_set('ALPHA')
@@ -277,6 +279,8 @@ def draw_callback_px(context):
                 label = 'World'
             elif snap_kind == -4:
                 label = 'Perp'
+            elif snap_kind == -5:
+                label = 'Isect'
             elif snap_kind is not None and snap_kind >= 0:
                 label = 'Vtx'
             elif snap_kind == -1:
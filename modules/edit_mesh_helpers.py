@@ -4,10 +4,16 @@ from collections import deque
 
 import bpy
 import bmesh
+import numpy as np
 from mathutils import Vector, Matrix
 from bpy_extras.view3d_utils import location_3d_to_region_2d
 
+from . import arc_length
 from . import cursor_plane as cp
+from . import hover_pick_index
+from . import mesh_adjacency
+from . import mesh_arrays
+from . import redo_snapshot
 from . import edit_curve_helpers as ech
 from . import utils
 from . import edit_mesh_draw_state as draw_state
@@ -202,34 +208,30 @@ def _loop_anchor_vert(bm, reference_edge):
 
 def order_loop_vertices(comp, anchor_vert):
     """Walk a closed edge loop and return vertices in order starting at anchor_vert."""
-    neighbors = {}
-    for edge in comp:
-        v0, v1 = edge.verts
-        neighbors.setdefault(v0, []).append(v1)
-        neighbors.setdefault(v1, []).append(v0)
-
-    if anchor_vert not in neighbors:
+    verts = list({vert for edge in comp for vert in edge.verts})
+    slot = {vert: i for i, vert in enumerate(verts)}
+    if anchor_vert not in slot:
+        return None
+    pairs = np.array([(slot[edge.verts[0]], slot[edge.verts[1]]) for edge in comp], dtype=np.int64)
+    walk = arc_length.walk_chain(pairs, slot[anchor_vert])
+    if walk is None:
         return None
+    return [verts[i] for i in walk.tolist()]
 
-    ordered = [anchor_vert]
-    current = anchor_vert
-    prev = None
-    while True:
-        nbrs = [n for n in neighbors[current] if n != prev]
-        if not nbrs:
-            break
-        nxt = nbrs[0]
-        if nxt == anchor_vert and len(ordered) > 1:
-            break
-        ordered.append(nxt)
-        prev = current
-        current = nxt
-        if len(ordered) > len(neighbors):
-            return None
 
-    if len(ordered) != len(neighbors):
-        return None
-    return ordered
+def _write_equalized_chains(chains, closed):
+    """Equalize ordered vertex chains in one batch (first vertex fixed); returns moved count."""
+    chains = [c for c in chains if c]
+    if not chains:
+        return 0
+    flat = [vert for chain in chains for vert in chain]
+    offsets = np.concatenate(((0,), np.cumsum([len(c) for c in chains])))
+    points = np.array([tuple(vert.co) for vert in flat], dtype=np.float64)
+    new_points, moved = arc_length.equalize_chains(points, offsets, closed)
+    rows = np.nonzero(moved)[0]
+    for row, co in zip(rows.tolist(), new_points[rows].tolist()):
+        flat[row].co = co
+    return int(rows.size)
 
 
 def redistribute_loop_vertices(ordered_verts, anchor_vert):
@@ -239,40 +241,12 @@ def redistribute_loop_vertices(ordered_verts, anchor_vert):
     """
     if not ordered_verts or ordered_verts[0] is not anchor_vert:
         return 0
+    return _write_equalized_chains([ordered_verts], [True])
 
-    n = len(ordered_verts)
-    if n < 3:
-        return 0
-
-    original_coords = [vert.co.copy() for vert in ordered_verts]
-    distances = [0.0]
-    total_length = 0.0
-    for i in range(n):
-        p1 = original_coords[i]
-        p2 = original_coords[(i + 1) % n]
-        total_length += (p2 - p1).length
-        distances.append(total_length)
-
-    if total_length < 1e-6:
-        return 0
 
-    target_len = total_length / n
-    moved = 0
-    for i in range(1, n):
-        target_dist = i * target_len
-        seg_idx = next(
-            (j for j in range(n) if distances[j + 1] >= target_dist - 1e-9),
-            n - 1,
-        )
-        p_start = original_coords[seg_idx]
-        p_end = original_coords[(seg_idx + 1) % n]
-        seg_len = (p_end - p_start).length
-        if seg_len < 1e-9:
-            continue
-        dist_into = target_dist - distances[seg_idx]
-        ordered_verts[i].co = p_start.lerp(p_end, dist_into / seg_len)
-        moved += 1
-    return moved
+def distribute_chain_vertices(ordered_verts):
+    """Space an open chain evenly along its own path (ends fixed). Returns moved count."""
+    return _write_equalized_chains([ordered_verts], [False])
 
 
 def _equalize_open_component(comp, reference_edge, target_len):
@@ -325,6 +299,7 @@ def equalize_selected_edges(bm, reference_edge, target_len):
             if set_edge_length_from_center(edge, target_len):
                 modified += 1
 
+    loops = []
     for comp in closed_components:
         if reference_edge in comp:
             anchor = _loop_anchor_vert(bm, reference_edge)
@@ -333,8 +308,9 @@ def equalize_selected_edges(bm, reference_edge, target_len):
         ordered = order_loop_vertices(comp, anchor)
         if ordered is None:
             continue
-        modified += redistribute_loop_vertices(ordered, anchor)
+        loops.append(ordered)
         loop_edge_count += len(comp)
+    modified += _write_equalized_chains(loops, [True] * len(loops))
 
     return modified, loop_edge_count
 
@@ -453,7 +429,7 @@ def bmesh_edge_split_normalized(edge, v_from, fac):
 
 
 def hovered_edge(bm, mw, region, rv3d, mouse_xy, threshold_px=14, exclude_edges=None):
-    """Pick edge under mouse_xy in screen space.
+    """Pick edge under mouse_xy in screen space (shared grid index, see hover_pick_index).
 
     Returns (edge, t_along, hover_d2_px) or (None, None, None) if no edge is
     within threshold_px.
@@ -461,76 +437,33 @@ def hovered_edge(bm, mw, region, rv3d, mouse_xy, threshold_px=14, exclude_edges=
     if region is None or rv3d is None:
         return None, None, None
     bm.edges.ensure_lookup_table()
+    index = hover_pick_index.shared_index(bm, mw, region, rv3d)
     excluded = set()
     if exclude_edges:
         for e in exclude_edges:
-            if e is not None:
-                excluded.add(e)
-    best_d2 = float(threshold_px) * float(threshold_px)
-    best_edge = None
-    best_t = 0.0
-    for e in bm.edges:
-        if e in excluded:
-            continue
-        v0w = mw @ e.verts[0].co
-        v1w = mw @ e.verts[1].co
-        p0 = location_3d_to_region_2d(region, rv3d, v0w)
-        p1 = location_3d_to_region_2d(region, rv3d, v1w)
-        if p0 is None or p1 is None:
-            continue
-        ax, ay = p0.x, p0.y
-        bx, by = p1.x, p1.y
-        dx = bx - ax
-        dy = by - ay
-        seg_len_sq = dx * dx + dy * dy
-        if seg_len_sq < 1e-6:
-            continue
-        mx = float(mouse_xy[0])
-        my = float(mouse_xy[1])
-        t = ((mx - ax) * dx + (my - ay) * dy) / seg_len_sq
-        t_clamped = max(0.0, min(1.0, t))
-        cx = ax + t_clamped * dx
-        cy = ay + t_clamped * dy
-        ex = mx - cx
-        ey = my - cy
-        d2 = ex * ex + ey * ey
-        if d2 < best_d2:
-            best_d2 = d2
-            best_edge = e
-            best_t = t_clamped
-    if best_edge is None:
+            if e is not None and e.is_valid:
+                excluded.add(e.index)
+    found = index.pick_edge(mouse_xy, float(threshold_px), excluded)
+    if found is None:
         return None, None, None
-    return best_edge, best_t, best_d2
+    edge_idx, t, d2 = found
+    return bm.edges[edge_idx], t, d2
 
 
 def hovered_vert(bm, mw, region, rv3d, mouse_xy, threshold_px=14, exclude_indices=None):
-    """Pick vertex under mouse_xy in screen space.
+    """Pick vertex under mouse_xy in screen space (shared grid index, see hover_pick_index).
 
     Returns (vert, hover_d2_px) or (None, None) if none within threshold_px.
     """
     if region is None or rv3d is None:
         return None, None
     bm.verts.ensure_lookup_table()
-    excluded = set(exclude_indices or ())
-    best_d2 = float(threshold_px) * float(threshold_px)
-    best_vert = None
-    mx = float(mouse_xy[0])
-    my = float(mouse_xy[1])
-    for v in bm.verts:
-        if not v.is_valid or v.index in excluded:
-            continue
-        p = location_3d_to_region_2d(region, rv3d, mw @ v.co)
-        if p is None:
-            continue
-        ex = mx - p.x
-        ey = my - p.y
-        d2 = ex * ex + ey * ey
-        if d2 < best_d2:
-            best_d2 = d2
-            best_vert = v
-    if best_vert is None:
+    index = hover_pick_index.shared_index(bm, mw, region, rv3d)
+    found = index.pick_vert(mouse_xy, float(threshold_px), set(exclude_indices or ()))
+    if found is None:
         return None, None
-    return best_vert, best_d2
+    vert_idx, d2 = found
+    return bm.verts[vert_idx], d2
 
 
 def working_plane_for_edges(edge_a, edge_b, mw):
@@ -1960,25 +1893,34 @@ class ProportionalFalloffMixin:
             if self.proportional_connected_only:
                 layout.prop(self, "proportional_connected_depth")
 
-    def process_falloff(self, bm, old_coords, moved_coords, world_mx):
-        if self.proportional_radius > 0.0:
+    def begin_redo_session(self):
+        """Start a new redo session: the next falloff_snapshot() recaptures coordinates."""
+        redo_snapshot.clear(self.bl_idname)
+
+    def falloff_snapshot(self, bm, mesh):
+        """(N, 3) original local coordinates for process_falloff (None while falloff is off).
+
+        Call before moving any vertex; redo executes reuse the session snapshot.
+        """
+        if self.proportional_radius <= 0.0:
+            return None
+        return redo_snapshot.session_snapshot(self.bl_idname, self, mesh, bm).co
+
+    def process_falloff(self, bm, old_coords, moved_coords, world_mx, mesh=None):
+        if self.proportional_radius > 0.0 and old_coords is not None:
             utils.apply_soft_falloff(
                 bm, old_coords, moved_coords, self.proportional_radius,
                 self.proportional_falloff, world_mx,
                 self.proportional_connected_only, self.proportional_connected_depth,
+                mesh=mesh,
             )
 
             if moved_coords:
-                center_local = sum(
-                    (old_coords[v] for v in moved_coords.keys()), Vector()
-                ) / len(moved_coords)
-                center_world = world_mx @ center_local
-
-                distances = [
-                    ((world_mx @ old_coords[v]) - center_world).length
-                    for v in moved_coords.keys()
-                ]
-                avg_dist = sum(distances) / len(distances) if distances else 0.0
+                moved_idx = np.fromiter((v.index for v in moved_coords), dtype=np.int64, count=len(moved_coords))
+                moved_world = mesh_arrays.transform_points(world_mx, old_coords[moved_idx])
+                center = moved_world.mean(axis=0)
+                avg_dist = float(np.linalg.norm(moved_world - center, axis=1).mean())
+                center_world = Vector(center.tolist())
                 visual_radius = self.proportional_radius + avg_dist
 
                 obj = bpy.context.active_object
@@ -2016,22 +1958,60 @@ def get_boundary_and_interior_verts(bm, context):
     return selected_verts, [], selected_verts
 
 
-def relax_planar_vertices(interior_verts, normal, influence, iterations=10):
-    """Iteratively relaxes vertices strictly on a 2D plane defined by normal."""
-    if not interior_verts or influence <= 0.0:
+def relax_planar_vertices(interior_verts, normal, influence, iterations=10, tolerance=0.0):
+    """
+    Jacobi-relax interior_verts toward their edge-neighbour average, moving only within the
+    plane of normal. Every other vertex (e.g. the boundary from get_boundary_and_interior_verts)
+    stays pinned. With tolerance > 0, stops early once no vertex moves more than
+    tolerance × mean edge length; the default 0.0 runs every iteration (stopping only at
+    a fixed point, which later iterations would not change).
+    """
+    if not interior_verts or influence <= 0.0 or iterations <= 0:
         return
+    # Local CSR over the moving verts (rows 0..k-1) and their pinned neighbours.
+    slot = {v: i for i, v in enumerate(interior_verts)}
+    verts = list(interior_verts)
+    nbr = []
+    counts = []
+    for v in interior_verts:
+        row = []
+        for e in v.link_edges:
+            ov = e.other_vert(v)
+            i = slot.get(ov)
+            if i is None:
+                i = slot[ov] = len(verts)
+                verts.append(ov)
+            row.append(i)
+        nbr.append(row)
+        counts.append(len(row))
+    k = len(interior_verts)
+    deg = np.array(counts, dtype=np.float64)
+    live = deg > 0
+    if not live.any():
+        return
+    nbr_idx = np.fromiter((i for row in nbr for i in row), dtype=np.int64, count=int(deg.sum()))
+    owner = np.repeat(np.arange(k), counts)
+    rows = np.nonzero(live)[0]
+    row_starts = (np.cumsum(deg) - deg).astype(np.int64)[rows]
+    pos = np.array([tuple(v.co) for v in verts], dtype=np.float64)
+    n = np.asarray(tuple(normal), dtype=np.float64)
+    n = n / max(float(np.linalg.norm(n)), 1e-30)
+    edge_vec = pos[nbr_idx] - pos[owner]
+    scale = float(np.sqrt(np.einsum("ij,ij->i", edge_vec, edge_vec)).mean()) if nbr_idx.size else 0.0
+    limit = tolerance * scale
+    inv_deg = 1.0 / deg[rows]
+
     for _ in range(iterations):
-        new_positions = {}
-        for v in interior_verts:
-            neighbors = [e.other_vert(v) for e in v.link_edges]
-            if not neighbors:
-                continue
-            avg_co = sum((n.co for n in neighbors), Vector((0, 0, 0))) / len(neighbors)
-            delta = avg_co - v.co
-            delta_2d = delta - delta.dot(normal) * normal
-            new_positions[v] = v.co + delta_2d * influence
-        for v, new_co in new_positions.items():
-            v.co = new_co
+        avg = np.add.reduceat(pos[nbr_idx], row_starts, axis=0) * inv_deg[:, None]
+        delta = avg - pos[rows]
+        delta -= np.outer(delta @ n, n)
+        step = delta * influence
+        pos[rows] += step
+        if float(np.abs(step).max()) <= limit:
+            break
+
+    for v, co in zip(interior_verts, pos[:k].tolist()):
+        v.co = co
 
 
 # ---------------------------------------------------------------------------
@@ -2053,33 +2033,44 @@ def _collect_seed_verts(bm: bmesh.types.BMesh) -> set:
     return seeds
 
 
-def bmesh_select_linked_island(mesh) -> bool:
+def _set_island_selection(bm: bmesh.types.BMesh, adj, islands: np.ndarray, state: bool) -> None:
+    """select_set(state) on the verts, edges and faces of islands whose state differs."""
+    if islands.size == 0:
+        return
+    bm.verts.ensure_lookup_table()
+    bm.edges.ensure_lookup_table()
+    bm.faces.ensure_lookup_table()
+    for seq, idx in (
+        (bm.verts, adj.island_verts(islands)),
+        (bm.edges, adj.island_edges(islands)),
+        (bm.faces, adj.island_faces(bm, islands)),
+    ):
+        for i in idx.tolist():
+            elem = seq[i]
+            if elem.select != state:
+                elem.select_set(state)
+
+
+def bmesh_select_linked_island(mesh, seed_indices=None) -> bool:
     """
     Select the full connected geometry island(s) containing the current selection.
     Does not depend on mesh_select_mode (unlike bpy.ops.mesh.select_linked).
+    seed_indices (vertex indices) skips scanning the selection when the caller knows it.
+    Island labels are cached per topology revision (mesh_adjacency); every vert, edge and
+    face of the seeded islands is checked, and only unselected ones are written.
     """
     bm = bmesh.from_edit_mesh(mesh)
     try:
-        seeds = _collect_seed_verts(bm)
-        if not seeds:
+        adj = mesh_adjacency.shared_adjacency(bm, mesh)
+        if seed_indices is None:
+            seed_indices = [v.index for v in _collect_seed_verts(bm)]
+        seed_idx = np.asarray(seed_indices, dtype=np.int64)
+        seed_idx = seed_idx[(seed_idx >= 0) & (seed_idx < adj.n_verts)]
+        if seed_idx.size == 0:
             return False
-        visited: set = set()
-        dq = deque(seeds)
-        while dq:
-            v = dq.popleft()
-            if v in visited:
-                continue
-            visited.add(v)
-            for e in v.link_edges:
-                ov = e.other_vert(v)
-                if ov not in visited:
-                    dq.append(ov)
-        for v in bm.verts:
-            v.select_set(v in visited)
-        for e in bm.edges:
-            e.select_set(e.verts[0] in visited and e.verts[1] in visited)
-        for f in bm.faces:
-            f.select_set(all(v in visited for v in f.verts))
+        # Fully selected verts do not imply selected edges / faces (edge / face select
+        # mode), so every seeded island is written.
+        _set_island_selection(bm, adj, adj.islands_of(seed_idx), True)
         bm.select_flush_mode()
         bmesh.update_edit_mesh(mesh)
         return True
@@ -2097,31 +2088,12 @@ def bmesh_subtract_linked_islands(mesh, old_vert_indices: set, new_vert_indices:
         return False
     bm = bmesh.from_edit_mesh(mesh)
     try:
-        bm.verts.ensure_lookup_table()
-        bm.edges.ensure_lookup_table()
-        bm.faces.ensure_lookup_table()
-        seeds = [bm.verts[i] for i in removed if 0 <= i < len(bm.verts)]
-        if not seeds:
+        n = len(bm.verts)
+        seed_idx = np.fromiter((i for i in removed if 0 <= i < n), dtype=np.int64)
+        if seed_idx.size == 0:
             return False
-        visited: set = set()
-        dq = deque(seeds)
-        while dq:
-            v = dq.popleft()
-            if v in visited:
-                continue
-            visited.add(v)
-            for e in v.link_edges:
-                ov = e.other_vert(v)
-                if ov not in visited:
-                    dq.append(ov)
-        remove_idx = {v.index for v in visited}
-        sel_idx = old_vert_indices - remove_idx
-        for v in bm.verts:
-            v.select_set(v.index in sel_idx)
-        for e in bm.edges:
-            e.select_set(e.verts[0].index in sel_idx and e.verts[1].index in sel_idx)
-        for f in bm.faces:
-            f.select_set(all(v.index in sel_idx for v in f.verts))
+        adj = mesh_adjacency.shared_adjacency(bm, mesh)
+        _set_island_selection(bm, adj, adj.islands_of(seed_idx), False)
         bm.select_flush_mode()
         bmesh.update_edit_mesh(mesh)
         return True
@@ -0,0 +1,159 @@
+"""Farthest pair (diameter) of a 3D point set, for Make Collinear / Make Coplanar endpoints.
+
+Small sets are compared exhaustively in NumPy blocks. Larger sets first take the extreme
+points along a fixed set of directions (hull vertices) to get a lower bound, then drop
+every point whose support-function upper bound cannot beat it; only the survivors are
+compared pairwise. The result is exact. Elongated selections (edge loops, strokes) prune
+to a handful of points. Coplanar survivors (e.g. a circle) use a 2D hull and rotating
+calipers; points spread over a sphere prune little and fall back to the blockwise scan.
+"""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+_EXACT_MAX = 1024
+# Point pairs compared per NumPy block in the exhaustive scan.
+_PAIR_BLOCK = 1 << 21
+# Points × directions evaluated per NumPy block.
+_PROJ_BLOCK = 1 << 20
+_N_DIRECTIONS = 128
+# Survivor count above which a coplanar set takes the 2D hull path.
+_PLANAR_MIN = 4096
+# Smallest / largest singular value ratio treated as coplanar.
+_PLANAR_RATIO = 1e-9
+# Every unit vector lies within ~13.8° of one of the 128 Fibonacci directions; 16° adds margin.
+_COS_COVER = math.cos(math.radians(16.0))
+
+
+def fibonacci_directions(k: int) -> np.ndarray:
+    """(k, 3) unit vectors spread evenly over the sphere."""
+    i = np.arange(k, dtype=np.float64) + 0.5
+    z = 1.0 - 2.0 * i / k
+    r = np.sqrt(1.0 - z * z)
+    phi = math.pi * (3.0 - math.sqrt(5.0)) * i
+    return np.stack((r * np.cos(phi), r * np.sin(phi), z), axis=1)
+
+
+_DIRECTIONS = fibonacci_directions(_N_DIRECTIONS)
+
+
+def _exhaustive_pair(points: np.ndarray) -> tuple[int, int, float]:
+    """(i, j, d²) with i < j; the first pair in (i, j) order wins ties, like a double loop."""
+    n = points.shape[0]
+    best = -1.0
+    pair = (0, 1)
+    col = np.arange(n)
+    step = max(1, _PAIR_BLOCK // n)
+    for s in range(0, n, step):
+        diff = points[s:s + step, None, :] - points[None, :, :]
+        d2 = np.einsum("ijk,ijk->ij", diff, diff)
+        d2[np.arange(s, s + d2.shape[0])[:, None] >= col[None, :]] = -1.0
+        r, c = divmod(int(np.argmax(d2)), n)
+        if d2[r, c] > best:
+            best = float(d2[r, c])
+            pair = (s + r, c)
+    return pair[0], pair[1], best
+
+
+def hull_2d(xy: np.ndarray) -> list[int]:
+    """Counter-clockwise convex hull (Andrew's monotone chain) as row indices of xy."""
+    order = np.lexsort((xy[:, 1], xy[:, 0])).tolist()
+    pts = xy.tolist()
+
+    def chain(seq):
+        out: list[int] = []
+        for k in seq:
+            x, y = pts[k]
+            while len(out) >= 2:
+                ax, ay = pts[out[-2]]
+                bx, by = pts[out[-1]]
+                if (bx - ax) * (y - ay) - (by - ay) * (x - ax) > 0.0:
+                    break
+                out.pop()
+            out.append(k)
+        return out
+
+    lower = chain(order)
+    upper = chain(reversed(order))
+    return lower[:-1] + upper[:-1]
+
+
+def _planar_pair(points: np.ndarray) -> tuple[int, int] | None:
+    """Rotating-calipers diameter when points are coplanar; None otherwise."""
+    _u, s, vt = np.linalg.svd(points - points.mean(axis=0), full_matrices=False)
+    if s[0] <= 0.0 or s[2] > s[0] * _PLANAR_RATIO:
+        return None
+    xy = points @ vt[:2].T
+    hull = hull_2d(xy)
+    h = len(hull)
+    if h < 3:
+        return (hull[0], hull[-1]) if h else None
+    hp = xy[hull].tolist()
+
+    def area(a, b, c):
+        return abs((b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0]))
+
+    best = -1.0
+    pair = (hull[0], hull[1])
+    j = 1
+    for i in range(h):
+        a, b = hp[i], hp[(i + 1) % h]
+        # Advance the antipodal vertex while it moves away from edge i.
+        while area(a, b, hp[(j + 1) % h]) > area(a, b, hp[j]):
+            j = (j + 1) % h
+        for k in (i, (i + 1) % h):
+            dx = hp[k][0] - hp[j][0]
+            dy = hp[k][1] - hp[j][1]
+            d2 = dx * dx + dy * dy
+            if d2 > best:
+                best = d2
+                pair = (hull[k], hull[j])
+    return pair
+
+
+def _projection_blocks(points: np.ndarray):
+    step = max(1, _PROJ_BLOCK // _N_DIRECTIONS)
+    for s in range(0, points.shape[0], step):
+        yield s, points[s:s + step] @ _DIRECTIONS.T
+
+
+def farthest_pair_indices(points: np.ndarray) -> tuple[int, int] | None:
+    """(i, j), i < j, of the two points farthest apart; None for fewer than two points."""
+    points = np.asarray(points, dtype=np.float64)
+    n = points.shape[0]
+    if n < 2:
+        return None
+    if n <= _EXACT_MAX:
+        i, j, _d2 = _exhaustive_pair(points)
+        return i, j
+
+    support = np.full(_N_DIRECTIONS, -np.inf)
+    extreme = np.zeros(_N_DIRECTIONS, dtype=np.int64)
+    for s, proj in _projection_blocks(points):
+        rows = np.argmax(proj, axis=0)
+        vals = proj[rows, np.arange(_N_DIRECTIONS)]
+        better = vals > support
+        support[better] = vals[better]
+        extreme[better] = rows[better] + s
+
+    cand = np.unique(extreme)
+    if cand.size < 2:
+        cand = np.array((0, 1))
+    ci, cj, best_d2 = _exhaustive_pair(points[cand])
+
+    # For every q: |p - q| * cos(cover) <= max_d (support(d) - d·p); drop points that cannot beat the candidates.
+    bound = math.sqrt(max(best_d2, 0.0)) * _COS_COVER
+    keep = np.zeros(n, dtype=bool)
+    for s, proj in _projection_blocks(points):
+        keep[s:s + proj.shape[0]] = (support[None, :] - proj).max(axis=1) > bound
+    keep[cand[[ci, cj]]] = True
+    survivors = np.nonzero(keep)[0]
+    if survivors.size >= _PLANAR_MIN:
+        planar = _planar_pair(points[survivors])
+        if planar is not None:
+            i, j = sorted(planar)
+            return int(survivors[i]), int(survivors[j])
+    i, j, _d2 = _exhaustive_pair(points[survivors])
+    return int(survivors[i]), int(survivors[j])
@@ -0,0 +1,221 @@
+"""Shared screen-space hover picking for edit-mesh modals (uniform grid over projected geometry).
+
+One index per (bmesh, view, object matrix, geometry revision) is built with a single NumPy
+projection pass and reused across modal ticks and across operators; hover queries only
+touch grid cells near the mouse. The revision is bumped by depsgraph_update_handler on
+geometry updates and by invalidate() right after in-modal bmesh edits.
+"""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from . import mesh_arrays
+
+_CELL_PX = 16.0
+# Screen margin around the region that is still bucketed (mouse may sit slightly outside).
+_MARGIN_PX = 64.0
+# Segments spanning more cells than this are checked on every query instead of bucketed.
+_LONG_SEGMENT_CELLS = 64
+
+_revision = 0
+
+
+def invalidate() -> None:
+    """Mark cached hover indexes stale (call after editing the bmesh inside a modal)."""
+    global _revision
+    _revision += 1
+
+
+def depsgraph_update_handler(scene, depsgraph=None):
+    """Bump the revision when any evaluated geometry changed."""
+    if depsgraph is None:
+        invalidate()
+        return
+    try:
+        for update in depsgraph.updates:
+            if update.is_updated_geometry:
+                invalidate()
+                return
+    except Exception:
+        invalidate()
+
+
+class _CellBuckets:
+    """CSR buckets: items of cell c are ids[starts[c]:starts[c + 1]]."""
+
+    __slots__ = ("ids", "starts")
+
+    def __init__(self, cells: np.ndarray, ids: np.ndarray, n_cells: int) -> None:
+        order = np.argsort(cells, kind="stable")
+        self.ids = ids[order]
+        self.starts = np.searchsorted(cells[order], np.arange(n_cells + 1))
+
+    def gather(self, cell_ids: np.ndarray) -> np.ndarray:
+        return self.ids[mesh_arrays.concat_ranges(self.starts[cell_ids], self.starts[cell_ids + 1])]
+
+
+class HoverPickIndex:
+    """Uniform-grid index of projected verts (points) and edges (segments) of one bmesh."""
+
+    def __init__(self) -> None:
+        self._bm = None
+        self._key: tuple = ()
+        self._x0 = self._y0 = 0.0
+        self._cols = self._rows = 0
+        self._vert_xy = np.empty((0, 2), dtype=np.float64)
+        self._vert_ok = np.zeros(0, dtype=bool)
+        self._vert_cells: _CellBuckets | None = None
+        self._edge_a = np.empty((0, 2), dtype=np.float64)
+        self._edge_b = np.empty((0, 2), dtype=np.float64)
+        self._edge_ok = np.zeros(0, dtype=bool)
+        self._edge_cells: _CellBuckets | None = None
+        self._edge_long = np.empty(0, dtype=np.int64)
+
+    def clear(self) -> None:
+        self.__init__()
+
+    def _cell_xy(self, xy: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        cx = np.floor((xy[..., 0] - self._x0) / _CELL_PX).astype(np.int64)
+        cy = np.floor((xy[..., 1] - self._y0) / _CELL_PX).astype(np.int64)
+        return np.clip(cx, 0, self._cols - 1), np.clip(cy, 0, self._rows - 1)
+
+    def _in_grid(self, xy: np.ndarray) -> np.ndarray:
+        return (
+            (xy[..., 0] >= self._x0)
+            & (xy[..., 0] < self._x0 + self._cols * _CELL_PX)
+            & (xy[..., 1] >= self._y0)
+            & (xy[..., 1] < self._y0 + self._rows * _CELL_PX)
+        )
+
+    def ensure(self, bm, mw, region, rv3d) -> None:
+        key = (
+            _revision,
+            len(bm.verts),
+            len(bm.edges),
+            mesh_arrays.view_cache_key(region, rv3d),
+            mesh_arrays.matrix_key(mw),
+        )
+        if self._bm is bm and key == self._key and bm.is_valid:
+            return
+
+        bm.verts.index_update()
+        bm.edges.index_update()
+        world = mesh_arrays.transform_points(mw, mesh_arrays.bmesh_vert_coords(bm))
+        vert_xy, vert_ok = mesh_arrays.project_points_to_region(region, rv3d, world)
+        ev = mesh_arrays.bmesh_edge_vert_indices(bm)
+
+        self._x0 = -_MARGIN_PX
+        self._y0 = -_MARGIN_PX
+        self._cols = max(1, int(math.ceil((region.width + 2.0 * _MARGIN_PX) / _CELL_PX)))
+        self._rows = max(1, int(math.ceil((region.height + 2.0 * _MARGIN_PX) / _CELL_PX)))
+        n_cells = self._cols * self._rows
+
+        self._vert_xy = vert_xy
+        self._vert_ok = vert_ok
+        vids = np.nonzero(vert_ok & self._in_grid(vert_xy))[0]
+        cx, cy = self._cell_xy(vert_xy[vids])
+        self._vert_cells = _CellBuckets(cy * self._cols + cx, vids, n_cells)
+
+        a = vert_xy[ev[:, 0]]
+        b = vert_xy[ev[:, 1]]
+        d = b - a
+        edge_ok = vert_ok[ev[:, 0]] & vert_ok[ev[:, 1]]
+        edge_ok[edge_ok] = np.einsum("ij,ij->i", d[edge_ok], d[edge_ok]) >= 1e-6
+        self._edge_a = a
+        self._edge_b = b
+        self._edge_ok = edge_ok
+
+        eids = np.nonzero(edge_ok)[0]
+        lo = np.minimum(a[eids], b[eids])
+        hi = np.maximum(a[eids], b[eids])
+        grid_hi = (self._x0 + self._cols * _CELL_PX, self._y0 + self._rows * _CELL_PX)
+        overlaps = (
+            (hi[:, 0] >= self._x0) & (lo[:, 0] < grid_hi[0])
+            & (hi[:, 1] >= self._y0) & (lo[:, 1] < grid_hi[1])
+        )
+        eids, lo, hi = eids[overlaps], lo[overlaps], hi[overlaps]
+        cx0, cy0 = self._cell_xy(lo)
+        cx1, cy1 = self._cell_xy(hi)
+        nx = cx1 - cx0 + 1
+        ny = cy1 - cy0 + 1
+        spans = nx * ny
+        is_long = spans > _LONG_SEGMENT_CELLS
+        self._edge_long = eids[is_long]
+        short = ~is_long
+        eids, cx0, cy0, nx, spans = eids[short], cx0[short], cy0[short], nx[short], spans[short]
+        rep = np.repeat(np.arange(eids.shape[0]), spans)
+        k = np.arange(rep.shape[0]) - np.repeat(np.cumsum(spans) - spans, spans)
+        cells = (cy0[rep] + k // nx[rep]) * self._cols + (cx0[rep] + k % nx[rep])
+        self._edge_cells = _CellBuckets(cells, eids[rep], n_cells)
+
+        self._bm = bm
+        self._key = key
+
+    def _near_cells(self, mx: float, my: float, radius: float) -> np.ndarray | None:
+        """Cell ids within radius of the mouse, or None when the mouse is outside the grid."""
+        if not bool(self._in_grid(np.array((mx, my)))):
+            return None
+        cx0, cy0 = self._cell_xy(np.array((mx - radius, my - radius)))
+        cx1, cy1 = self._cell_xy(np.array((mx + radius, my + radius)))
+        xs = np.arange(int(cx0), int(cx1) + 1)
+        ys = np.arange(int(cy0), int(cy1) + 1)
+        return (ys[:, None] * self._cols + xs[None, :]).ravel()
+
+    def pick_edge(self, mouse_xy, threshold_px: float, exclude_indices=()) -> tuple[int, float, float] | None:
+        """(edge index, t along edge on screen, d² px) of the closest edge within threshold."""
+        mx, my = float(mouse_xy[0]), float(mouse_xy[1])
+        cells = self._near_cells(mx, my, threshold_px)
+        if cells is None or self._edge_cells is None:
+            cand = np.nonzero(self._edge_ok)[0]
+        else:
+            cand = np.unique(np.concatenate((self._edge_cells.gather(cells), self._edge_long)))
+        if exclude_indices:
+            cand = cand[~np.isin(cand, np.fromiter(exclude_indices, dtype=np.int64))]
+        if cand.size == 0:
+            return None
+        a = self._edge_a[cand]
+        d = self._edge_b[cand] - a
+        m = np.array((mx, my)) - a
+        t = np.clip(np.einsum("ij,ij->i", m, d) / np.einsum("ij,ij->i", d, d), 0.0, 1.0)
+        e = m - t[:, None] * d
+        d2 = np.einsum("ij,ij->i", e, e)
+        best = int(np.argmin(d2))
+        if not d2[best] < float(threshold_px) * float(threshold_px):
+            return None
+        return int(cand[best]), float(t[best]), float(d2[best])
+
+    def pick_vert(self, mouse_xy, threshold_px: float, exclude_indices=()) -> tuple[int, float] | None:
+        """(vert index, d² px) of the closest projected vertex within threshold."""
+        mx, my = float(mouse_xy[0]), float(mouse_xy[1])
+        cells = self._near_cells(mx, my, threshold_px)
+        if cells is None or self._vert_cells is None:
+            cand = np.nonzero(self._vert_ok)[0]
+        else:
+            cand = np.sort(self._vert_cells.gather(cells))
+        if exclude_indices:
+            cand = cand[~np.isin(cand, np.fromiter(exclude_indices, dtype=np.int64))]
+        if cand.size == 0:
+            return None
+        delta = self._vert_xy[cand] - (mx, my)
+        d2 = np.einsum("ij,ij->i", delta, delta)
+        best = int(np.argmin(d2))
+        if not d2[best] < float(threshold_px) * float(threshold_px):
+            return None
+        return int(cand[best]), float(d2[best])
+
+
+_shared = HoverPickIndex()
+
+
+def shared_index(bm, mw, region, rv3d) -> HoverPickIndex:
+    """The process-wide picking index, refreshed for this bmesh / view if stale."""
+    _shared.ensure(bm, mw, region, rv3d)
+    return _shared
+
+
+def clear() -> None:
+    """Drop the shared index and bump the revision (unregister, file load)."""
+    _shared.clear()
+    invalidate()
@@ -0,0 +1,211 @@
+"""Compressed-sparse-row vertex adjacency for bmesh topology walks (falloff, linked islands).
+
+Built from edge index arrays in one pass: for vertex v, its neighbours are
+nbr[indptr[v]:indptr[v + 1]] reached over edges nbr_edge[...]. Face incidence is added
+lazily. shared_adjacency() keeps one instance per (mesh, topology revision); the revision
+is bumped by depsgraph_update_handler on geometry updates and by invalidate() after
+in-operator topology edits. Walks (depth-limited BFS, component labels) are vectorised.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from . import mesh_arrays
+
+_revision = 0
+
+
+def invalidate() -> None:
+    """Mark cached adjacency stale (call after changing bmesh topology inside an operator)."""
+    global _revision
+    _revision += 1
+
+
+def depsgraph_update_handler(scene, depsgraph=None):
+    """Bump the revision when any evaluated geometry changed."""
+    if depsgraph is None:
+        invalidate()
+        return
+    try:
+        for update in depsgraph.updates:
+            if update.is_updated_geometry:
+                invalidate()
+                return
+    except Exception:
+        invalidate()
+
+
+def _bmesh_face_arrays(bm) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(F + 1) face starts, flat face vert indices and flat face edge indices (loop order)."""
+    n = len(bm.faces)
+    sizes = np.fromiter((len(f.verts) for f in bm.faces), dtype=np.int64, count=n)
+    starts = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(sizes, out=starts[1:])
+    total = int(starts[-1])
+    face_verts = np.fromiter((l.vert.index for f in bm.faces for l in f.loops), dtype=np.int64, count=total)
+    face_edges = np.fromiter((l.edge.index for f in bm.faces for l in f.loops), dtype=np.int64, count=total)
+    return starts, face_verts, face_edges
+
+
+class MeshAdjacency:
+    """Vertex adjacency (CSR) with lazily built face incidence for one topology state."""
+
+    def __init__(self, n_verts: int, edge_verts: np.ndarray) -> None:
+        self.n_verts = int(n_verts)
+        self.edge_verts = edge_verts
+        n_edges = edge_verts.shape[0]
+        src = np.concatenate((edge_verts[:, 0], edge_verts[:, 1]))
+        dst = np.concatenate((edge_verts[:, 1], edge_verts[:, 0]))
+        eid = np.concatenate((np.arange(n_edges), np.arange(n_edges)))
+        order = np.argsort(src, kind="stable")
+        self.nbr = dst[order]
+        self.nbr_edge = eid[order]
+        self.indptr = np.searchsorted(src[order], np.arange(self.n_verts + 1))
+        self._faces: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+        self._edge_face_count: np.ndarray | None = None
+        self._labels: np.ndarray | None = None
+        self._island_index: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+
+    @classmethod
+    def from_bmesh(cls, bm) -> MeshAdjacency:
+        bm.verts.index_update()
+        bm.edges.index_update()
+        bm.faces.index_update()
+        return cls(len(bm.verts), mesh_arrays.bmesh_edge_vert_indices(bm))
+
+    def faces(self, bm) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(face starts, face verts, face edges); read from bm (same topology) on first use."""
+        if self._faces is None:
+            self._faces = _bmesh_face_arrays(bm)
+        return self._faces
+
+    def edge_face_count(self, bm) -> np.ndarray:
+        """(E,) number of faces using each edge (1 = boundary / open edge)."""
+        if self._edge_face_count is None:
+            self._edge_face_count = np.bincount(self.faces(bm)[2], minlength=self.edge_verts.shape[0])
+        return self._edge_face_count
+
+    def _neighbour_rows(self, verts: np.ndarray) -> np.ndarray:
+        return mesh_arrays.concat_ranges(self.indptr[verts], self.indptr[verts + 1])
+
+    def bfs_depth(self, seeds, max_depth: int = 0, edge_mask: np.ndarray | None = None) -> np.ndarray:
+        """(V,) edge steps from the nearest seed (-1 unreached); max_depth 0 = unlimited."""
+        depth = np.full(self.n_verts, -1, dtype=np.int32)
+        frontier = np.unique(np.asarray(seeds, dtype=np.int64))
+        depth[frontier] = 0
+        level = 0
+        while frontier.size and (max_depth <= 0 or level < max_depth):
+            rows = self._neighbour_rows(frontier)
+            if edge_mask is not None:
+                rows = rows[edge_mask[self.nbr_edge[rows]]]
+            nxt = self.nbr[rows]
+            frontier = np.unique(nxt[depth[nxt] < 0])
+            level += 1
+            depth[frontier] = level
+        return depth
+
+    def component_labels(self, edge_mask: np.ndarray | None = None) -> np.ndarray:
+        """(V,) smallest vertex index of each vertex's connected component (over edge_mask edges)."""
+        parent = np.arange(self.n_verts)
+        ev = self.edge_verts if edge_mask is None else self.edge_verts[edge_mask]
+        if ev.shape[0] == 0:
+            return parent
+        u, v = ev[:, 0], ev[:, 1]
+        while True:
+            pu, pv = parent[u], parent[v]
+            diff = pu != pv
+            if not diff.any():
+                return parent
+            # Hook the larger root under the smaller one, then compress paths fully.
+            np.minimum.at(parent, np.maximum(pu[diff], pv[diff]), np.minimum(pu[diff], pv[diff]))
+            while True:
+                grand = parent[parent]
+                if np.array_equal(grand, parent):
+                    break
+                parent = grand
+
+    def reachable(self, seeds, max_depth: int = 0, edge_mask: np.ndarray | None = None) -> np.ndarray:
+        """(V,) bool: vertices within max_depth edges of a seed (0 = whole connected islands)."""
+        seeds = np.asarray(seeds, dtype=np.int64)
+        if max_depth > 0:
+            return self.bfs_depth(seeds, max_depth, edge_mask) >= 0
+        if seeds.size == 0:
+            return np.zeros(self.n_verts, dtype=bool)
+        labels = self.component_labels(edge_mask)
+        hit = np.zeros(self.n_verts, dtype=bool)
+        hit[labels[seeds]] = True
+        return hit[labels]
+
+    def island_labels(self) -> np.ndarray:
+        """(V,) component labels over all edges, computed once per topology state."""
+        if self._labels is None:
+            self._labels = self.component_labels()
+        return self._labels
+
+    def _members(self, kind: str, element_labels, islands) -> np.ndarray:
+        """Indices of elements whose label is in islands (elements grouped by label once)."""
+        index = self._island_index.get(kind)
+        if index is None:
+            element_labels = element_labels()
+            order = np.argsort(element_labels, kind="stable")
+            index = self._island_index[kind] = (order, element_labels[order])
+        order, sorted_labels = index
+        islands = np.asarray(islands, dtype=np.int64)
+        starts = np.searchsorted(sorted_labels, islands, side="left")
+        ends = np.searchsorted(sorted_labels, islands, side="right")
+        return order[mesh_arrays.concat_ranges(starts, ends)]
+
+    def island_verts(self, islands) -> np.ndarray:
+        return self._members("verts", self.island_labels, islands)
+
+    def island_edges(self, islands) -> np.ndarray:
+        return self._members("edges", lambda: self.island_labels()[self.edge_verts[:, 0]], islands)
+
+    def island_faces(self, bm, islands) -> np.ndarray:
+        def face_labels():
+            starts, face_verts, _face_edges = self.faces(bm)
+            return self.island_labels()[face_verts[starts[:-1]]]
+        return self._members("faces", face_labels, islands)
+
+    def islands_of(self, verts) -> np.ndarray:
+        """Unique island labels of the given vertex indices."""
+        return np.unique(self.island_labels()[np.asarray(verts, dtype=np.int64)])
+
+    def edges_within(self, vert_mask: np.ndarray) -> np.ndarray:
+        """(E,) bool: both edge verts in vert_mask."""
+        return vert_mask[self.edge_verts[:, 0]] & vert_mask[self.edge_verts[:, 1]]
+
+    def faces_within(self, bm, vert_mask: np.ndarray) -> np.ndarray:
+        """(F,) bool: every face vert in vert_mask."""
+        starts, face_verts, _face_edges = self.faces(bm)
+        if starts.shape[0] <= 1:
+            return np.zeros(0, dtype=bool)
+        return np.logical_and.reduceat(vert_mask[face_verts], starts[:-1])
+
+
+_shared: MeshAdjacency | None = None
+_shared_key: tuple = ()
+
+
+def shared_adjacency(bm, mesh=None) -> MeshAdjacency:
+    """Cached adjacency for the edit bmesh of mesh; without mesh it is built uncached."""
+    global _shared, _shared_key
+    if mesh is None:
+        return MeshAdjacency.from_bmesh(bm)
+    key = (mesh.as_pointer(), _revision, len(bm.verts), len(bm.edges), len(bm.faces))
+    if _shared is None or key != _shared_key:
+        _shared = MeshAdjacency.from_bmesh(bm)
+        _shared_key = key
+    else:
+        bm.verts.index_update()
+        bm.edges.index_update()
+        bm.faces.index_update()
+    return _shared
+
+
+def clear() -> None:
+    """Drop the shared adjacency and bump the revision (unregister, file load)."""
+    global _shared, _shared_key
+    _shared = None
+    _shared_key = ()
+    invalidate()
@@ -0,0 +1,137 @@
+"""NumPy snapshots of mesh / bmesh data and batched view projection (no Blender classes here)."""
+from __future__ import annotations
+
+import numpy as np
+
+_EMPTY_CO = np.empty((0, 3), dtype=np.float64)
+_EMPTY_EDGES = np.empty((0, 2), dtype=np.int64)
+
+
+def concat_ranges(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Concatenate arange(s, e) for each pair without a Python loop."""
+    lens = ends - starts
+    total = int(lens.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    offsets = np.repeat(starts - (np.cumsum(lens) - lens), lens)
+    return offsets + np.arange(total)
+
+
+def bmesh_vert_coords(bm) -> np.ndarray:
+    """(N, 3) float64 local coordinates of bm.verts, in index order."""
+    n = len(bm.verts)
+    if n == 0:
+        return _EMPTY_CO.copy()
+    flat = np.fromiter((c for v in bm.verts for c in v.co), dtype=np.float64, count=n * 3)
+    return flat.reshape(n, 3)
+
+
+def bmesh_edge_vert_indices(bm) -> np.ndarray:
+    """(E, 2) int64 vertex indices of bm.edges (requires valid vert indices)."""
+    n = len(bm.edges)
+    if n == 0:
+        return _EMPTY_EDGES.copy()
+    flat = np.fromiter((v.index for e in bm.edges for v in e.verts), dtype=np.int64, count=n * 2)
+    return flat.reshape(n, 2)
+
+
+def mesh_vert_coords(mesh) -> np.ndarray:
+    """(N, 3) float64 coordinates of a Mesh datablock via foreach_get."""
+    n = len(mesh.vertices)
+    if n == 0:
+        return _EMPTY_CO.copy()
+    coords = np.empty(n * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    return coords.reshape(n, 3).astype(np.float64)
+
+
+def matrix_np(matrix) -> np.ndarray:
+    """mathutils Matrix → row-major float64 array (same layout as matrix[i][j])."""
+    return np.array(matrix, dtype=np.float64)
+
+
+def transform_points(matrix, points: np.ndarray) -> np.ndarray:
+    """Apply a 4x4 affine matrix to (N, 3) points."""
+    m = matrix if isinstance(matrix, np.ndarray) else matrix_np(matrix)
+    return points @ m[:3, :3].T + m[:3, 3]
+
+
+def view_cache_key(region, rv3d) -> tuple:
+    """Hashable identity of a region's current view (matrices + size) for projection caches."""
+    if region is None or rv3d is None:
+        return ()
+    try:
+        vm = tuple(rv3d.view_matrix[i][j] for i in range(4) for j in range(4))
+        pm = tuple(rv3d.perspective_matrix[i][j] for i in range(4) for j in range(4))
+        return (id(region), vm, pm, region.width, region.height)
+    except Exception:
+        return (id(region),)
+
+
+def matrix_key(matrix) -> tuple:
+    """Hashable tuple of a 4x4 matrix (e.g. object matrix_world) for cache keys."""
+    try:
+        return tuple(matrix[i][j] for i in range(4) for j in range(4))
+    except Exception:
+        return ()
+
+
+def project_points_to_region(region, rv3d, world_xyz: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Batched location_3d_to_region_2d.
+
+    Returns ((N, 2) region pixel coords, (N,) bool mask of points in front of the view).
+    Masked-out rows are left as NaN (same cull rule as Blender: clip w <= 0).
+    """
+    n = world_xyz.shape[0]
+    screen = np.full((n, 2), np.nan, dtype=np.float64)
+    if n == 0:
+        return screen, np.zeros(0, dtype=bool)
+    pm = matrix_np(rv3d.perspective_matrix)
+    clip = world_xyz @ pm[:, :3].T + pm[:, 3]
+    w = clip[:, 3]
+    ok = w > 0.0
+    if not ok.any():
+        return screen, ok
+    half_w = region.width / 2.0
+    half_h = region.height / 2.0
+    inv_w = 1.0 / w[ok]
+    screen[ok, 0] = half_w + half_w * clip[ok, 0] * inv_w
+    screen[ok, 1] = half_h + half_h * clip[ok, 1] * inv_w
+    return screen, ok
+
+
+def boxes_in_view(region, rv3d, corners_w: np.ndarray, margin_px: float = 0.0) -> np.ndarray:
+    """(M,) bool: world boxes given as (M, 8, 3) corners that may project inside the region.
+
+    Homogeneous clip-space half-space tests (left/right/bottom/top widened by margin_px,
+    plus w > 0); a box is culled only when all eight corners fail the same test.
+    """
+    m = corners_w.shape[0]
+    if m == 0:
+        return np.zeros(0, dtype=bool)
+    pm = matrix_np(rv3d.perspective_matrix)
+    clip = corners_w @ pm[:, :3].T + pm[:, 3]
+    x = clip[..., 0]
+    y = clip[..., 1]
+    w = clip[..., 3]
+    kx = 1.0 + 2.0 * margin_px / max(float(region.width), 1.0)
+    ky = 1.0 + 2.0 * margin_px / max(float(region.height), 1.0)
+    outside = (
+        (x > kx * w).all(axis=1)
+        | (x < -kx * w).all(axis=1)
+        | (y > ky * w).all(axis=1)
+        | (y < -ky * w).all(axis=1)
+        | (w <= 0.0).all(axis=1)
+    )
+    return ~outside
+
+
+def project_points_onto_plane(points: np.ndarray, plane_co, plane_n) -> np.ndarray:
+    """Perpendicular projection of (N, 3) points onto the plane (plane_co, plane_n)."""
+    n = np.asarray(plane_n, dtype=np.float64)
+    ln = float(np.linalg.norm(n))
+    if ln < 1e-20:
+        return points.copy()
+    n = n / ln
+    dist = (points - np.asarray(plane_co, dtype=np.float64)) @ n
+    return points - dist[:, None] * n
@@ -0,0 +1,142 @@
+"""Minimum-volume oriented bounding box of a point set (BBox helpers, Oriented mode).
+
+Works on convex-hull vertices (see convex_hull), so every candidate orientation costs one
+(K, H, 3) projection. Seeds are the principal axes plus boxes spun about a fixed set of
+up directions; the best seeds and the principal frame are refined by a shrinking-step
+rotation search about their own axes and diagonals. The objective multiplies the extents padded by a tiny fraction of the
+spread, so flat input still minimises its in-plane area. Not provably optimal (O'Rourke's
+exact method is cubic), but face-aligned boxes of rotated box-like geometry are found to
+about a thousandth of a degree.
+"""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from .farthest_pair import fibonacci_directions
+
+_N_UP = 48
+_N_SPIN = 18
+# Seeds refined by the local search.
+_N_REFINE = 2
+_START_STEP = math.radians(2.5)
+_MIN_STEP = 1e-5
+# Orientations × points projected per NumPy block.
+_PROJ_BLOCK = 1 << 20
+# Extent padding (relative to the spread) used by the objective.
+_FLAT_PAD = 1e-6
+
+
+def _frames_about(up: np.ndarray) -> np.ndarray:
+    """(U, 3, 3) right-handed frames whose third row is up[u]."""
+    helper = np.where(np.abs(up[:, :1]) < 0.9, [[1.0, 0.0, 0.0]], [[0.0, 1.0, 0.0]])
+    e1 = np.cross(helper, up)
+    e1 /= np.linalg.norm(e1, axis=1)[:, None]
+    e2 = np.cross(up, e1)
+    return np.stack((e1, e2, up), axis=1)
+
+
+def _spin(frames: np.ndarray, angles: np.ndarray) -> np.ndarray:
+    """(U * A, 3, 3) frames rotated about their third axis by every angle."""
+    c, s = np.cos(angles), np.sin(angles)
+    e1 = c[None, :, None] * frames[:, None, 0] + s[None, :, None] * frames[:, None, 1]
+    e2 = -s[None, :, None] * frames[:, None, 0] + c[None, :, None] * frames[:, None, 1]
+    e3 = np.broadcast_to(frames[:, None, 2], e1.shape)
+    return np.stack((e1, e2, e3), axis=2).reshape(-1, 3, 3)
+
+
+def _axis_rotations(axes: np.ndarray, angles: np.ndarray) -> np.ndarray:
+    """(K, 3, 3) Rodrigues rotations about unit axes[k] by angles[k]."""
+    x, y, z = axes[:, 0], axes[:, 1], axes[:, 2]
+    c, s = np.cos(angles), np.sin(angles)
+    t = 1.0 - c
+    return np.stack((
+        np.stack((t * x * x + c, t * x * y - s * z, t * x * z + s * y), axis=1),
+        np.stack((t * x * y + s * z, t * y * y + c, t * y * z - s * x), axis=1),
+        np.stack((t * x * z - s * y, t * y * z + s * x, t * z * z + c), axis=1),
+    ), axis=1)
+
+
+def _extents(points: np.ndarray, frames: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """(K, 3) min and max of points projected on each frame's rows."""
+    mn = np.empty((frames.shape[0], 3), dtype=np.float64)
+    mx = np.empty_like(mn)
+    step = max(1, _PROJ_BLOCK // max(points.shape[0] * 3, 1))
+    for s in range(0, frames.shape[0], step):
+        proj = np.einsum("hj,kij->khi", points, frames[s:s + step])
+        mn[s:s + step] = proj.min(axis=1)
+        mx[s:s + step] = proj.max(axis=1)
+    return mn, mx
+
+
+def _move_axes() -> np.ndarray:
+    combos = [c for c in np.ndindex(3, 3, 3) if any(c)]
+    moves = np.array(combos, dtype=np.float64) - 1.0
+    moves = moves[np.abs(moves).sum(axis=1) > 0]
+    return moves / np.linalg.norm(moves, axis=1)[:, None]
+
+
+_MOVES = _move_axes()
+
+
+def _cost(mn: np.ndarray, mx: np.ndarray, pad: float) -> np.ndarray:
+    return np.prod(mx - mn + pad, axis=1)
+
+
+def _refine(points: np.ndarray, frame: np.ndarray, cost: float, pad: float) -> tuple[np.ndarray, float]:
+    """Pattern search over rotations about the frame's axes and diagonals, halving the step when stuck."""
+    step = _START_STEP
+    while step > _MIN_STEP:
+        # Box axes and their pairwise / body diagonals, both senses.
+        axes = _MOVES @ frame
+        rot = _axis_rotations(axes, np.full(axes.shape[0], step))
+        cand = rot @ frame.T
+        cand = np.transpose(cand, (0, 2, 1))
+        mn, mx = _extents(points, cand)
+        c = _cost(mn, mx, pad)
+        k = int(np.argmin(c))
+        if c[k] < cost * (1.0 - 1e-12):
+            frame, cost = cand[k], float(c[k])
+        else:
+            step *= 0.5
+    return frame, cost
+
+
+def minimum_volume_box(points: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+    """
+    (rows, mn, mx): right-handed orthonormal box axes as rows and the point extents along
+    them (box coordinates = points @ rows.T). None for an empty set.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if points.shape[0] == 0:
+        return None
+    origin = points.mean(axis=0)
+    local = points - origin
+    spread = float(np.abs(local).max())
+    if spread <= 0.0:
+        rows = np.eye(3)
+        return rows, points[0] @ rows.T, points[0] @ rows.T
+    pad = spread * _FLAT_PAD
+
+    _w, pca = np.linalg.eigh(local.T @ local)
+    ups = np.concatenate((pca.T, fibonacci_directions(_N_UP)))
+    seeds = _spin(_frames_about(ups), np.arange(_N_SPIN) * (0.5 * math.pi / _N_SPIN))
+    seeds = np.concatenate((seeds, pca.T[None]))
+    seeds[np.linalg.det(seeds) < 0.0, 2] *= -1.0
+    mn, mx = _extents(local, seeds)
+    costs = _cost(mn, mx, pad)
+
+    best_frame, best_cost = seeds[-1], float(costs[-1])
+    for k in np.argsort(costs, kind="stable")[:_N_REFINE].tolist() + [seeds.shape[0] - 1]:
+        frame, cost = _refine(local, seeds[k], float(costs[k]), pad)
+        if cost < best_cost:
+            best_frame, best_cost = frame, cost
+
+    # Re-orthonormalise after the rotation steps.
+    u, _s, vt = np.linalg.svd(best_frame)
+    rows = u @ vt
+    if np.linalg.det(rows) < 0.0:
+        rows[2] *= -1.0
+    proj = points @ rows.T
+    return rows, proj.min(axis=0), proj.max(axis=0)
@@ -0,0 +1,29 @@
+"""Float32 vertex buffers for viewport line overlays (Distribute wires and dimension cotes).
+
+Pure NumPy with no gpu import, so the packing can be exercised headless. drawing_tools
+turns the buffers into cached GPU batches that are only rebuilt when the data changes.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+# Corner pairs of the 12 box edges (bottom loop 0-3, top loop 4-7, then the verticals).
+CUBE_EDGES = np.array(
+    (
+        (0, 1), (1, 2), (2, 3), (3, 0),
+        (4, 5), (5, 6), (6, 7), (7, 4),
+        (0, 4), (1, 5), (2, 6), (3, 7),
+    ),
+    dtype=np.int64,
+)
+
+
+def box_wire_lines(corners) -> np.ndarray:
+    """(B * 24, 3) float32 LINES vertices for the 12 edges of each 8-corner box."""
+    corners = np.asarray(corners, dtype=np.float32).reshape(-1, 8, 3)
+    return np.ascontiguousarray(corners[:, CUBE_EDGES.ravel()].reshape(-1, 3))
+
+
+def segment_lines(segments) -> np.ndarray:
+    """(2S, 3) float32 LINES vertices from (start, end) point pairs."""
+    return np.ascontiguousarray(np.asarray(segments, dtype=np.float32).reshape(-1, 3))
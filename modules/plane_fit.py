@@ -0,0 +1,120 @@
+"""Plane fitting for Make Coplanar (mesh and curve): least squares, robust variants, legacy three-point.
+
+Fits take (N, 3) float64 point arrays and return (point on plane, unit normal) as NumPy
+arrays, or None when the points do not define a plane (fewer than 3, coincident or
+collinear). Fits are O(n); the legacy three-point pick returns indices into the input.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from .farthest_pair import farthest_pair_indices
+
+FIT_LEAST_SQUARES = 'NONE'
+FIT_TRIMMED = 'TRIMMED'
+FIT_RANSAC = 'RANSAC'
+
+# Smallest / middle singular value ratio below which the spread is treated as a line.
+_COLLINEAR_RATIO = 1e-6
+_TRIM_KEEP = 0.8
+_TRIM_ROUNDS = 3
+# With half the points outliers, 64 triples miss an all-inlier sample with p ≈ 2e-4.
+_RANSAC_HYPOTHESES = 64
+# Hypotheses × points evaluated per NumPy block when scoring sampled planes.
+_RANSAC_BLOCK = 4_000_000
+
+
+def _svd_plane(points: np.ndarray) -> tuple[np.ndarray, np.ndarray] | None:
+    """Centroid and smallest principal axis of the covariance."""
+    if points.shape[0] < 3:
+        return None
+    centroid = points.mean(axis=0)
+    _u, s, vt = np.linalg.svd(points - centroid, full_matrices=False)
+    if s[0] <= 1e-12 or s[1] <= s[0] * _COLLINEAR_RATIO:
+        return None
+    return centroid, vt[2]
+
+
+def _trimmed_plane(points: np.ndarray) -> tuple[np.ndarray, np.ndarray] | None:
+    """Refit on the _TRIM_KEEP fraction of points closest to the previous plane."""
+    fit = _svd_plane(points)
+    if fit is None:
+        return None
+    keep = max(3, int(points.shape[0] * _TRIM_KEEP))
+    for _ in range(_TRIM_ROUNDS):
+        if keep >= points.shape[0]:
+            break
+        dist = np.abs((points - fit[0]) @ fit[1])
+        refit = _svd_plane(points[np.argpartition(dist, keep - 1)[:keep]])
+        if refit is None:
+            break
+        fit = refit
+    return fit
+
+
+def _ransac_plane(points: np.ndarray, seed: int = 0) -> tuple[np.ndarray, np.ndarray] | None:
+    """Random point triples scored by median residual (LMedS), refit by least squares on inliers.
+
+    Needs no distance threshold and tolerates up to half the points being outliers;
+    sampling is seeded so redo gives the same plane.
+    """
+    fit = _svd_plane(points)
+    if fit is None:
+        return None
+    n = points.shape[0]
+    if n <= 3:
+        return fit
+    extent = float(np.ptp(points, axis=0).max())
+
+    rng = np.random.default_rng(seed)
+    triples = np.stack([rng.choice(n, 3, replace=False) for _ in range(_RANSAC_HYPOTHESES)])
+    p0 = points[triples[:, 0]]
+    normals = np.cross(points[triples[:, 1]] - p0, points[triples[:, 2]] - p0)
+    length = np.linalg.norm(normals, axis=1)
+    valid = length > extent * extent * 1e-9
+    if not valid.any():
+        return fit
+    p0, normals = p0[valid], normals[valid] / length[valid, None]
+    offsets = np.einsum("ij,ij->i", p0, normals)
+
+    block = max(1, _RANSAC_BLOCK // n)
+    med = np.empty(normals.shape[0], dtype=np.float64)
+    for s in range(0, normals.shape[0], block):
+        d = np.abs(normals[s:s + block] @ points.T - offsets[s:s + block, None])
+        med[s:s + block] = np.partition(d, n // 2, axis=1)[:, n // 2]
+    best = int(np.argmin(med))
+    # 1.4826 * median residual: robust sigma of the residuals; keep points within 2.5 sigma.
+    threshold = max(2.5 * 1.4826 * float(med[best]), extent * 1e-6, 1e-9)
+    inliers = np.abs(points @ normals[best] - offsets[best]) <= threshold
+    refit = _svd_plane(points[inliers])
+    if refit is None:
+        return fit
+    # One more least-squares pass on the inliers of the refit plane.
+    dist = np.abs((points - refit[0]) @ refit[1])
+    final = _svd_plane(points[dist <= threshold])
+    return final if final is not None else refit
+
+
+def fit_plane(points: np.ndarray, robust: str = FIT_LEAST_SQUARES) -> tuple[np.ndarray, np.ndarray] | None:
+    """Least-squares plane (centroid + SVD normal); robust is NONE, TRIMMED or RANSAC."""
+    points = np.asarray(points, dtype=np.float64)
+    if robust == FIT_TRIMMED:
+        return _trimmed_plane(points)
+    if robust == FIT_RANSAC:
+        return _ransac_plane(points)
+    return _svd_plane(points)
+
+
+def three_point_indices(points: np.ndarray) -> tuple[int, int, int] | None:
+    """Legacy pick: farthest pair, then the point farthest from the line through them."""
+    points = np.asarray(points, dtype=np.float64)
+    if points.shape[0] < 3:
+        return None
+    ia, ib = farthest_pair_indices(points)
+    line_vec = points[ib] - points[ia]
+    if float(line_vec @ line_vec) < 1e-9:
+        return None
+    cross = np.cross(points - points[ia], line_vec)
+    d2 = np.einsum("ij,ij->i", cross, cross)
+    d2[[ia, ib]] = -1.0
+    return ia, ib, int(np.argmax(d2))
@@ -0,0 +1,98 @@
+"""Redo-session snapshots of edit-mesh vertex coordinates for the mesh shaping operators.
+
+The redo panel undoes to the original mesh and re-runs execute() on the same operator
+instance for every property tweak. The first execute of a session captures the original
+coordinates as one (N, 3) array plus the selection; later executes reuse it while they
+run on the same operator instance (its wmOperator pointer) and the mesh, its topology
+and a probe of vertices still match. Between two redo executes only the redo's own undo
+touches the mesh: any other registered operator, mode switch included, replaces the last
+operator and ends the session. The probe (captured selection plus a stride of the rest)
+catches Repeat Last, which re-runs the same instance without undoing.
+
+A session ends when the operator that owns it is no longer the last registered one
+(checked by a timer), when invoke() starts a new one (clear(bl_idname)) or on file load.
+"""
+from __future__ import annotations
+
+import bpy
+import numpy as np
+
+from . import mesh_arrays
+
+# Unselected vertices compared (evenly strided) when validating a snapshot.
+_PROBE_COUNT = 64
+# Seconds between checks for ended sessions.
+_WATCH_INTERVAL = 1.0
+
+
+class MeshSnapshot:
+    """Original local coordinates (index order) and selection of one edit bmesh."""
+
+    def __init__(self, op_ptr: int, mesh, bm) -> None:
+        bm.verts.index_update()
+        self.op_ptr = op_ptr
+        self.mesh_ptr = mesh.as_pointer()
+        self.counts = (len(bm.verts), len(bm.edges), len(bm.faces))
+        self.co = mesh_arrays.bmesh_vert_coords(bm)
+        n = self.counts[0]
+        self.select = np.fromiter((v.select for v in bm.verts), dtype=bool, count=n)
+        self.selected = np.nonzero(self.select)[0]
+        unselected = np.nonzero(~self.select)[0]
+        step = max(1, unselected.size // _PROBE_COUNT)
+        self.probe = np.concatenate((self.selected, unselected[::step][:_PROBE_COUNT]))
+
+    def matches(self, op_ptr: int, mesh, bm) -> bool:
+        """Same operator instance, mesh and topology; probed vertices keep their co and selection."""
+        if op_ptr != self.op_ptr or mesh.as_pointer() != self.mesh_ptr:
+            return False
+        if (len(bm.verts), len(bm.edges), len(bm.faces)) != self.counts:
+            return False
+        bm.verts.ensure_lookup_table()
+        verts = bm.verts
+        for i, sel, co in zip(self.probe.tolist(), self.select[self.probe].tolist(), self.co[self.probe].tolist()):
+            v = verts[i]
+            if v.select != sel or tuple(v.co) != tuple(co):
+                return False
+        return True
+
+
+_sessions: dict[str, MeshSnapshot] = {}
+
+
+def _last_operator_pointer() -> int:
+    try:
+        ops = bpy.context.window_manager.operators
+        return ops[-1].as_pointer() if len(ops) else 0
+    except Exception:
+        return 0
+
+
+def _drop_ended_sessions():
+    """Timer: drop snapshots whose operator is no longer the one the redo panel would re-run."""
+    last = _last_operator_pointer()
+    for key in [k for k, snap in _sessions.items() if snap.op_ptr != last]:
+        del _sessions[key]
+    return _WATCH_INTERVAL if _sessions else None
+
+
+def session_snapshot(key: str, op, mesh, bm) -> MeshSnapshot:
+    """Snapshot for the redo session of op (key: its bl_idname); recaptured when stale."""
+    op_ptr = op.as_pointer()
+    snap = _sessions.get(key)
+    if snap is None or not snap.matches(op_ptr, mesh, bm):
+        snap = MeshSnapshot(op_ptr, mesh, bm)
+        _sessions[key] = snap
+        if not bpy.app.timers.is_registered(_drop_ended_sessions):
+            bpy.app.timers.register(_drop_ended_sessions, first_interval=_WATCH_INTERVAL)
+    else:
+        bm.verts.index_update()
+    return snap
+
+
+def clear(key: str | None = None) -> None:
+    if key is None:
+        _sessions.clear()
+    else:
+        _sessions.pop(key, None)
+    if not _sessions and bpy.app.timers.is_registered(_drop_ended_sessions):
+        bpy.app.timers.unregister(_drop_ended_sessions)
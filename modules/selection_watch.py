@@ -0,0 +1,141 @@
+"""Cheap vertex-selection change detection for timer-polled edit-mesh tools (Auto Linked Mode).
+
+Each poll first compares an O(1) signature: selected vert / edge / face totals (kept by
+the edit BMesh itself), vertex count and the select-history tail. An unchanged signature
+still gets a rolling verification of a slice of the stored selection mask, bounded by
+a per-tick time budget. Only a detected change reads the full mask and diffs it with
+NumPy.
+
+There is no per-tick checksum over all select flags: bmesh exposes them only one vertex
+at a time, so any full checksum costs as much as the full read it is meant to avoid.
+Changes that keep every signature field (e.g. a box select replacing the selection with
+as many verts) are therefore found late: when the rolling verification reaches a changed
+vertex, at most one full pass later. A pass takes about len(verts) / (verts compared per
+budget) ticks; stats["last_pass_ticks"] reports the measured value.
+"""
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+# Default per-poll time budget for the rolling verification, in seconds.
+DEFAULT_BUDGET = 0.004
+# Vertices compared per rolling-verification step.
+_VERIFY_CHUNK = 4096
+
+
+def _signature(mesh, bm) -> tuple:
+    history = bm.select_history
+    try:
+        active = history.active
+        tail = (type(active).__name__, active.index) if active is not None else None
+    except ReferenceError:
+        tail = None
+    return (
+        mesh.as_pointer(),
+        len(bm.verts),
+        getattr(mesh, "total_vert_sel", None),
+        getattr(mesh, "total_edge_sel", None),
+        getattr(mesh, "total_face_sel", None),
+        len(history),
+        tail,
+    )
+
+
+def read_vert_selection(bm) -> np.ndarray:
+    """(N,) bool select flags of bm.verts in index order."""
+    return np.fromiter((v.select for v in bm.verts), dtype=bool, count=len(bm.verts))
+
+
+class SelectionWatch:
+    """Last known vertex selection of one edit mesh, plus tick counters for tuning."""
+
+    def __init__(self, budget: float = DEFAULT_BUDGET) -> None:
+        self.budget = budget
+        self.mask: np.ndarray | None = None
+        self._signature: tuple = ()
+        self._cursor = 0
+        self._pass_ticks = 0
+        self.stats = {
+            "ticks": 0,
+            "signature_changes": 0,
+            "verify_mismatches": 0,
+            "full_reads": 0,
+            "partial_reads": 0,
+            "verified_verts": 0,
+            "last_pass_ticks": 0,
+            "last_tick_ms": 0.0,
+            "max_tick_ms": 0.0,
+        }
+
+    def reset(self) -> None:
+        self.mask = None
+        self._signature = ()
+        self._cursor = 0
+        self._pass_ticks = 0
+
+    def sync(self, mesh, bm, mask: np.ndarray | None = None) -> np.ndarray:
+        """Store the full selection after a change or our own edit.
+
+        Without mask the flags are read from bm (a full read); a given mask is one the
+        caller patched from a partial read (e.g. only the islands it edited).
+        """
+        if mask is None:
+            self.mask = read_vert_selection(bm)
+            self.stats["full_reads"] += 1
+        else:
+            self.mask = mask
+            self.stats["partial_reads"] += 1
+        self._signature = _signature(mesh, bm)
+        self._cursor = 0
+        self._pass_ticks = 0
+        return self.mask
+
+    def poll(self, mesh, bm) -> bool:
+        """True when the selection may differ from the stored mask (caller then diffs / syncs)."""
+        t0 = time.perf_counter()
+        self.stats["ticks"] += 1
+        try:
+            if self.mask is None or _signature(mesh, bm) != self._signature:
+                self.stats["signature_changes"] += 1
+                return True
+            if not self._verify_slice(bm, t0):
+                self.stats["verify_mismatches"] += 1
+                return True
+            return False
+        finally:
+            ms = (time.perf_counter() - t0) * 1000.0
+            self.stats["last_tick_ms"] = ms
+            self.stats["max_tick_ms"] = max(self.stats["max_tick_ms"], ms)
+
+    def _verify_slice(self, bm, t0: float) -> bool:
+        """Compare the next slices of the stored mask until the budget runs out; False on mismatch."""
+        n = self.mask.shape[0]
+        if n == 0:
+            return True
+        bm.verts.ensure_lookup_table()
+        verts = bm.verts
+        self._pass_ticks += 1
+        while True:
+            start = self._cursor
+            end = min(start + _VERIFY_CHUNK, n)
+            current = np.fromiter((verts[i].select for i in range(start, end)), dtype=bool, count=end - start)
+            self.stats["verified_verts"] += end - start
+            self._cursor = 0 if end >= n else end
+            if not np.array_equal(current, self.mask[start:end]):
+                return False
+            if self._cursor == 0:
+                self.stats["last_pass_ticks"] = self._pass_ticks
+                self._pass_ticks = 0
+            if time.perf_counter() - t0 >= self.budget or self._cursor == 0:
+                return True
+
+    def summary(self) -> str:
+        s = self.stats
+        return (
+            f"ticks={s['ticks']} signature_changes={s['signature_changes']} "
+            f"verify_mismatches={s['verify_mismatches']} full_reads={s['full_reads']} "
+            f"partial_reads={s['partial_reads']} verified_verts={s['verified_verts']} "
+            f"last_pass_ticks={s['last_pass_ticks']} max_tick_ms={s['max_tick_ms']:.2f}"
+        )
@@ -0,0 +1,303 @@
+"""Snap-candidate visibility against visible evaluated geometry (BVHTree occlusion cache).
+
+One SnapOcclusion lives for a modal session. Visible evaluated meshes go into two lazily
+built BVHTrees, rebuilt on the first query after a relevant update: one for the edit
+object, kept across edits the caller reports as loose-only (note_loose_edit; new verts
+and edges add no triangles) while the evaluated face / loop counts still match, and one
+for the rest of the scene, rebuilt only when an update touches one of its objects, their
+data or instancers, or another object / collection.
+Per-datablock triangle arrays of the scene tree are re-read only for datablocks whose
+geometry changed. A candidate is occluded when the segment from it to the eye (or, in
+ortho, towards the viewer) hits a triangle of either tree.
+"""
+from __future__ import annotations
+
+import sys
+
+import bpy
+import numpy as np
+from mathutils import Vector
+from mathutils.bvhtree import BVHTree
+
+from . import mesh_arrays
+from .draw_mesh_snap_cache import instance_sources, iter_world_mesh_instances, mesh_data_key
+
+_EMPTY_TRIS = np.empty((0, 3), dtype=np.int64)
+
+# Original ID pointer -> _revision of its last update (objects, collections, geometry);
+# _geometry_ids holds the subset whose evaluated geometry changed.
+_id_revisions: dict[int, int] = {}
+_geometry_ids: dict[int, int] = {}
+_revision = 0
+# Revision at which the tables were last emptied; older readers must rebuild everything.
+_reset_revision = 0
+# IDs tracked at most before the tables are emptied.
+_MAX_TRACKED_IDS = 4096
+
+
+def invalidate() -> None:
+    """Forget tracked updates; every SnapOcclusion rebuilds both trees (file load)."""
+    global _revision, _reset_revision
+    _revision += 1
+    _reset_revision = _revision
+    _id_revisions.clear()
+    _geometry_ids.clear()
+
+
+def depsgraph_update_handler(scene, depsgraph=None):
+    """Record updated objects, collections and geometry (see updated_since)."""
+    global _revision
+    if depsgraph is None:
+        invalidate()
+        return
+    changed: list[int] = []
+    geometry: list[int] = []
+    try:
+        for update in depsgraph.updates:
+            is_geometry = update.is_updated_geometry
+            if not is_geometry and not isinstance(update.id, (bpy.types.Object, bpy.types.Collection)):
+                continue
+            ptr = update.id.original.as_pointer()
+            changed.append(ptr)
+            if is_geometry:
+                geometry.append(ptr)
+    except Exception:
+        invalidate()
+        return
+    if not changed:
+        return
+    if len(_id_revisions) + len(changed) > _MAX_TRACKED_IDS:
+        invalidate()
+        return
+    _revision += 1
+    for ptr in changed:
+        _id_revisions[ptr] = _revision
+    for ptr in geometry:
+        _geometry_ids[ptr] = _revision
+
+
+def updated_since(revision: int) -> tuple[set[int], set[int]] | None:
+    """(updated, geometry-updated) ID pointers after revision; None after a reset."""
+    if revision < _reset_revision:
+        return None
+    if revision >= _revision:
+        return set(), set()
+    return (
+        {ptr for ptr, rev in _id_revisions.items() if rev > revision},
+        {ptr for ptr, rev in _geometry_ids.items() if rev > revision},
+    )
+
+
+def _ray_slack(context, dist):
+    scl = getattr(context.scene.unit_settings, 'scale_length', 1.0) or 1.0
+    return np.maximum(max(scl * 1e-4, 1e-5), np.abs(dist) * 1e-6)
+
+
+def _mesh_local_triangles(eval_mesh) -> tuple[np.ndarray, np.ndarray]:
+    """((V, 3) local coordinates, (T, 3) vertex indices of loop triangles)."""
+    co = mesh_arrays.mesh_vert_coords(eval_mesh)
+    try:
+        eval_mesh.calc_loop_triangles()
+    except Exception:
+        pass
+    n_tri = len(eval_mesh.loop_triangles)
+    if n_tri == 0:
+        return co, _EMPTY_TRIS
+    tris = np.empty(n_tri * 3, dtype=np.int32)
+    eval_mesh.loop_triangles.foreach_get("vertices", tris)
+    return co, tris.reshape(n_tri, 3).astype(np.int64)
+
+
+def _tree_from_parts(parts_co: list[np.ndarray], parts_tri: list[np.ndarray]) -> BVHTree | None:
+    if not parts_tri:
+        return None
+    return BVHTree.FromPolygons(
+        np.concatenate(parts_co).tolist(),
+        np.concatenate(parts_tri).tolist(),
+        all_triangles=True,
+    )
+
+
+def _edit_signature(edit_obj, depsgraph) -> tuple | None:
+    """Visibility, matrix and face / loop counts of the evaluated edit mesh (see note_loose_edit)."""
+    if edit_obj is None or edit_obj.type != 'MESH':
+        return None
+    try:
+        obj_eval = edit_obj.evaluated_get(depsgraph)
+        me = obj_eval.data
+        return (edit_obj.visible_get(), len(me.polygons), len(me.loops), tuple(map(tuple, obj_eval.matrix_world)))
+    except Exception:
+        return None
+
+
+def _id_pointers(obj) -> set[int]:
+    """Pointers of obj and its data (empty for None)."""
+    if obj is None:
+        return set()
+    try:
+        ptrs = {obj.as_pointer()}
+        if obj.data is not None:
+            ptrs.add(obj.data.as_pointer())
+    except Exception:
+        return set()
+    return ptrs
+
+
+class SnapOcclusion:
+    """Lazily built BVHTrees (scene / edit object) of visible evaluated mesh triangles."""
+
+    def __init__(self) -> None:
+        self._tree: BVHTree | None = None
+        self._edit_tree: BVHTree | None = None
+        self._key: tuple | None = None
+        # Datablock key -> (local coordinates, triangles) / source ID pointers.
+        self._local: dict = {}
+        self._sources: dict[tuple, set[int]] = {}
+        self._edit_ptrs: set[int] = set()
+        self._edit_sig: tuple | None = None
+        self._revision = -1
+        self._stale_scene = True
+        self._stale_edit = True
+        # note_loose_edit() pending / edit-object update to check against _edit_sig.
+        self._loose_edit = False
+        self._check_edit = False
+
+    def clear(self) -> None:
+        self.__init__()
+
+    def _build_scene(self, context, depsgraph, edit_obj) -> None:
+        """Tree over every visible mesh instance except edit_obj."""
+        parts_co: list[np.ndarray] = []
+        parts_tri: list[np.ndarray] = []
+        n_verts = 0
+        sources: dict[tuple, set[int]] = {}
+        for _ordinal, obj_inst, obj_eval, eval_mesh in iter_world_mesh_instances(context, depsgraph, edit_obj):
+            data_key = mesh_data_key(eval_mesh)
+            local = self._local.get(data_key) if data_key is not None else None
+            if local is None:
+                try:
+                    local = _mesh_local_triangles(eval_mesh)
+                except Exception:
+                    continue
+                if data_key is not None:
+                    self._local[data_key] = local
+            if data_key is not None:
+                sources.setdefault(data_key, set()).update(instance_sources(obj_inst, obj_eval))
+            co, tris = local
+            if tris.shape[0] == 0:
+                continue
+            parts_co.append(mesh_arrays.transform_points(obj_inst.matrix_world, co))
+            parts_tri.append(tris + n_verts)
+            n_verts += co.shape[0]
+        # Datablocks no longer instanced (their pointer may be reused by a new mesh).
+        for key in [k for k in self._local if k not in sources]:
+            del self._local[key]
+        self._sources = sources
+        self._tree = _tree_from_parts(parts_co, parts_tri)
+
+    def _build_edit(self, depsgraph, edit_obj) -> None:
+        self._edit_tree = None
+        self._edit_sig = _edit_signature(edit_obj, depsgraph)
+        if edit_obj is None or edit_obj.type != 'MESH':
+            return
+        try:
+            if not edit_obj.visible_get():
+                return
+            obj_eval = edit_obj.evaluated_get(depsgraph)
+            co, tris = _mesh_local_triangles(obj_eval.data)
+            mw = obj_eval.matrix_world
+        except Exception:
+            return
+        if tris.shape[0]:
+            self._edit_tree = _tree_from_parts([mesh_arrays.transform_points(mw, co)], [tris])
+
+    def _mark_stale(self, key: tuple) -> None:
+        """Compare tracked updates with the last build; flag the trees that must rebuild."""
+        changed = updated_since(self._revision)
+        self._revision = _revision
+        if key != self._key or changed is None:
+            self._key = key
+            self._local.clear()
+            self._stale_scene = self._stale_edit = True
+            self._loose_edit = self._check_edit = False
+            return
+        updated, geometry = changed
+        if not updated:
+            return
+        if not updated.isdisjoint(self._edit_ptrs):
+            if self._loose_edit:
+                self._loose_edit = False
+                self._check_edit = True
+            else:
+                self._stale_edit = True
+        updated -= self._edit_ptrs
+        if not updated:
+            return
+        geometry -= self._edit_ptrs
+        if geometry:
+            for data_key in [k for k, src in self._sources.items() if not src.isdisjoint(geometry)]:
+                self._local.pop(data_key, None)
+        self._stale_scene = True
+
+    def note_loose_edit(self) -> None:
+        """The caller's next edit-object update only adds / removes loose verts and edges.
+
+        The edit tree is then kept unless the evaluated face / loop counts, matrix or
+        visibility changed (e.g. a modifier building faces from the new edges).
+        """
+        self._loose_edit = True
+
+    def ensure(self, context) -> bool:
+        """Build or reuse the trees for the current scene state; False when nothing can occlude."""
+        edit_obj = getattr(context, 'edit_object', None)
+        self._edit_ptrs = _id_pointers(edit_obj)
+        key = (id(context.scene), id(getattr(context, 'view_layer', None)), id(edit_obj))
+        self._mark_stale(key)
+        if self._stale_scene or self._stale_edit or self._check_edit:
+            try:
+                depsgraph = context.evaluated_depsgraph_get()
+            except Exception:
+                depsgraph = None
+            if depsgraph is None:
+                self._tree = self._edit_tree = None
+                return False
+            if self._check_edit:
+                self._check_edit = False
+                if _edit_signature(edit_obj, depsgraph) != self._edit_sig:
+                    self._stale_edit = True
+            if self._stale_scene:
+                self._build_scene(context, depsgraph, edit_obj)
+                self._stale_scene = False
+            if self._stale_edit:
+                self._build_edit(depsgraph, edit_obj)
+                self._stale_edit = False
+        return self._tree is not None or self._edit_tree is not None
+
+    def occluded_mask(self, context, rv3d, points: np.ndarray) -> np.ndarray:
+        """(N,) bool: world points hidden behind visible triangles from this view."""
+        n = points.shape[0]
+        mask = np.zeros(n, dtype=bool)
+        if n == 0 or not self.ensure(context):
+            return mask
+        view_inv = np.linalg.inv(mesh_arrays.matrix_np(rv3d.view_matrix))
+        if getattr(rv3d, 'is_perspective', True):
+            to_eye = view_inv[:3, 3] - points
+            dist = np.linalg.norm(to_eye, axis=1)
+            dirs = to_eye / np.maximum(dist, 1e-30)[:, None]
+        else:
+            back = view_inv[:3, 2] / max(float(np.linalg.norm(view_inv[:3, 2])), 1e-30)
+            dirs = np.broadcast_to(back, points.shape)
+            dist = None
+        eps = _ray_slack(context, dist if dist is not None else np.zeros(n))
+        origins = points + dirs * eps[:, None]
+        reach = dist - 2.0 * eps if dist is not None else np.full(n, sys.float_info.max)
+        casts = [tree.ray_cast for tree in (self._tree, self._edit_tree) if tree is not None]
+        for i, (o, d, r) in enumerate(zip(origins.tolist(), dirs.tolist(), reach.tolist())):
+            if r > 0.0:
+                o = Vector(o)
+                d = Vector(d)
+                mask[i] = any(ray_cast(o, d, r)[0] is not None for ray_cast in casts)
+        return mask
+
+    def occludes(self, context, rv3d, world_co) -> bool:
+        return bool(self.occluded_mask(context, rv3d, np.array((tuple(world_co),), dtype=np.float64))[0])
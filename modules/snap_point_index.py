@@ -0,0 +1,202 @@
+"""View-independent world-space point index for snapping (clustered BVH over NumPy arrays).
+
+Points are Morton-sorted once per mesh state and grouped into a fixed-branching hierarchy
+of bounding spheres. A query builds the pick cone for the mouse ray and the snap pixel
+radius, descends only into nodes the cone touches, then ranks the surviving points by
+exact screen distance, so orbit / pan / zoom never require a rebuild.
+"""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from mathutils import Vector
+from bpy_extras.view3d_utils import region_2d_to_origin_3d, region_2d_to_vector_3d
+
+from . import mesh_arrays
+
+_LEAF_SIZE = 32
+_BRANCHING = 16
+_MORTON_BITS = 10
+# Pixel → angle mapping is not uniform off-axis; widen the cone so the prefilter stays a superset.
+_CONE_SLACK = 1.15
+_CONE_OFFSETS = tuple(
+    (math.cos(a), math.sin(a)) for a in (i * math.pi / 4.0 for i in range(8))
+)
+
+
+def _spread_bits(v: np.ndarray) -> np.ndarray:
+    """Insert two zero bits between each of the low 10 bits (3D Morton interleave)."""
+    v = v.astype(np.uint32) & 0x3FF
+    v = (v | (v << 16)) & 0x030000FF
+    v = (v | (v << 8)) & 0x0300F00F
+    v = (v | (v << 4)) & 0x030C30C3
+    v = (v | (v << 2)) & 0x09249249
+    return v
+
+
+def morton_order(points: np.ndarray) -> np.ndarray:
+    """Row permutation that sorts (N, 3) points along a 3D Z-order curve."""
+    n = points.shape[0]
+    if n < 2:
+        return np.arange(n, dtype=np.int64)
+    lo = points.min(axis=0)
+    span = np.maximum(points.max(axis=0) - lo, 1e-12)
+    q = ((points - lo) / span * ((1 << _MORTON_BITS) - 1)).astype(np.uint32)
+    code = (_spread_bits(q[:, 0]) << 2) | (_spread_bits(q[:, 1]) << 1) | _spread_bits(q[:, 2])
+    return np.argsort(code, kind="stable")
+
+
+def _chunk_spheres(sorted_pts: np.ndarray, chunk: int) -> tuple[np.ndarray, np.ndarray]:
+    """Bounding spheres (AABB center + half diagonal) of consecutive `chunk`-point runs."""
+    starts = np.arange(0, sorted_pts.shape[0], chunk)
+    mn = np.minimum.reduceat(sorted_pts, starts, axis=0)
+    mx = np.maximum.reduceat(sorted_pts, starts, axis=0)
+    return (mn + mx) * 0.5, np.linalg.norm(mx - mn, axis=1) * 0.5
+
+
+class PickCone:
+    """Mouse ray widened to the snap pixel radius (cone in perspective, cylinder in ortho)."""
+
+    __slots__ = ("origin", "direction", "sin_a", "cos_a", "ortho_radius", "is_perspective")
+
+    def __init__(self, region, rv3d, coord, radius_px: float) -> None:
+        cx, cy = float(coord[0]), float(coord[1])
+        origin = region_2d_to_origin_3d(region, rv3d, (cx, cy))
+        direction = region_2d_to_vector_3d(region, rv3d, (cx, cy)).normalized()
+        self.origin = np.array(origin, dtype=np.float64)
+        self.direction = np.array(direction, dtype=np.float64)
+        self.is_perspective = bool(getattr(rv3d, "is_perspective", True))
+        max_angle = 0.0
+        max_offset = 0.0
+        for ox, oy in _CONE_OFFSETS:
+            c2 = (cx + ox * radius_px, cy + oy * radius_px)
+            if self.is_perspective:
+                d2 = region_2d_to_vector_3d(region, rv3d, c2).normalized()
+                max_angle = max(max_angle, direction.angle(d2, 0.0))
+            else:
+                o2 = region_2d_to_origin_3d(region, rv3d, c2)
+                max_offset = max(max_offset, (Vector(o2) - origin).length)
+        angle = min(max_angle * _CONE_SLACK, math.pi * 0.5 - 1e-6)
+        self.sin_a = math.sin(angle)
+        self.cos_a = math.cos(angle)
+        self.ortho_radius = max_offset * _CONE_SLACK
+
+    def touches_spheres(self, centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+        """Conservative bool mask of spheres that may intersect the cone."""
+        v = centers - self.origin
+        t = v @ self.direction
+        rho = np.linalg.norm(v - t[:, None] * self.direction, axis=1)
+        if not self.is_perspective:
+            return rho <= radii + self.ortho_radius
+        # Distance from a point to the cone surface (apex region handled by |v| <= r).
+        return (rho * self.cos_a - t * self.sin_a <= radii) | (
+            np.einsum("ij,ij->i", v, v) <= radii * radii
+        )
+
+
+class WorldPointIndex:
+    """Clustered sphere hierarchy over world-space points; rows refer to the input array."""
+
+    def __init__(self, points: np.ndarray) -> None:
+        self.points = points
+        self._order = morton_order(points)
+        sorted_pts = points[self._order]
+        # levels[0] = leaves (_LEAF_SIZE points); each further level groups _BRANCHING nodes.
+        self._levels: list[tuple[np.ndarray, np.ndarray]] = []
+        if sorted_pts.shape[0] == 0:
+            return
+        chunk = _LEAF_SIZE
+        while True:
+            self._levels.append(_chunk_spheres(sorted_pts, chunk))
+            if self._levels[-1][0].shape[0] <= _BRANCHING:
+                break
+            chunk *= _BRANCHING
+
+    def __len__(self) -> int:
+        return int(self.points.shape[0])
+
+    def _cone_rows(self, cone: PickCone, matrix: np.ndarray | None) -> np.ndarray:
+        """Input rows inside leaves touched by the cone (points placed by matrix, if given)."""
+        if not self._levels:
+            return np.empty(0, dtype=np.int64)
+        if matrix is None:
+            place = None
+            scale = 1.0
+        else:
+            place = matrix
+            # Largest singular value bounds how far any sphere radius can stretch (incl. shear).
+            scale = float(np.linalg.norm(matrix[:3, :3], 2))
+
+        def touched(ids: np.ndarray, centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+            c = centers[ids]
+            if place is not None:
+                c = mesh_arrays.transform_points(place, c)
+            return ids[cone.touches_spheres(c, radii[ids] * scale)]
+
+        top_c, top_r = self._levels[-1]
+        ids = touched(np.arange(top_c.shape[0]), top_c, top_r)
+        for level in range(len(self._levels) - 2, -1, -1):
+            if ids.size == 0:
+                return ids
+            centers, radii = self._levels[level]
+            ids = (ids[:, None] * _BRANCHING + np.arange(_BRANCHING)).ravel()
+            ids = ids[ids < centers.shape[0]]
+            ids = touched(ids, centers, radii)
+        if ids.size == 0:
+            return ids
+        pos = (ids[:, None] * _LEAF_SIZE + np.arange(_LEAF_SIZE)).ravel()
+        pos = pos[pos < self._order.shape[0]]
+        return self._order[pos]
+
+    def query(
+        self,
+        region,
+        rv3d,
+        coord,
+        radius_px: float,
+        *,
+        matrix: np.ndarray | None = None,
+        cone: PickCone | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(rows, d²) of points within radius_px of coord on screen, nearest first.
+
+        matrix: optional 4x4 placing the (local) points in world space, so one index per
+        mesh datablock serves every instance of it.
+        """
+        if cone is None:
+            cone = PickCone(region, rv3d, coord, radius_px)
+        rows = self._cone_rows(cone, matrix)
+        return screen_rank(self.points, rows, region, rv3d, coord, radius_px, matrix=matrix)
+
+
+def screen_rank(
+    points: np.ndarray,
+    rows: np.ndarray | None,
+    region,
+    rv3d,
+    coord,
+    radius_px: float,
+    *,
+    matrix: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """(rows, d²) of points[rows] (all points when rows is None) within radius_px, nearest first.
+
+    Also the brute-force query used while an index is still being built.
+    """
+    if rows is None:
+        rows = np.arange(points.shape[0], dtype=np.int64)
+    if rows.size == 0:
+        return rows, np.empty(0, dtype=np.float64)
+    pts = points[rows]
+    if matrix is not None:
+        pts = mesh_arrays.transform_points(matrix, pts)
+    screen, ok = mesh_arrays.project_points_to_region(region, rv3d, pts)
+    rows = rows[ok]
+    delta = screen[ok] - (float(coord[0]), float(coord[1]))
+    d2 = np.einsum("ij,ij->i", delta, delta)
+    inside = d2 < radius_px * radius_px
+    rows = rows[inside]
+    d2 = d2[inside]
+    order = np.argsort(d2, kind="stable")
+    return rows[order], d2[order]
@@ -0,0 +1,164 @@
+"""Array-backed proportional falloff: uniform-grid neighbour pairs and vectorised kernels.
+
+Sources (moved vertices with their deltas) are bucketed in a grid of cells at least one
+radius wide, so each query vertex only meets sources in its 27 neighbouring cells. Pairs
+are expanded in NumPy chunks and reduced per query with bincount; when sources are few,
+full query × source weight matrices (BLAS) are cheaper and used instead. Nothing here
+touches bmesh (see utils.apply_soft_falloff for the bmesh side).
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from . import mesh_arrays
+
+FALLOFF_TYPES = ('SMOOTH', 'SPHERE', 'ROOT', 'LINEAR', 'SHARP')
+
+# Query–source pairs expanded per NumPy chunk.
+_MAX_PAIRS = 1 << 22
+# Cells per axis are capped so packed cell keys fit in int64.
+_MAX_AXIS_CELLS = 1 << 20
+# Dense query × source matrices are used while no bigger than this many grid pairs × ratio.
+_DENSE_RATIO = 8
+_COLUMNS = np.array([(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)], dtype=np.int64)
+
+
+def falloff_weights(ratio: np.ndarray, falloff_type: str = 'SMOOTH') -> np.ndarray:
+    """Falloff curve at distance / radius (0 at ratio >= 1)."""
+    r = np.clip(ratio, 0.0, 1.0)
+    if falloff_type == 'SPHERE':
+        w = np.sqrt(1.0 - r * r)
+    elif falloff_type == 'ROOT':
+        w = np.sqrt(1.0 - r)
+    elif falloff_type == 'LINEAR':
+        w = 1.0 - r
+    elif falloff_type == 'SHARP':
+        w = (1.0 - r) ** 2
+    else:  # SMOOTH
+        w = (1.0 - r * r) ** 2
+    return np.where(ratio < 1.0, w, 0.0)
+
+
+class _SourceGrid:
+    """Sources sorted by packed cell key (z fastest), cells at least one radius wide.
+
+    Cells (x, y, z-1..z+1) are adjacent in key order, so the 27 neighbour cells of a query
+    are 9 contiguous row ranges.
+    """
+
+    def __init__(self, points: np.ndarray, radius: float) -> None:
+        lo = points.min(axis=0)
+        extent = float((points.max(axis=0) - lo).max())
+        self.cell = max(radius, extent / _MAX_AXIS_CELLS)
+        self.lo = lo
+        cells = np.floor((points - lo) / self.cell).astype(np.int64)
+        self.dims = cells.max(axis=0) + 1
+        keys = self._pack(cells)
+        self.order = np.argsort(keys, kind="stable")
+        self.keys = keys[self.order]
+
+    def _pack(self, cells: np.ndarray) -> np.ndarray:
+        return (cells[..., 0] * self.dims[1] + cells[..., 1]) * self.dims[2] + cells[..., 2]
+
+    def query_cells(self, query: np.ndarray) -> np.ndarray:
+        return np.floor((query - self.lo) / self.cell).astype(np.int64)
+
+    def neighbour_ranges(self, qc: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """(Q, 9) start / end rows into the sorted sources around each query cell."""
+        nb = qc[:, None, :2] + _COLUMNS[None, :, :]
+        inside = np.all((nb >= 0) & (nb < self.dims[:2]), axis=2)
+        inside &= (qc[:, None, 2] >= -1) & (qc[:, None, 2] <= self.dims[2])
+        nb = np.where(inside[..., None], nb, 0)
+        z_lo = np.clip(qc[:, None, 2] - 1, 0, self.dims[2] - 1)
+        z_hi = np.clip(qc[:, None, 2] + 1, 0, self.dims[2] - 1)
+        base = (nb[..., 0] * self.dims[1] + nb[..., 1]) * self.dims[2]
+        starts = np.searchsorted(self.keys, base + z_lo, side="left")
+        ends = np.searchsorted(self.keys, base + z_hi, side="right")
+        ends[~inside] = starts[~inside]
+        return starts, ends
+
+
+def _reduce_dense(src, delta, query, radius, falloff_type, sum_w, sum_d, max_w) -> None:
+    """Accumulate all query × source weights as matrices (few sources: BLAS beats pair lists)."""
+    src_sq = np.einsum("ij,ij->i", src, src)
+    step = max(1, _MAX_PAIRS // src.shape[0])
+    for q0 in range(0, query.shape[0], step):
+        q = query[q0:q0 + step]
+        d2 = np.einsum("ij,ij->i", q, q)[:, None] + src_sq[None, :] - 2.0 * (q @ src.T)
+        w = falloff_weights(np.sqrt(np.maximum(d2, 0.0)) / radius, falloff_type)
+        sum_w[q0:q0 + step] = w.sum(axis=1)
+        sum_d[q0:q0 + step] = w @ delta
+        max_w[q0:q0 + step] = w.max(axis=1)
+
+
+def _reduce_grid(src, delta, query, starts, ends, per_query, radius, falloff_type, sum_w, sum_d, max_w) -> None:
+    """Accumulate weights over grid-neighbour pairs, expanded in chunks of about _MAX_PAIRS."""
+    n_query = query.shape[0]
+    r2 = radius * radius
+    cum = np.concatenate(((0,), np.cumsum(per_query)))
+    q0 = 0
+    while q0 < n_query:
+        q1 = int(np.searchsorted(cum, cum[q0] + _MAX_PAIRS, side="right")) - 1
+        q1 = min(max(q1, q0 + 1), n_query)
+        s, e = starts[q0:q1].ravel(), ends[q0:q1].ravel()
+        qi = np.repeat(np.repeat(np.arange(q0, q1), _COLUMNS.shape[0]), e - s)
+        si = mesh_arrays.concat_ranges(s, e)
+        q0 = q1
+        if si.size == 0:
+            continue
+        diff = query[qi] - src[si]
+        d2 = np.einsum("ij,ij->i", diff, diff)
+        near = d2 < r2
+        qi, si = qi[near], si[near]
+        w = falloff_weights(np.sqrt(d2[near]) / radius, falloff_type)
+        sum_w += np.bincount(qi, w, minlength=n_query)
+        for k in range(3):
+            sum_d[:, k] += np.bincount(qi, w * delta[si, k], minlength=n_query)
+        np.maximum.at(max_w, qi, w)
+
+
+def blend_offsets(
+    src_points: np.ndarray,
+    src_delta: np.ndarray,
+    query_points: np.ndarray,
+    radius: float,
+    falloff_type: str = 'SMOOTH',
+) -> tuple[np.ndarray, np.ndarray]:
+    """(rows, offsets): weighted mean of source deltas scaled by the strongest falloff.
+
+    Distances are measured between src_points and query_points (same space); offsets are
+    in the space of src_delta. rows index query_points that lie within radius of a source.
+    """
+    empty = (np.empty(0, dtype=np.int64), np.empty((0, 3), dtype=np.float64))
+    if radius <= 0.0 or src_points.shape[0] == 0 or query_points.shape[0] == 0:
+        return empty
+
+    lo = src_points.min(axis=0) - radius
+    hi = src_points.max(axis=0) + radius
+    near_box = np.nonzero(np.all((query_points > lo) & (query_points < hi), axis=1))[0]
+    if near_box.size == 0:
+        return empty
+    # Centre on the sources: keeps the dense |a|² + |b|² - 2a·b expansion accurate.
+    centre = (lo + hi) * 0.5
+    grid = _SourceGrid(src_points - centre, radius)
+    src = src_points[grid.order] - centre
+    delta = src_delta[grid.order]
+    # Queries in cell order keep the per-pair gathers local.
+    qc = grid.query_cells(query_points[near_box] - centre)
+    q_order = near_box[np.lexsort((qc[:, 2], qc[:, 1], qc[:, 0]))]
+    query = query_points[q_order] - centre
+    starts, ends = grid.neighbour_ranges(grid.query_cells(query))
+    per_query = (ends - starts).sum(axis=1)
+    n_query = query.shape[0]
+    sum_w = np.zeros(n_query)
+    sum_d = np.zeros((n_query, 3))
+    max_w = np.zeros(n_query)
+    if n_query * src.shape[0] <= _DENSE_RATIO * int(per_query.sum()):
+        _reduce_dense(src, delta, query, radius, falloff_type, sum_w, sum_d, max_w)
+    else:
+        _reduce_grid(src, delta, query, starts, ends, per_query, radius, falloff_type, sum_w, sum_d, max_w)
+
+    rows = np.nonzero(sum_w > 0.0)[0]
+    if rows.size == 0:
+        return empty
+    return q_order[rows], sum_d[rows] / sum_w[rows, None] * max_w[rows, None]
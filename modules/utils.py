@@ -1,11 +1,11 @@
 import bpy
-import math
 import hashlib
-import collections
-import mathutils
 import numpy as np
 from mathutils import Vector
 
+from . import bounds_cache, mesh_adjacency, mesh_arrays, soft_falloff
+from .farthest_pair import farthest_pair_indices
+
 
 def safe_operator_props(op, **kwargs):
     """Set RNA props on a layout.operator() result; no-op if poll failed (None or stub)."""
@@ -25,27 +25,14 @@ def get_bounds_in_space(obj, space_matrix):
     Returns (min_bound, max_bound) in that space's local coordinates.
     """
     depsgraph = bpy.context.evaluated_depsgraph_get()
-    obj_eval = obj.evaluated_get(depsgraph)
-    try:
-        mesh_eval = obj_eval.to_mesh()
-    except RuntimeError:
+    local = bounds_cache.evaluated_local_hull(obj, depsgraph)
+    if local.shape[0] == 0:
         # Objects like EMPTY do not provide geometry data.
-        zero = Vector((0, 0, 0))
-        return (zero, zero)
-
-    if not mesh_eval.vertices:
-        obj_eval.to_mesh_clear()
-        return (Vector((0,0,0)), Vector((0,0,0)))
-
-    transform_matrix = space_matrix.inverted() @ obj_eval.matrix_world
+        return (Vector((0, 0, 0)), Vector((0, 0, 0)))
 
-    coords = [transform_matrix @ v.co for v in mesh_eval.vertices]
-    obj_eval.to_mesh_clear()
-
-    min_bound = Vector((min(v.x for v in coords), min(v.y for v in coords), min(v.z for v in coords)))
-    max_bound = Vector((max(v.x for v in coords), max(v.y for v in coords), max(v.z for v in coords)))
-    
-    return (min_bound, max_bound)
+    transform_matrix = space_matrix.inverted() @ obj.evaluated_get(depsgraph).matrix_world
+    coords = mesh_arrays.transform_points(transform_matrix, local)
+    return (Vector(coords.min(axis=0).tolist()), Vector(coords.max(axis=0).tolist()))
 
 def get_bounds_data(obj, point_type='CENTER', space='LOCAL'):
     """
@@ -69,29 +56,13 @@ def get_bounds_data(obj, point_type='CENTER', space='LOCAL'):
 
     else:
         depsgraph = bpy.context.evaluated_depsgraph_get()
-        obj_eval = obj.evaluated_get(depsgraph)
-        try:
-            mesh_eval = obj_eval.to_mesh()
-        except RuntimeError:
+        world_coords = bounds_cache.evaluated_world_hull(obj, depsgraph)
+        if world_coords.shape[0] == 0:
             # Non-geometry objects (e.g. EMPTY) should align by pivot location.
             return obj.matrix_world.to_translation()
-        
-        verts_count = len(mesh_eval.vertices)
-        if verts_count == 0:
-            obj_eval.to_mesh_clear()
-            return obj.matrix_world.to_translation()
 
-        coords = np.empty(verts_count * 3, dtype=np.float32)
-        mesh_eval.vertices.foreach_get("co", coords)
-        coords.shape = (verts_count, 3)
-        
-        matrix = np.array(obj_eval.matrix_world)
-        world_coords = np.dot(coords, matrix[:3, :3].T) + matrix[:3, 3]
-        
         w_min = world_coords.min(axis=0)
         w_max = world_coords.max(axis=0)
-        
-        obj_eval.to_mesh_clear()
 
         if point_type == 'MIN': return Vector(w_min)
         if point_type == 'MAX': return Vector(w_max)
@@ -107,32 +78,15 @@ def bbox_world_axis_interval(obj, axis_dir):
     axis_dir = axis_dir.normalized()
     bpy.context.view_layer.update()
     depsgraph = bpy.context.evaluated_depsgraph_get()
-    obj_eval = obj.evaluated_get(depsgraph)
-    try:
-        mesh_eval = obj_eval.to_mesh()
-    except RuntimeError:
-        mw = obj.matrix_world
-        dots = [(mw @ Vector(corner)) @ axis_dir for corner in obj.bound_box]
-        return min(dots), max(dots)
-
-    verts_count = len(mesh_eval.vertices)
-    if verts_count == 0:
-        obj_eval.to_mesh_clear()
+    world_coords = bounds_cache.evaluated_world_hull(obj, depsgraph)
+    if world_coords.shape[0] == 0:
         mw = obj.matrix_world
         dots = [(mw @ Vector(corner)) @ axis_dir for corner in obj.bound_box]
         return min(dots), max(dots)
 
-    coords = np.empty(verts_count * 3, dtype=np.float32)
-    mesh_eval.vertices.foreach_get("co", coords)
-    coords.shape = (verts_count, 3)
-    matrix = np.array(obj_eval.matrix_world)
-    world_coords = np.dot(coords, matrix[:3, :3].T) + matrix[:3, 3]
     ax = np.array((axis_dir.x, axis_dir.y, axis_dir.z), dtype=np.float64)
     dots = world_coords @ ax
-    mn = float(dots.min())
-    mx = float(dots.max())
-    obj_eval.to_mesh_clear()
-    return mn, mx
+    return float(dots.min()), float(dots.max())
 
 
 def _world_aabb_from_bound_box_world(mw, bound_box) -> tuple[Vector, Vector]:
@@ -153,25 +107,12 @@ def world_aabb_evaluated_bounds(obj) -> tuple[Vector, Vector]:
     """
     bpy.context.view_layer.update()
     depsgraph = bpy.context.evaluated_depsgraph_get()
-    obj_eval = obj.evaluated_get(depsgraph)
-    try:
-        mesh_eval = obj_eval.to_mesh()
-    except RuntimeError:
+    world_coords = bounds_cache.evaluated_world_hull(obj, depsgraph)
+    if world_coords.shape[0] == 0:
         return _world_aabb_from_bound_box_world(obj.matrix_world, obj.bound_box)
 
-    verts_count = len(mesh_eval.vertices)
-    if verts_count == 0:
-        obj_eval.to_mesh_clear()
-        return _world_aabb_from_bound_box_world(obj.matrix_world, obj.bound_box)
-
-    coords = np.empty(verts_count * 3, dtype=np.float32)
-    mesh_eval.vertices.foreach_get("co", coords)
-    coords.shape = (verts_count, 3)
-    matrix = np.array(obj_eval.matrix_world)
-    world_coords = np.dot(coords, matrix[:3, :3].T) + matrix[:3, 3]
     wm = world_coords.min(axis=0)
     wx = world_coords.max(axis=0)
-    obj_eval.to_mesh_clear()
     return (
         Vector((float(wm[0]), float(wm[1]), float(wm[2]))),
         Vector((float(wx[0]), float(wx[1]), float(wx[2]))),
@@ -227,35 +168,9 @@ def world_obb_evaluated_corners_wrt_active(active, obj) -> list[Vector]:
     mw_a = active.matrix_world
 
     depsgraph = bpy.context.evaluated_depsgraph_get()
-    obj_eval = obj.evaluated_get(depsgraph)
-    try:
-        mesh_eval = obj_eval.to_mesh()
-    except RuntimeError:
-        corners_w = np.array([[*(obj.matrix_world @ Vector(c))] for c in obj.bound_box], dtype=np.float64)
-        lmin, lmax = _points_minmax_in_active_local(inv_a, corners_w)
-        return _obb_world_corners_from_active_local_minmax(
-            mw_a,
-            Vector((float(lmin[0]), float(lmin[1]), float(lmin[2]))),
-            Vector((float(lmax[0]), float(lmax[1]), float(lmax[2]))),
-        )
-
-    verts_count = len(mesh_eval.vertices)
-    if verts_count == 0:
-        obj_eval.to_mesh_clear()
-        corners_w = np.array([[*(obj.matrix_world @ Vector(c))] for c in obj.bound_box], dtype=np.float64)
-        lmin, lmax = _points_minmax_in_active_local(inv_a, corners_w)
-        return _obb_world_corners_from_active_local_minmax(
-            mw_a,
-            Vector((float(lmin[0]), float(lmin[1]), float(lmin[2]))),
-            Vector((float(lmax[0]), float(lmax[1]), float(lmax[2]))),
-        )
-
-    coords = np.empty(verts_count * 3, dtype=np.float32)
-    mesh_eval.vertices.foreach_get("co", coords)
-    coords.shape = (verts_count, 3)
-    matrix = np.array(obj_eval.matrix_world)
-    world_coords = np.dot(coords, matrix[:3, :3].T) + matrix[:3, 3]
-    obj_eval.to_mesh_clear()
+    world_coords = bounds_cache.evaluated_world_hull(obj, depsgraph)
+    if world_coords.shape[0] == 0:
+        world_coords = np.array([[*(obj.matrix_world @ Vector(c))] for c in obj.bound_box], dtype=np.float64)
 
     lmin, lmax = _points_minmax_in_active_local(inv_a, world_coords)
     return _obb_world_corners_from_active_local_minmax(
@@ -405,17 +320,9 @@ def find_farthest_vertices(verts):
     if len(verts) < 2:
         return None, None
 
-    v_a, v_b = None, None
-    max_dist_sq = -1.0
-
-    for i in range(len(verts)):
-        for j in range(i + 1, len(verts)):
-            dist_sq = (verts[i].co - verts[j].co).length_squared
-            if dist_sq > max_dist_sq:
-                max_dist_sq = dist_sq
-                v_a, v_b = verts[i], verts[j]
-    
-    return v_a, v_b
+    co = np.array([tuple(v.co) for v in verts], dtype=np.float64)
+    i, j = farthest_pair_indices(co)
+    return verts[i], verts[j]
 
 def find_layer_collection(layer_coll, target_coll):
     """Recursively find a LayerCollection wrapping target_coll."""
@@ -509,98 +416,68 @@ def switch_to_modifier_tab(context):
         if area.type == 'PROPERTIES':
             area.spaces[0].context = 'MODIFIER'
 
-def apply_soft_falloff(bm, old_coords, moved_coords, radius, falloff_type='SMOOTH', world_mx=None, connected_only=False, connected_depth=0):
+def apply_soft_falloff(bm, old_coords, moved_coords, radius, falloff_type='SMOOTH', world_mx=None, connected_only=False, connected_depth=0, mesh=None):
     """
-    Proportional falloff for unselected vertices from moved vertices (KDTree distance queries).
+    Proportional falloff for unselected vertices from moved vertices.
+    old_coords is a {BMVert: co} dict or an (N, 3) array of every vertex in index order.
+    Coordinates are snapshotted into arrays once; neighbour search and kernels run in
+    soft_falloff, and only affected vertices are written back. Pass the edit mesh to reuse
+    its cached adjacency (mesh_adjacency) for connected_only.
     """
-    if radius <= 0.0:
+    if radius <= 0.0 or not moved_coords:
         return
 
-    unselected_verts = [v for v in bm.verts if v not in moved_coords]
-    if not unselected_verts:
+    bm.verts.index_update()
+    n = len(bm.verts)
+    if isinstance(old_coords, np.ndarray):
+        if old_coords.shape != (n, 3):
+            return
+        old = old_coords
+        known = np.ones(n, dtype=bool)
+    else:
+        old = np.zeros((n, 3), dtype=np.float64)
+        known = np.zeros(n, dtype=bool)
+        old_idx = np.fromiter((v.index for v in old_coords), dtype=np.int64, count=len(old_coords))
+        old[old_idx] = np.fromiter(
+            (c for co in old_coords.values() for c in co), dtype=np.float64, count=len(old_coords) * 3
+        ).reshape(-1, 3)
+        known[old_idx] = True
+
+    moved_idx = np.fromiter((v.index for v in moved_coords), dtype=np.int64, count=len(moved_coords))
+    new_co = np.fromiter(
+        (c for co in moved_coords.values() for c in co), dtype=np.float64, count=len(moved_coords) * 3
+    ).reshape(-1, 3)
+    valid = known[moved_idx]
+    moved_idx, new_co = moved_idx[valid], new_co[valid]
+    deltas = new_co - old[moved_idx]
+    live = np.einsum("ij,ij->i", deltas, deltas) > 1e-8
+    if not live.any():
         return
 
+    candidates = known.copy()
+    candidates[moved_idx] = False
     if connected_only:
-        visited = set(moved_coords.keys())
-        valid_unselected = set()
-        queue = collections.deque([(v, 0) for v in moved_coords.keys()])
-
-        while queue:
-            curr_v, depth = queue.popleft()
-            
-            if connected_depth > 0 and depth >= connected_depth:
-                continue
-                
-            for edge in curr_v.link_edges:
-                neighbor = edge.other_vert(curr_v)
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    if neighbor not in moved_coords:
-                        valid_unselected.add(neighbor)
-                    queue.append((neighbor, depth + 1))
-        
-        unselected_verts = [v for v in unselected_verts if v in valid_unselected]
-        if not unselected_verts:
-            return
+        seeds = np.fromiter((v.index for v in moved_coords), dtype=np.int64, count=len(moved_coords))
+        candidates &= mesh_adjacency.shared_adjacency(bm, mesh).reachable(seeds, connected_depth)
 
-    moved_deltas = {}
-    for v, new_co in moved_coords.items():
-        old_co = old_coords[v]
-        delta = new_co - old_co
-        if delta.length_squared > 1e-8:
-            moved_deltas[v] = delta
+    query_idx = np.nonzero(candidates)[0]
+    if query_idx.size == 0:
+        return
 
-    if not moved_deltas:
+    src_idx = moved_idx[live]
+    src_co, query_co = old[src_idx], old[query_idx]
+    if world_mx:
+        src_co = mesh_arrays.transform_points(world_mx, src_co)
+        query_co = mesh_arrays.transform_points(world_mx, query_co)
+    rows, offsets = soft_falloff.blend_offsets(src_co, deltas[live], query_co, radius, falloff_type)
+    if rows.size == 0:
         return
 
-    size = len(moved_deltas)
-    kd = mathutils.kdtree.KDTree(size)
-    
-    delta_list = []
-    for i, (v, delta) in enumerate(moved_deltas.items()):
-        co = old_coords[v]
-        if world_mx:
-            co = world_mx @ co
-        kd.insert(co, i)
-        delta_list.append(delta)
-        
-    kd.balance()
-
-    for v_u in unselected_verts:
-        u_old_co = old_coords[v_u]
-        search_co = world_mx @ u_old_co if world_mx else u_old_co
-
-        in_range = kd.find_range(search_co, radius)
-        if not in_range:
-            continue
-            
-        sum_delta = Vector((0, 0, 0))
-        sum_weight = 0.0
-        max_falloff = 0.0
-
-        for (co, index, dist) in in_range:
-            ratio = dist / radius
-            if ratio >= 1.0:
-                falloff = 0.0
-            elif falloff_type == 'SPHERE':
-                falloff = math.sqrt(max(0.0, 1.0 - ratio * ratio))
-            elif falloff_type == 'ROOT':
-                falloff = math.sqrt(max(0.0, 1.0 - ratio))
-            elif falloff_type == 'LINEAR':
-                falloff = 1.0 - ratio
-            elif falloff_type == 'SHARP':
-                falloff = (1.0 - ratio) ** 2
-            else: # SMOOTH
-                falloff = (1.0 - ratio * ratio) ** 2
-            
-            sum_delta += delta_list[index] * falloff
-            sum_weight += falloff
-            if falloff > max_falloff:
-                max_falloff = falloff
-        
-        if sum_weight > 0:
-            blended_delta = sum_delta / sum_weight
-            v_u.co = u_old_co + blended_delta * max_falloff
+    hit_idx = query_idx[rows]
+    bm.verts.ensure_lookup_table()
+    verts = bm.verts
+    for i, co in zip(hit_idx.tolist(), (old[hit_idx] + offsets).tolist()):
+        verts[i].co = co
 
 
 # ---------------------------------------------------------------------------
@@ -26,6 +26,12 @@ from . import triplanar_mapping
 from . import trim_extend
 from . import viewport_tools
 from . import window_areas
+from ..modules import bounds_cache
+from ..modules import draw_mesh_snap_cache
+from ..modules import hover_pick_index
+from ..modules import mesh_adjacency
+from ..modules import redo_snapshot
+from ..modules import snap_occlusion
 
 classes = (
     *align.classes,
@@ -58,12 +64,36 @@ classes = (
 
 _app_handlers = []
 
+
+def _add_persistent_handler(handler_list, handler_func):
+    """Append a cache handler that survives file loads (see _on_load_post)."""
+    handler_func = bpy.app.handlers.persistent(handler_func)
+    handler_list.append(handler_func)
+    _app_handlers.append((handler_list, handler_func))
+
+
+@bpy.app.handlers.persistent
+def _on_load_post(*_):
+    """Pointer-keyed caches must not outlive the file whose data they describe."""
+    draw_mesh_snap_cache.reset_updates()
+    hover_pick_index.clear()
+    snap_occlusion.invalidate()
+    mesh_adjacency.clear()
+    redo_snapshot.clear()
+    bounds_cache.invalidate()
+
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
     depsgraph_handler = edit_mesh.depsgraph_update_handler
     bpy.app.handlers.depsgraph_update_post.append(depsgraph_handler)
     _app_handlers.append((bpy.app.handlers.depsgraph_update_post, depsgraph_handler))
+    _add_persistent_handler(bpy.app.handlers.depsgraph_update_post, hover_pick_index.depsgraph_update_handler)
+    _add_persistent_handler(bpy.app.handlers.depsgraph_update_post, snap_occlusion.depsgraph_update_handler)
+    _add_persistent_handler(bpy.app.handlers.depsgraph_update_post, mesh_adjacency.depsgraph_update_handler)
+    _add_persistent_handler(bpy.app.handlers.depsgraph_update_post, bounds_cache.depsgraph_update_handler)
+    _add_persistent_handler(bpy.app.handlers.depsgraph_update_post, draw_mesh_snap_cache.depsgraph_update_handler)
+    _add_persistent_handler(bpy.app.handlers.load_post, _on_load_post)
 
 def unregister():
     import importlib
@@ -77,6 +107,11 @@ def unregister():
     distribute_gaps_overlay.unregister_preview()
     notice_overlay.unregister()
     edit_mesh.unregister_draw_handler()
+    hover_pick_index.clear()
+    mesh_adjacency.clear()
+    redo_snapshot.clear()
+    bounds_cache.clear()
+    draw_mesh_snap_cache.shutdown_warmup()
     auto_linked_mode._exit_auto_linked()
     angle_rays.post_unregister()
     edit_mesh_circle_arc.clear_three_point_circle_session()
@@ -256,40 +256,19 @@ class AlignBase:
         self._restore_state()
         target = context.active_object
         sources = [o for o in context.selected_objects if o != target]
-        for source in sources:
-            align_tools.align_orientation(
-                source,
-                target,
-                x=self.orient_x,
-                y=self.orient_y,
-                z=self.orient_z,
-                offset_x=self.orient_offset_x,
-                offset_y=self.orient_offset_y,
-                offset_z=self.orient_offset_z,
-            )
-            align_tools.match_scale(
-                source,
-                target,
-                x=self.scale_x,
-                y=self.scale_y,
-                z=self.scale_z,
-                offset_x=self.scale_offset_x,
-                offset_y=self.scale_offset_y,
-                offset_z=self.scale_offset_z,
-            )
-            align_tools.align_position(
-                source,
-                target,
-                x=self.align_x,
-                y=self.align_y,
-                z=self.align_z,
-                source_point=self.source_point,
-                target_point=self.target_point,
-                use_active_orient=self.use_active_orient,
-                offset_x=self.offset_x,
-                offset_y=self.offset_y,
-                offset_z=self.offset_z,
-            )
+        align_tools.align_to_target(
+            sources,
+            target,
+            position=(self.align_x, self.align_y, self.align_z),
+            position_offset=(self.offset_x, self.offset_y, self.offset_z),
+            source_point=self.source_point,
+            target_point=self.target_point,
+            use_active_orient=self.use_active_orient,
+            rotation=(self.orient_x, self.orient_y, self.orient_z),
+            rotation_offset=(self.orient_offset_x, self.orient_offset_y, self.orient_offset_z),
+            scale=(self.scale_x, self.scale_y, self.scale_z),
+            scale_offset=(self.scale_offset_x, self.scale_offset_y, self.scale_offset_z),
+        )
         return {"FINISHED"}
 
 
@@ -14,6 +14,7 @@ from mathutils import Matrix, Vector
 
 from ..modules import edit_mesh_draw_state as draw_state
 from ..modules import edit_mesh_helpers as emh
+from ..modules import hover_pick_index
 from ..modules import status_bar
 from ..modules.utils import tag_view3d_redraw
 from ..modules.fillet_geometry import (
@@ -376,6 +377,7 @@ def _apply_angle_rays(context, divisions: int, length: float, reflex: bool) -> i
     _pick_session['created_edge_keys'] = []
     _pick_session['applied'] = True
     bmesh.update_edit_mesh(obj.data)
+    hover_pick_index.invalidate()
     _clear_preview()
     return created
 
@@ -1,29 +1,49 @@
 import bmesh
 import bpy
+import numpy as np
 import traceback
 
+from ..modules import mesh_adjacency
 from ..modules.edit_mesh_helpers import bmesh_select_linked_island, bmesh_subtract_linked_islands
+from ..modules.selection_watch import SelectionWatch
 
 # --- Auto-linked mode: timer poll (depsgraph does not run on selection-only edits) ---
 _auto_linked_active = False
-_last_sel_hash: tuple | None = None
+_watch = SelectionWatch()
 _applying_linked = False
 _wm_timer = None
 _ctrl_held = False
 _pending_ctrl_subtract = False
 
 
-def _vert_selection_hash(mesh) -> tuple:
+def _sync_watch(mesh) -> np.ndarray:
     bm = bmesh.from_edit_mesh(mesh)
     try:
+        return _watch.sync(mesh, bm)
+    finally:
+        bm.free()
+
+
+def _resync_islands(mesh, mask: np.ndarray, seeds: np.ndarray) -> None:
+    """After our own island edit, re-read only the verts of the islands it touched."""
+    bm = bmesh.from_edit_mesh(mesh)
+    try:
+        adj = mesh_adjacency.shared_adjacency(bm, mesh)
+        if mask.shape[0] != adj.n_verts:
+            _watch.sync(mesh, bm)
+            return
+        touched = adj.island_verts(adj.islands_of(seeds)).tolist()
         bm.verts.ensure_lookup_table()
-        return tuple(sorted(v.index for v in bm.verts if v.select))
+        verts = bm.verts
+        mask = mask.copy()
+        mask[touched] = np.fromiter((verts[i].select for i in touched), dtype=bool, count=len(touched))
+        _watch.sync(mesh, bm, mask)
     finally:
         bm.free()
 
 
 def _tick_auto_linked(context):
-    """Compare selection to last hash; expand linked, linked-subtract (Ctrl), or keep Blender result."""
+    """Compare selection to the last one; expand linked, linked-subtract (Ctrl), or keep Blender result."""
     if not _auto_linked_active or _applying_linked:
         return
     try:
@@ -34,7 +54,7 @@ def _tick_auto_linked(context):
 
 def _tick_auto_linked_impl(context):
     """Inner tick: bmesh ops can raise if mesh/mode changes mid-frame."""
-    global _last_sel_hash, _applying_linked, _pending_ctrl_subtract
+    global _applying_linked, _pending_ctrl_subtract
     if context.mode != "EDIT_MESH":
         return
     obj = context.active_object
@@ -42,27 +62,37 @@ def _tick_auto_linked_impl(context):
         return
 
     mesh = obj.data
-    h = _vert_selection_hash(mesh)
-    if h == _last_sel_hash:
+    bm = bmesh.from_edit_mesh(mesh)
+    try:
+        if not _watch.poll(mesh, bm):
+            return
+        old = _watch.mask
+        new = _watch.sync(mesh, bm)
+    finally:
+        bm.free()
+    comparable = old is not None and old.shape == new.shape
+    if comparable and np.array_equal(old, new):
         return
 
-    if not h:
-        _last_sel_hash = h
+    if not new.any():
         _pending_ctrl_subtract = False
         return
 
-    # Stale pending: only valid for a shrink; discard if selection grew or changed non-monotonically
-    if _last_sel_hash is not None and not (set(h) < set(_last_sel_hash)):
+    # Strict shrink (new ⊂ old); a stale pending subtract is only valid for a shrink.
+    shrink = comparable and not (new & ~old).any()
+    if not shrink:
         _pending_ctrl_subtract = False
 
-    if _last_sel_hash is not None and set(h) < set(_last_sel_hash):
-        _applying_linked = True
-        try:
-            if _pending_ctrl_subtract or _ctrl_held:
-                bmesh_subtract_linked_islands(mesh, set(_last_sel_hash), set(h))
-            _last_sel_hash = _vert_selection_hash(mesh)
-        finally:
-            _applying_linked = False
+    if shrink:
+        if _pending_ctrl_subtract or _ctrl_held:
+            _applying_linked = True
+            try:
+                bmesh_subtract_linked_islands(
+                    mesh, set(np.nonzero(old)[0].tolist()), set(np.nonzero(new)[0].tolist())
+                )
+                _resync_islands(mesh, new, np.nonzero(old & ~new)[0])
+            finally:
+                _applying_linked = False
         _pending_ctrl_subtract = False
         if context.area:
             context.area.tag_redraw()
@@ -70,8 +100,9 @@ def _tick_auto_linked_impl(context):
 
     _applying_linked = True
     try:
-        bmesh_select_linked_island(mesh)
-        _last_sel_hash = _vert_selection_hash(mesh)
+        seeds = np.nonzero(new)[0]
+        bmesh_select_linked_island(mesh, seeds)
+        _resync_islands(mesh, new, seeds)
     finally:
         _applying_linked = False
     _pending_ctrl_subtract = False
@@ -104,24 +135,25 @@ def _timer_stop(context=None):
 
 
 def _enter_auto_linked(context):
-    global _auto_linked_active, _last_sel_hash, _ctrl_held, _pending_ctrl_subtract
+    global _auto_linked_active, _watch, _ctrl_held, _pending_ctrl_subtract
     _auto_linked_active = True
     _ctrl_held = False
     _pending_ctrl_subtract = False
+    _watch = SelectionWatch()
     obj = context.active_object
     if obj and obj.type == "MESH":
         try:
-            _last_sel_hash = _vert_selection_hash(obj.data)
+            _sync_watch(obj.data)
         except Exception:
-            _last_sel_hash = None
-    else:
-        _last_sel_hash = None
+            _watch.reset()
 
 
 def _exit_auto_linked(context=None):
-    global _auto_linked_active, _last_sel_hash, _ctrl_held, _pending_ctrl_subtract
+    global _auto_linked_active, _ctrl_held, _pending_ctrl_subtract
+    if _auto_linked_active and bpy.app.debug:
+        print(f"Auto linked selection watch: {_watch.summary()}")
     _auto_linked_active = False
-    _last_sel_hash = None
+    _watch.reset()
     _ctrl_held = False
     _pending_ctrl_subtract = False
     _timer_stop(context)
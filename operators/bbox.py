@@ -17,11 +17,13 @@ class ALEC_OT_bbox_dialog(bpy.types.Operator):
         name="Axes",
         description=(
             "World: XYZ axis-aligned bounds. Combined selection + Local: all geometry in active's local space; "
-            "Each object + Local: one cage per mesh, aligned to that object's axes"
+            "Each object + Local: one cage per mesh, aligned to that object's axes. "
+            "Oriented: smallest-volume box fitted to the geometry, whatever the object transforms"
         ),
         items=[
             ("LOCAL", "Local", "Local axes—depends on Combined vs Each object toggle"),
             ("WORLD", "World", "World XYZ bounds"),
+            ("OBB", "Oriented", "Minimum-volume box fitted to the evaluated geometry"),
         ],
         default="LOCAL",
     )  # type: ignore
@@ -91,6 +93,7 @@ class ALEC_OT_bbox_dialog(bpy.types.Operator):
         row_ax = layout.row(align=True)
         row_ax.prop_enum(self, "bbox_space", "LOCAL")
         row_ax.prop_enum(self, "bbox_space", "WORLD")
+        row_ax.prop_enum(self, "bbox_space", "OBB")
         row_ax.separator(factor=0.65)
         row_ax.prop(self, "bbox_each_object", toggle=True, text="Each")
 
@@ -134,58 +137,18 @@ class ALEC_OT_bbox_dialog(bpy.types.Operator):
 
         pad = self.bbox_padding
         dual = bool(self.bbox_padding_second_object) and abs(pad) > 1e-20
-        cages = []
-
-        if self.bbox_each_object:
-            cages = list(
-                bbox_tools.iter_bbox_helpers_for_selected(
-                    context,
-                    mode=self.bbox_space,
-                    apply_extras=self.helper_setup,
-                    pad=pad,
-                    dual=dual,
-                )
-            )
-            if not cages:
-                self.redo_bbox_helpers_json = "[]"
-                self.report({"WARNING"}, "Could not evaluate mesh bounds.")  # type: ignore
-                return {"CANCELLED"}
-        elif dual:
-            tight = bbox_tools.create_bbox(
-                context,
-                mode=self.bbox_space,
-                apply_extras=self.helper_setup,
-                margin=0.0,
-                name_suffix="",
-            )
-            if tight is None:
-                self.redo_bbox_helpers_json = "[]"
-                self.report({"WARNING"}, "Could not evaluate mesh bounds.")  # type: ignore
-                return {"CANCELLED"}
-            cages.append(tight)
-            outer = bbox_tools.create_bbox(
-                context,
-                mode=self.bbox_space,
-                apply_extras=self.helper_setup,
-                margin=pad,
-                name_suffix="_p",
-                wire_color=bbox_tools.BBOX_HELPER_COLOR_PADDED,
-            )
-            if outer is not None:
-                cages.append(outer)
-        else:
-            bbox = bbox_tools.create_bbox(
-                context,
-                mode=self.bbox_space,
-                apply_extras=self.helper_setup,
-                margin=pad,
-                name_suffix="",
-            )
-            if bbox is None:
-                self.redo_bbox_helpers_json = "[]"
-                self.report({"WARNING"}, "Could not evaluate mesh bounds.")  # type: ignore
-                return {"CANCELLED"}
-            cages.append(bbox)
+        cages = bbox_tools.build_bbox_helpers(
+            context,
+            mode=self.bbox_space,
+            each_object=self.bbox_each_object,
+            apply_extras=self.helper_setup,
+            pad=pad,
+            dual=dual,
+        )
+        if not cages:
+            self.redo_bbox_helpers_json = "[]"
+            self.report({"WARNING"}, "Could not evaluate mesh bounds.")  # type: ignore
+            return {"CANCELLED"}
 
         self.redo_bbox_helpers_json = json.dumps([c.name for c in cages])
 
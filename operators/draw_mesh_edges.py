@@ -2,6 +2,7 @@
 import math
 import time
 import bpy
+import numpy as np
 import bmesh
 from mathutils import Matrix, Vector
 from bpy_extras.view3d_utils import (
@@ -13,6 +14,7 @@ from bpy_extras.view3d_utils import (
 from ..modules import edit_mesh_draw_state as draw_state
 from ..modules import cursor_plane as cp
 from ..modules import draw_mesh_snap_cache as snap_cache
+from ..modules import snap_occlusion
 from ..modules import modal_handler, status_bar, viewport_header
 from ..modules.transform_orientation import orientation_matrix_world
 
@@ -20,17 +22,24 @@ _PREVIEW_MIN_INTERVAL = 1.0 / 60.0
 
 
 class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
-    """Draw polylines on the 3D cursor work plane. Snaps verts/mids/perp (from chain); [Shift] ortho;
+    """Draw polylines on the 3D cursor work plane. Snaps verts/mids/perp (from chain)/edge
+    crossings on the plane (incl. the rubber band); [Shift] ortho;
     [A] type angle vs last edge (Enter locks); [B] toggle 90° vs last edge (needs 2+ chain verts).
     [Q] toggles free 3D preview (viewport ray vs mesh, else depth through chain, else plane).
-    Outside X-ray / wire shading, snaps skip geometry behind first viewport-ray hit (opaque depth).
-    [X/Y/Z] axis; [V]/[W] snap; type length like edge-length (mouse when no digits,
+    Outside X-ray / wire shading, snaps skip candidates hidden behind visible geometry (opaque depth).
+    [X/Y/Z] axis; [V]/[W]/[I] obj / world / intersection snap; type length like edge-length (mouse when no digits,
     digits + Enter commits); [C] close; [Bksp] undoes vert or clears typing; [RMB]
     / close snap finishes; plain [Enter] exits; [Esc] clears typing or exits."""
     bl_idname = "alec.draw_mesh_edges"
     bl_label = "Draw Mesh Edges"
     bl_options = {'REGISTER', 'UNDO', 'BLOCKING'}
 
+    snap_intersections: bpy.props.BoolProperty(
+        name="Snap Intersections",
+        default=False,
+        description="Snap to edge crossings on the cursor plane and where the rubber band crosses an edge",
+    )  # type: ignore
+
     @classmethod
     def poll(cls, context):
         return context.area is not None and context.area.type == "VIEW_3D"
@@ -48,6 +57,7 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
         self._axis_lock: str | None = None
         self._snap_verts_on: bool = True
         self._snap_other_on: bool = False
+        self._snap_isect_on: bool = bool(self.snap_intersections)
         self._ignore_draw_plane: bool = False
         self.number_input = modal_handler.ModalNumberInput()
         self.angle_input = modal_handler.ModalNumberInput()
@@ -58,8 +68,11 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
             event.mouse_region_y,
         )
         self._snap_cache = snap_cache.DrawMeshSnapCache()
+        self._occlusion = snap_occlusion.SnapOcclusion()
+        self._warm_timer = None
         self._last_preview_time = 0.0
         self._world_snap_warned = False
+        self._isect_snap_warned = False
 
         if context.mode == "EDIT_MESH" and context.active_object is not None and context.active_object.type == "MESH":
             self._obj = context.active_object
@@ -84,6 +97,7 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
         draw_state.refresh_edit_mesh_px_handler(context)
 
         self._update_cursor_plane_visual(context)
+        self._warm_snap_caches(context, world=self._snap_other_on)
         self._set_status(context)
         self._update_area_header(context)
 
@@ -93,6 +107,12 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
         return {'RUNNING_MODAL'}
 
     def modal(self, context, event):
+        if event.type == 'TIMER':
+            if self._warm_timer is not None and self._snap_cache.poll_warmup():
+                self._stop_warm_timer(context)
+                self._set_status(context)
+            return {'PASS_THROUGH'}
+
         _nav_pass_types = {
             'MIDDLEMOUSE',
             'WHEELUPMOUSE',
@@ -295,6 +315,16 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
         if event.type == 'W' and event.value == 'PRESS':
             self._snap_other_on = not self._snap_other_on
             status_bar.show_toggle_notice("World Snap", "ON" if self._snap_other_on else "OFF")
+            if self._snap_other_on:
+                self._warm_snap_caches(context, world=True)
+            self._set_status(context)
+            self._refresh_preview(context)
+            return {'RUNNING_MODAL'}
+
+        if event.type == 'I' and event.value == 'PRESS':
+            self._snap_isect_on = not self._snap_isect_on
+            self.snap_intersections = self._snap_isect_on
+            status_bar.show_toggle_notice("Isect Snap", "ON" if self._snap_isect_on else "OFF")
             self._set_status(context)
             self._refresh_preview(context)
             return {'RUNNING_MODAL'}
@@ -393,6 +423,7 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
             return False
         bm.verts.ensure_lookup_table()
         bm.edges.ensure_lookup_table()
+        snap_key = snap_cache.mesh_topology_key(me, bm)
         try:
             inv = self._obj.matrix_world.inverted()
         except Exception:
@@ -409,7 +440,7 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
         self._chain_vert_indices.append(new_vert.index)
         bmesh.update_edit_mesh(me)
         me.update_tag()
-        self._invalidate_snap_cache()
+        self._snap_cache_appended(bm, me, snap_key)
         self._axis_lock = None
         return True
 
@@ -632,6 +663,7 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
             ortho = "ON" if self._ortho_on else "OFF"
             v_snap = "ON" if self._snap_verts_on else "OFF"
             w_snap = "ON" if self._snap_other_on else "OFF"
+            i_snap = "ON" if self._snap_isect_on else "OFF"
             plc = '3D' if self._ignore_draw_plane else 'Plane'
             axis = self._axis_lock if self._axis_lock else "—"
             ang = (
@@ -650,10 +682,11 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
             else:
                 num_part = ""
             sep = " " if num_part else ""
+            warming = " (warming…)" if self._snap_cache.is_warming else ""
             status_bar.set_message(
                 context,
                 f"[LMB]Add [Bksp]Undo/buffer [RMB]Finish [C]Close "
-                f"[Shift]Ortho:{ortho} [V]ObjSnap:{v_snap} [W]WorldSnap:{w_snap} "
+                f"[Shift]Ortho:{ortho} [V]ObjSnap:{v_snap} [W]WorldSnap:{w_snap}{warming} [I]Isect:{i_snap} "
                 f"[Q]{plc}"
                 f" [X/Y/Z]Axis:{axis} [A]Ang:{ang} [B]90°{sep}{num_part} [Enter/Esc]Exit",
             )
@@ -843,8 +876,6 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
             draw_state._draw_data['cursor_plane'] = (center, u, v)
         except Exception:
             draw_state._draw_data.pop('cursor_plane', None)
-        if self._snap_other_on and not self._ignore_draw_plane:
-            self._snap_cache.invalidate_world()
 
     def _resolve_3d_position(
         self,
@@ -862,29 +893,21 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
         origin_w = region_2d_to_origin_3d(region, rv3d, coord)
         direction_w = region_2d_to_vector_3d(region, rv3d, coord).normalized()
 
-        need_ray = (
-            self._ignore_draw_plane
-            or self._viewport_snap_respects_opaque_depth(context)
-        )
+        # Snap occlusion uses the session BVH (snap_occlusion); the scene ray is only
+        # needed for free 3D placement.
         depsgraph_rp = None
         ray_hit_world = None
-        ray_t = None
-        if need_ray:
+        if self._ignore_draw_plane:
             try:
                 depsgraph_rp = context.evaluated_depsgraph_get()
             except Exception:
                 depsgraph_rp = None
-            ray_t, ray_hit_world = self._viewport_ray_pick(
+            _ray_t, ray_hit_world = self._viewport_ray_pick(
                 context, depsgraph_rp, origin_w, direction_w
             )
-        occlusion_t = (
-            ray_t
-            if self._viewport_snap_respects_opaque_depth(context)
-            else None
-        )
 
         snap_pos, snap_idx, snap_raw_world = self._screen_snap_discrete(
-            context, coord, occlusion_t, origin_w, direction_w
+            context, coord, origin_w, direction_w
         )
         if snap_pos is not None:
             anchor = (
@@ -1036,37 +1059,32 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
                 return origin_w + dir_w * td
         return cp.intersect_cursor_plane(context, origin_w, dir_w)
 
-    def _snap_occludes_candidate(
-        self,
-        occlusion_t: float | None,
-        origin_w: Vector,
-        dir_w: Vector,
-        world_co: Vector,
-        context,
-    ) -> bool:
-        """True if world_co is farther along the viewport ray than the first surface hit (+ slack)."""
-        if occlusion_t is None:
+    def _snap_occludes_candidate(self, context, world_co: Vector) -> bool:
+        """True if visible geometry lies between world_co and the eye (opaque depth only)."""
+        if not self._viewport_snap_respects_opaque_depth(context):
             return False
-        t = (world_co - origin_w).dot(dir_w)
-        scl = getattr(context.scene.unit_settings, 'scale_length', 1.0) or 1.0
-        slack = max(scl * 1e-4, 1e-5, abs(occlusion_t) * 1e-6 + abs(t) * 1e-6)
-        return t > occlusion_t + slack
+        return self._occlusion.occludes(context, context.region_data, world_co)
+
+    def _snap_occluded_mask(self, context, points: np.ndarray) -> np.ndarray:
+        """Batch form of _snap_occludes_candidate for (N, 3) world points."""
+        if not self._viewport_snap_respects_opaque_depth(context):
+            return np.zeros(points.shape[0], dtype=bool)
+        return self._occlusion.occluded_mask(context, context.region_data, points)
 
     def _screen_snap_discrete(
         self,
         context,
         coord,
-        occlusion_t: float | None,
         origin_w: Vector,
         dir_w: Vector,
     ) -> tuple[Vector | None, int | None, Vector | None]:
         """Projected plane hit, sentinel index, optional raw snap point (world) for projected snaps."""
-        if not self._snap_verts_on and not self._snap_other_on:
+        if not self._snap_verts_on and not self._snap_other_on and not self._snap_isect_on:
             return None, None, None
 
         region = context.region
         rv3d = context.region_data
-        hit = self._query_snap_cache(context, coord, occlusion_t, origin_w, dir_w)
+        hit = self._query_snap_cache(context, coord, origin_w, dir_w)
         if hit is None:
             return None, None, None
         best_idx = hit.snap_idx
@@ -1090,7 +1108,6 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
         region,
         rv3d,
         coord,
-        occlusion_t: float | None,
         origin_w: Vector,
         dir_w: Vector,
         context,
@@ -1100,27 +1117,81 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
         prev_world = self._last_chain_world_pos()
         if prev_world is None:
             return hit
+        mw = self._obj.matrix_world
         perp = snap_cache.best_obj_perpendicular_snap(
             bm,
-            self._obj.matrix_world,
+            mw,
             region,
             rv3d,
             coord,
             float(self._screen_snap_radius_px),
             prev_world,
-            self._snap_occludes_candidate,
-            occlusion_t,
-            origin_w,
-            dir_w,
-            context,
+            lambda co: self._snap_occludes_candidate(context, co),
+            edge_ends=self._snap_cache.obj_edge_ends(
+                bm, mw, snap_cache.mesh_topology_key(self._obj.data, bm)
+            ),
+            occluded_mask_fn=lambda pts: self._snap_occluded_mask(context, pts),
         )
         return snap_cache.pick_closer_snap_hit(region, rv3d, coord, hit, perp)
 
+    def _merge_intersection_snaps(
+        self,
+        hit: snap_cache.SnapHit | None,
+        bm,
+        region,
+        rv3d,
+        coord,
+        origin_w: Vector,
+        dir_w: Vector,
+        context,
+    ) -> snap_cache.SnapHit | None:
+        """Edge–edge crossings on the cursor plane, plus where the rubber band crosses an edge."""
+        if not self._snap_isect_on:
+            return hit
+        _n, u_ax, v_ax = cp.cursor_plane_axes(context)
+        self._snap_cache.ensure_intersections(
+            bm,
+            self._obj.matrix_world,
+            snap_cache.mesh_topology_key(self._obj.data, bm),
+            (context.scene.cursor.location, u_ax, v_ax),
+        )
+        if self._snap_cache.intersections_truncated and not self._isect_snap_warned:
+            self._isect_snap_warned = True
+            status_bar.show_toggle_notice(
+                "Isect snap",
+                "limited (dense mesh)",
+            )
+        radius = float(self._screen_snap_radius_px)
+        isect = self._snap_cache.find_best(
+            region,
+            rv3d,
+            coord,
+            radius,
+            lambda co: self._snap_occludes_candidate(context, co),
+            use_obj=False,
+            use_world=False,
+            use_isect=True,
+        )
+        hit = snap_cache.pick_closer_snap_hit(region, rv3d, coord, hit, isect)
+        prev_world = self._last_chain_world_pos()
+        band_end = cp.intersect_cursor_plane(context, origin_w, dir_w) if prev_world is not None else None
+        if band_end is not None:
+            band = self._snap_cache.band_intersection_snap(
+                region,
+                rv3d,
+                coord,
+                radius,
+                prev_world,
+                band_end,
+                lambda co: self._snap_occludes_candidate(context, co),
+            )
+            hit = snap_cache.pick_closer_snap_hit(region, rv3d, coord, hit, band)
+        return hit
+
     def _query_snap_cache(
         self,
         context,
         coord,
-        occlusion_t: float | None,
         origin_w: Vector,
         dir_w: Vector,
     ):
@@ -1135,6 +1206,7 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
         except Exception:
             return None
 
+        hit = None
         use_kd = snap_cache.should_use_obj_kdtree(bm)
         if use_kd or self._snap_other_on:
             if self._snap_verts_on:
@@ -1161,6 +1233,7 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
                     self._obj,
                     ignore_draw_plane=self._ignore_draw_plane,
                     world_key=snap_cache.world_snap_cache_key(context),
+                    radius_px=float(self._screen_snap_radius_px),
                 )
                 if self._snap_cache.world_snap_truncated and not self._world_snap_warned:
                     self._world_snap_warned = True
@@ -1169,41 +1242,26 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
                         "limited (dense scene)",
                     )
             hit = self._snap_cache.find_best(
+                region,
+                rv3d,
                 coord,
                 float(self._screen_snap_radius_px),
-                occlusion_t,
-                origin_w,
-                dir_w,
-                context,
-                self._snap_occludes_candidate,
+                lambda co: self._snap_occludes_candidate(context, co),
                 use_obj=self._snap_verts_on,
                 use_world=self._snap_other_on,
             )
             hit = self._merge_obj_perpendicular_snap(
-                hit, bm, region, rv3d, coord, occlusion_t, origin_w, dir_w, context
+                hit, bm, region, rv3d, coord, origin_w, dir_w, context
             )
-            if hit is not None:
-                return hit
 
-        if not self._snap_verts_on:
-            return None
+        if hit is None and self._snap_verts_on:
+            hit = self._screen_snap_brute(bm, region, rv3d, coord, context)
 
-        return self._screen_snap_brute(
-            bm, me, region, rv3d, coord, occlusion_t, origin_w, dir_w, context
+        return self._merge_intersection_snaps(
+            hit, bm, region, rv3d, coord, origin_w, dir_w, context
         )
 
-    def _screen_snap_brute(
-        self,
-        bm,
-        me,
-        region,
-        rv3d,
-        coord,
-        occlusion_t,
-        origin_w,
-        dir_w,
-        context,
-    ):
+    def _screen_snap_brute(self, bm, region, rv3d, coord, context):
         """Linear scan for small meshes (cheaper than building a KD-tree)."""
         radius_sq = self._screen_snap_radius_px * self._screen_snap_radius_px
         best_d2 = radius_sq
@@ -1215,15 +1273,13 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
         if self._snap_verts_on:
             for v in bm.verts:
                 world_co = mw @ v.co
-                if self._snap_occludes_candidate(occlusion_t, origin_w, dir_w, world_co, context):
-                    continue
                 p2 = location_3d_to_region_2d(region, rv3d, world_co)
                 if p2 is None:
                     continue
                 dx = p2.x - coord[0]
                 dy = p2.y - coord[1]
                 d2 = dx * dx + dy * dy
-                if d2 < best_d2:
+                if d2 < best_d2 and not self._snap_occludes_candidate(context, world_co):
                     best_d2 = d2
                     best_idx = v.index
                     best_world = world_co
@@ -1232,15 +1288,13 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
             for e in bm.edges:
                 mid_local = (e.verts[0].co + e.verts[1].co) * 0.5
                 mid_w = mw @ mid_local
-                if self._snap_occludes_candidate(occlusion_t, origin_w, dir_w, mid_w, context):
-                    continue
                 p2 = location_3d_to_region_2d(region, rv3d, mid_w)
                 if p2 is None:
                     continue
                 dx = p2.x - coord[0]
                 dy = p2.y - coord[1]
                 d2 = dx * dx + dy * dy
-                if d2 < best_d2:
+                if d2 < best_d2 and not self._snap_occludes_candidate(context, mid_w):
                     best_d2 = d2
                     best_idx = snap_cache.SNAP_IDX_EDGE_MID
                     best_world = mid_w
@@ -1259,17 +1313,18 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
                 coord,
                 float(self._screen_snap_radius_px),
                 prev_world,
-                self._snap_occludes_candidate,
-                occlusion_t,
-                origin_w,
-                dir_w,
-                context,
+                lambda co: self._snap_occludes_candidate(context, co),
+                occluded_mask_fn=lambda pts: self._snap_occluded_mask(context, pts),
             )
             hit = snap_cache.pick_closer_snap_hit(region, rv3d, coord, hit, perp)
         return hit
 
-    def _invalidate_snap_cache(self) -> None:
-        self._snap_cache.invalidate_mesh()
+    def _snap_cache_appended(self, bm, me, old_key: tuple) -> None:
+        """Feed verts / edges this operator appended to the snap cache (no full rebuild)."""
+        self._snap_cache.append_obj(
+            bm, self._obj.matrix_world, old_key, snap_cache.mesh_topology_key(me, bm)
+        )
+        self._occlusion.note_loose_edit()
 
     def _on_click(self, context) -> bool:
         """Returns True when the polyline was closed via snap sentinel (operator should exit)."""
@@ -1282,6 +1337,7 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
             return False
         bm.verts.ensure_lookup_table()
         bm.edges.ensure_lookup_table()
+        snap_key = snap_cache.mesh_topology_key(me, bm)
 
         snap_idx = self._preview_snap_vert_index
 
@@ -1292,7 +1348,7 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
                 self._safe_new_edge(bm, first_idx, last_idx)
                 bmesh.update_edit_mesh(me)
                 me.update_tag()
-                self._invalidate_snap_cache()
+                self._snap_cache_appended(bm, me, snap_key)
                 self._end_chain()
                 self._axis_lock = None
                 self._edge_angle_deg = None
@@ -1329,7 +1385,7 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
         self._chain_vert_indices.append(new_vert.index)
         bmesh.update_edit_mesh(me)
         me.update_tag()
-        self._invalidate_snap_cache()
+        self._snap_cache_appended(bm, me, snap_key)
         self._axis_lock = None
         self.number_input.reset()
         self._typing_angle = False
@@ -1366,10 +1422,11 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
             bm = bmesh.from_edit_mesh(me)
         except Exception:
             return
+        snap_key = snap_cache.mesh_topology_key(me, bm)
         self._safe_new_edge(bm, self._chain_vert_indices[0], self._chain_vert_indices[-1])
         bmesh.update_edit_mesh(me)
         me.update_tag()
-        self._invalidate_snap_cache()
+        self._snap_cache_appended(bm, me, snap_key)
         self._end_chain()
         self._axis_lock = None
         self._edge_angle_deg = None
@@ -1394,7 +1451,12 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
             self._refresh_preview(context)
             return
 
+        snap_key = snap_cache.mesh_topology_key(me, bm)
         last_vert = bm.verts[last_idx]
+        # Verts that may be deleted below (with their indices before deletion) and the local
+        # end coordinates of the deleted edge, so the snap cache can drop them in place.
+        watched = [(last_vert, last_idx)]
+        removed_edges = []
 
         if len(self._chain_vert_indices) >= 2:
             prev_idx = self._chain_vert_indices[-2]
@@ -1402,6 +1464,8 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
                 prev_vert = bm.verts[prev_idx]
                 edge = bm.edges.get((prev_vert, last_vert))
                 if edge is not None:
+                    watched.append((prev_vert, prev_idx))
+                    removed_edges.append((edge.verts[0].co.copy(), edge.verts[1].co.copy()))
                     bmesh.ops.delete(bm, geom=[edge], context='EDGES')
                     bm.verts.ensure_lookup_table()
                     if last_idx < len(bm.verts):
@@ -1410,6 +1474,7 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
                         self._chain_vert_indices.pop()
                         bmesh.update_edit_mesh(me)
                         me.update_tag()
+                        self._snap_cache_removed(bm, me, snap_key, watched, removed_edges)
                         self._refresh_preview(context)
                         return
 
@@ -1419,11 +1484,77 @@ class ALEC_OT_draw_mesh_edges(bpy.types.Operator):
         self._chain_vert_indices.pop()
         bmesh.update_edit_mesh(me)
         me.update_tag()
-        self._invalidate_snap_cache()
+        self._snap_cache_removed(bm, me, snap_key, watched, removed_edges)
         self._refresh_preview(context)
 
+    def _snap_cache_removed(self, bm, me, old_key: tuple, watched, removed_edges) -> None:
+        """Drop verts / edges deleted by undo from the snap cache (rebuild if indices shifted)."""
+        bm.verts.index_update()
+        removed_verts = [idx for v, idx in watched if not v.is_valid]
+        self._snap_cache.remove_obj(
+            self._obj.matrix_world,
+            old_key,
+            snap_cache.mesh_topology_key(me, bm),
+            removed_verts,
+            removed_edges,
+        )
+        self._occlusion.note_loose_edit()
+
+    def _warm_snap_caches(self, context, *, world: bool) -> None:
+        """Read snap arrays now and build their indexes on the warm-up thread.
+
+        Until the builds land (polled from a modal timer), snapping scans the arrays brute force.
+        """
+        region = context.region
+        rv3d = context.region_data
+        if region is None or rv3d is None:
+            return
+        me = self._obj.data
+        try:
+            bm = bmesh.from_edit_mesh(me)
+        except Exception:
+            bm = None
+        if bm is not None and self._snap_verts_on and (
+            snap_cache.should_use_obj_kdtree(bm) or self._snap_other_on
+        ):
+            self._snap_cache.ensure_obj(
+                bm,
+                self._obj.matrix_world,
+                region,
+                rv3d,
+                snap_cache.mesh_topology_key(me, bm),
+                include_verts=True,
+                include_edge_mids=True,
+                background=True,
+            )
+        if world:
+            try:
+                depsgraph = context.evaluated_depsgraph_get()
+            except Exception:
+                depsgraph = None
+            self._snap_cache.ensure_world(
+                context,
+                depsgraph,
+                region,
+                rv3d,
+                self._obj,
+                ignore_draw_plane=self._ignore_draw_plane,
+                world_key=snap_cache.world_snap_cache_key(context),
+                radius_px=float(self._screen_snap_radius_px),
+                background=True,
+            )
+        if self._snap_cache.is_warming and self._warm_timer is None:
+            self._warm_timer = context.window_manager.event_timer_add(0.1, window=context.window)
+
+    def _stop_warm_timer(self, context) -> None:
+        if self._warm_timer is not None:
+            context.window_manager.event_timer_remove(self._warm_timer)
+            self._warm_timer = None
+
     def _cleanup(self, context, cancelled: bool):
+        self._stop_warm_timer(context)
         self._snap_cache.invalidate_all()
+        self._occlusion.clear()
         draw_state._draw_data.pop('draw_rubber_band', None)
         draw_state._draw_data.pop('draw_rubber_band_label', None)
         draw_state._draw_data.pop('draw_snap_ring', None)
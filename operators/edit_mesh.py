@@ -1,8 +1,9 @@
 import bpy
 import bmesh
 import math
+import numpy as np
 from mathutils import Matrix, Vector
-from ..modules import modal_handler, status_bar, utils
+from ..modules import arc_length, mesh_arrays, modal_handler, plane_fit, status_bar, utils
 from ..modules import edit_mesh_draw_state as draw_state
 from ..modules import edit_mesh_helpers as emh
 from ..modules.edit_mesh_helpers import get_boundary_and_interior_verts, relax_planar_vertices
@@ -550,78 +551,28 @@ class ALEC_OT_distribute_vertices(bpy.types.Operator):
             self.report({'WARNING'}, "Select at least 3 vertices forming a chain")
             return {'CANCELLED'}
 
-        adj = {v: [] for v in selected_verts}
-        for edge in bm.edges:
-            if edge.select and edge.verts[0] in selected_verts and edge.verts[1] in selected_verts:
-                adj[edge.verts[0]].append(edge.verts[1])
-                adj[edge.verts[1]].append(edge.verts[0])
+        bm.verts.index_update()
+        pairs = np.array(
+            [(e.verts[0].index, e.verts[1].index) for e in bm.edges if e.select], dtype=np.int64
+        ).reshape(-1, 2)
+        degree = np.bincount(pairs.ravel(), minlength=len(bm.verts))
+        endpoints = [v for v in selected_verts if degree[v.index] == 1]
 
-        endpoints = [v for v, neighbors in adj.items() if len(neighbors) == 1]
-        
         if len(endpoints) != 2:
             self.report({'WARNING'}, "Selection must form a single, unbranched chain of edges.")
             return {'CANCELLED'}
 
-        ordered_chain = []
-        current_vert = endpoints[0]
-        prev_vert = None
-        
-        while current_vert:
-            ordered_chain.append(current_vert)
-            if len(ordered_chain) > len(selected_verts):
-                 self.report({'WARNING'}, "Selection seems to contain a loop. Operation aborted.")
-                 return {'CANCELLED'}
-            
-            neighbors = adj.get(current_vert, [])
-            next_vert = None
-            for v in neighbors:
-                if v != prev_vert:
-                    next_vert = v
-                    break
-            
-            prev_vert = current_vert
-            current_vert = next_vert
-
-        if len(ordered_chain) != len(selected_verts):
+        walk = arc_length.walk_chain(pairs, endpoints[0].index)
+        if walk is None or len(walk) != len(selected_verts):
             self.report({'WARNING'}, "Selection contains disconnected parts. Select a continuous chain.")
             return {'CANCELLED'}
 
-        original_coords = [v.co.copy() for v in ordered_chain]
-
-        distances = [0.0]
-        total_length = 0.0
-        for i in range(len(ordered_chain) - 1):
-            p1 = original_coords[i]
-            p2 = original_coords[i+1]
-            segment_length = (p2 - p1).length
-            total_length += segment_length
-            distances.append(total_length)
-
-        if total_length < 1e-6:
+        bm.verts.ensure_lookup_table()
+        ordered_chain = [bm.verts[i] for i in walk.tolist()]
+        if emh.distribute_chain_vertices(ordered_chain) == 0:
             self.report({'INFO'}, "Chain has zero length, nothing to do.")
             return {'CANCELLED'}
 
-        num_segments = len(ordered_chain) - 1
-        equal_segment_length = total_length / num_segments
-        
-        for i in range(1, num_segments):
-            target_dist = i * equal_segment_length
-
-            current_segment_idx = next((j for j, d in enumerate(distances) if d >= target_dist), len(distances) - 2)
-            if distances[current_segment_idx] > target_dist:
-                current_segment_idx -= 1
-
-            p_start = original_coords[current_segment_idx]
-            p_end = original_coords[current_segment_idx + 1]
-            
-            original_segment_len = (p_end - p_start).length
-            
-            if original_segment_len > 1e-9:
-                dist_into_segment = target_dist - distances[current_segment_idx]
-                interpolation_factor = dist_into_segment / original_segment_len
-                new_pos = p_start.lerp(p_end, interpolation_factor)
-                ordered_chain[i].co = new_pos
-
         bmesh.update_edit_mesh(me)
         return {'FINISHED'}
 
@@ -670,6 +621,7 @@ class ALEC_OT_make_collinear(ProportionalFalloffMixin, bpy.types.Operator):
 
     def invoke(self, context, event):
         self.reset_proportional_falloff()
+        self.begin_redo_session()
         self.flatten_interior = 1.0
         self.relax_interior = 0.0
         return self.execute(context)
@@ -727,7 +679,7 @@ class ALEC_OT_make_collinear(ProportionalFalloffMixin, bpy.types.Operator):
             dist = vec.dot(line_direction)
             projections.append((dist, v))
 
-        old_coords = {v: v.co.copy() for v in bm.verts}
+        old_coords = self.falloff_snapshot(bm, me)
         moved_coords = {}
 
         if self.distribute and len(projections) > 1:
@@ -751,7 +703,7 @@ class ALEC_OT_make_collinear(ProportionalFalloffMixin, bpy.types.Operator):
         for v, new_co in moved_coords.items():
             v.co = new_co
 
-        self.process_falloff(bm, old_coords, moved_coords, world_mx)
+        self.process_falloff(bm, old_coords, moved_coords, world_mx, me)
 
         bmesh.update_edit_mesh(me)
         return {'FINISHED'}
@@ -766,13 +718,25 @@ class ALEC_OT_make_coplanar(ProportionalFalloffMixin, bpy.types.Operator):
         name="Mode",
         description="How to determine the alignment plane",
         items=[
-            ('BEST_FIT', "Best Fit", "Use the three most defining vertices in the selection"),
+            ('BEST_FIT', "Best Fit", "Least-squares plane through all selected vertices"),
+            ('THREE_POINT', "Three Vertices", "Use the three most defining vertices in the selection (previous Best Fit)"),
             ('HISTORY', "Last Three Selected", "Use the last three vertices selected to define the plane"),
             ('ACTIVE_FACE', "Active Face Normal", "Align to the plane defined by the active face")
         ],
         default='BEST_FIT'
     ) # type: ignore
 
+    fit_method: bpy.props.EnumProperty(
+        name="Fit",
+        description="How Best Fit treats vertices far from the plane",
+        items=[
+            (plane_fit.FIT_LEAST_SQUARES, "Least Squares", "Every selected vertex weighs equally"),
+            (plane_fit.FIT_TRIMMED, "Trimmed", "Refit without the vertices farthest from the plane"),
+            (plane_fit.FIT_RANSAC, "RANSAC", "Fit the plane supported by most vertices, ignoring outliers"),
+        ],
+        default=plane_fit.FIT_LEAST_SQUARES
+    ) # type: ignore
+
     factor: bpy.props.FloatProperty(
         name="Factor",
         description="Influence of the operation",
@@ -800,6 +764,14 @@ class ALEC_OT_make_coplanar(ProportionalFalloffMixin, bpy.types.Operator):
         subtype='FACTOR'
     ) # type: ignore
 
+    relax_iterations: bpy.props.IntProperty(
+        name="Relax Iterations",
+        description="Maximum relax passes (stops early once the interior settles)",
+        default=10,
+        min=1,
+        max=1000
+    ) # type: ignore
+
     @classmethod
     def poll(cls, context):
         return emh.poll_mesh_or_curve_collinear_coplanar(context)
@@ -807,14 +779,19 @@ class ALEC_OT_make_coplanar(ProportionalFalloffMixin, bpy.types.Operator):
     def draw(self, context):
         layout = self.layout
         layout.prop(self, "mode")
+        if self.mode == 'BEST_FIT':
+            layout.prop(self, "fit_method")
         layout.prop(self, "factor")
         if context.mode == 'EDIT_MESH' and context.tool_settings.mesh_select_mode[2]:
             layout.prop(self, "flatten_interior")
             layout.prop(self, "relax_interior")
+            if self.relax_interior > 0.0:
+                layout.prop(self, "relax_iterations")
         self.draw_falloff(layout)
 
     def invoke(self, context, event):
         self.reset_proportional_falloff()
+        self.begin_redo_session()
         return self.execute(context)
 
     def execute(self, context):
@@ -824,7 +801,7 @@ class ALEC_OT_make_coplanar(ProportionalFalloffMixin, bpy.types.Operator):
         me = obj.data
         bm = bmesh.from_edit_mesh(me)
 
-        old_coords = {v: v.co.copy() for v in bm.verts}
+        old_coords = self.falloff_snapshot(bm, me)
 
         boundary_verts, interior_verts, selected_verts = get_boundary_and_interior_verts(bm, context)
         
@@ -842,34 +819,26 @@ class ALEC_OT_make_coplanar(ProportionalFalloffMixin, bpy.types.Operator):
                 return {'CANCELLED'}
             plane_normal = (world_mx.to_3x3() @ active_elem.normal).normalized()
             plane_point = world_mx @ active_elem.calc_center_median()
+        elif self.mode == 'BEST_FIT':
+            world_co = mesh_arrays.transform_points(
+                world_mx, np.array([tuple(v.co) for v in selected_verts], dtype=np.float64)
+            )
+            fit = plane_fit.fit_plane(world_co, self.fit_method)
+            if fit is None:
+                self.report({'WARNING'}, "Could not define a plane from selection (are vertices collinear?)")
+                return {'CANCELLED'}
+            plane_point = Vector(fit[0].tolist())
+            plane_normal = Vector(fit[1].tolist())
         else:
             plane_def_verts = []
 
-            if self.mode == 'BEST_FIT':
-                v_a, v_b = None, None
-                max_dist_sq = -1.0
-                for i in range(len(selected_verts)):
-                    for j in range(i + 1, len(selected_verts)):
-                        dist_sq = (selected_verts[i].co - selected_verts[j].co).length_squared
-                        if dist_sq > max_dist_sq:
-                            max_dist_sq = dist_sq
-                            v_a, v_b = selected_verts[i], selected_verts[j]
-
-                v_c = None
-                max_line_dist_sq = -1.0
-                line_vec = v_b.co - v_a.co
-                if line_vec.length_squared > 1e-9:
-                    for v in selected_verts:
-                        if v == v_a or v == v_b: continue
-                        dist_sq = (v.co - v_a.co).cross(line_vec).length_squared
-                        if dist_sq > max_line_dist_sq:
-                            max_line_dist_sq = dist_sq
-                            v_c = v
-
-                if not all([v_a, v_b, v_c]):
+            if self.mode == 'THREE_POINT':
+                local_co = np.array([tuple(v.co) for v in selected_verts], dtype=np.float64)
+                picked = plane_fit.three_point_indices(local_co)
+                if picked is None:
                     self.report({'WARNING'}, "Could not define a plane from selection (are vertices collinear?)")
                     return {'CANCELLED'}
-                plane_def_verts = [v_a, v_b, v_c]
+                plane_def_verts = [selected_verts[i] for i in picked]
 
             elif self.mode == 'HISTORY':
                 active_elem = bm.select_history.active
@@ -908,7 +877,9 @@ class ALEC_OT_make_coplanar(ProportionalFalloffMixin, bpy.types.Operator):
 
         if interior_verts and self.relax_interior > 0.0:
             local_normal = (inv_world_mx.to_3x3() @ plane_normal).normalized()
-            relax_planar_vertices(interior_verts, local_normal, self.relax_interior * self.factor)
+            relax_planar_vertices(
+                interior_verts, local_normal, self.relax_interior * self.factor, self.relax_iterations
+            )
 
         moved_verts = set(boundary_verts)
         if interior_verts:
@@ -916,7 +887,7 @@ class ALEC_OT_make_coplanar(ProportionalFalloffMixin, bpy.types.Operator):
             
         moved_coords = {v: v.co.copy() for v in moved_verts}
 
-        self.process_falloff(bm, old_coords, moved_coords, world_mx)
+        self.process_falloff(bm, old_coords, moved_coords, world_mx, me)
 
         bmesh.update_edit_mesh(me)
         return {'FINISHED'}
@@ -232,6 +232,7 @@ class ALEC_OT_make_circle(ProportionalFalloffMixin, bpy.types.Operator):
 
     def invoke(self, context, event):
         self.reset_proportional_falloff()
+        self.begin_redo_session()
         self.flatten_interior = 0.0
         self.relax_interior = 0.0
         obj = context.active_object
@@ -251,7 +252,7 @@ class ALEC_OT_make_circle(ProportionalFalloffMixin, bpy.types.Operator):
         obj = context.active_object
         bm = bmesh.from_edit_mesh(obj.data)
 
-        old_coords = {v: v.co.copy() for v in bm.verts}
+        old_coords = self.falloff_snapshot(bm, obj.data)
 
         boundary_verts, interior_verts, _ = get_boundary_and_interior_verts(bm, context)
         verts = boundary_verts
@@ -315,7 +316,7 @@ class ALEC_OT_make_circle(ProportionalFalloffMixin, bpy.types.Operator):
 
         moved_coords = {v: v.co.copy() for v in moved_verts}
 
-        self.process_falloff(bm, old_coords, moved_coords, obj.matrix_world)
+        self.process_falloff(bm, old_coords, moved_coords, obj.matrix_world, obj.data)
 
         bmesh.update_edit_mesh(obj.data)
         return {'FINISHED'}
@@ -404,6 +405,7 @@ class ALEC_OT_make_square(ProportionalFalloffMixin, bpy.types.Operator):
 
     def invoke(self, context, event):
         self.reset_proportional_falloff()
+        self.begin_redo_session()
         self.flatten_interior = 0.0
         self.relax_interior = 0.0
         self.spin = 0.0
@@ -421,7 +423,7 @@ class ALEC_OT_make_square(ProportionalFalloffMixin, bpy.types.Operator):
         obj = context.active_object
         bm = bmesh.from_edit_mesh(obj.data)
 
-        old_coords = {v: v.co.copy() for v in bm.verts}
+        old_coords = self.falloff_snapshot(bm, obj.data)
 
         boundary_verts, interior_verts, _ = get_boundary_and_interior_verts(bm, context)
         if len(boundary_verts) < 4:
@@ -525,7 +527,7 @@ class ALEC_OT_make_square(ProportionalFalloffMixin, bpy.types.Operator):
             moved_verts.update(interior_verts)
 
         moved_coords = {v: v.co.copy() for v in moved_verts}
-        self.process_falloff(bm, old_coords, moved_coords, obj.matrix_world)
+        self.process_falloff(bm, old_coords, moved_coords, obj.matrix_world, obj.data)
 
         bmesh.update_edit_mesh(obj.data)
         return {'FINISHED'}
@@ -30,6 +30,7 @@ from mathutils import Vector
 
 from ..modules import edit_mesh_draw_state as draw_state
 from ..modules import edit_mesh_helpers as emh
+from ..modules import hover_pick_index
 from ..modules import modal_handler, status_bar, viewport_header
 from ..modules.fillet_geometry import (
     _EPS,
@@ -461,6 +462,7 @@ class ALEC_OT_fillet_edges(bpy.types.Operator):
             ok = _apply_arc(bm, ea, eb, self._preview, mw)
         if ok:
             bmesh.update_edit_mesh(self._obj.data)
+            hover_pick_index.invalidate()
             self._obj.data.update_tag()
             self._cleanup(context)
             return 'FINISHED'
@@ -1,7 +1,9 @@
 """BMesh helpers for auto-linked selection and the open-edge grow operator."""
 import bmesh
 import bpy
-from collections import deque
+import numpy as np
+
+from ..modules import mesh_adjacency
 
 
 def _boundary_edge_seeds(bm: bmesh.types.BMesh) -> list:
@@ -21,42 +23,34 @@ def _boundary_edge_seeds(bm: bmesh.types.BMesh) -> list:
     return seeds
 
 
-def _expand_boundary_component(bm: bmesh.types.BMesh, seeds: list) -> set:
-    """Return set of BMEdge; BFS uses identity only while the same `bm` is active."""
-    visited: set = set()
-    dq = deque(seeds)
-    while dq:
-        e = dq.popleft()
-        if e in visited:
-            continue
-        if len(e.link_faces) != 1:
-            continue
-        visited.add(e)
-        for v in e.verts:
-            for le in v.link_edges:
-                if le in visited or len(le.link_faces) != 1:
-                    continue
-                dq.append(le)
-    return visited
-
-
-def _apply_edge_component_selection(bm: bmesh.types.BMesh, component: set) -> None:
-    """Apply edge (and endpoint vert) selection by index — BMEdge `in set` can mismatch `bm.edges` iteration."""
-    bm.verts.ensure_lookup_table()
+def _expand_boundary_component(bm: bmesh.types.BMesh, seeds: list, mesh=None) -> np.ndarray:
+    """Indices of open edges connected (through shared verts) to any seed edge."""
+    adj = mesh_adjacency.shared_adjacency(bm, mesh)
+    boundary = adj.edge_face_count(bm) == 1
+    labels = adj.component_labels(boundary)
+    seed_idx = np.fromiter((e.index for e in seeds), dtype=np.int64, count=len(seeds))
+    seed_idx = seed_idx[boundary[seed_idx]]
+    hit = np.zeros(adj.n_verts, dtype=bool)
+    hit[labels[adj.edge_verts[seed_idx, 0]]] = True
+    return np.nonzero(boundary & hit[labels[adj.edge_verts[:, 0]]])[0]
+
+
+def _apply_edge_component_selection(bm: bmesh.types.BMesh, edge_idx: np.ndarray) -> None:
+    """Select exactly the given edges (by index) and their endpoint verts."""
     bm.edges.ensure_lookup_table()
-    bm.faces.ensure_lookup_table()
-    edge_idx = {e.index for e in component}
-    vert_idx: set = set()
-    for e in component:
-        for v in e.verts:
-            vert_idx.add(v.index)
+    edge_sel = np.zeros(len(bm.edges), dtype=bool)
+    edge_sel[edge_idx] = True
+    vert_sel = np.zeros(len(bm.verts), dtype=bool)
+    for i in edge_idx.tolist():
+        for v in bm.edges[i].verts:
+            vert_sel[v.index] = True
     # In bmesh, deselecting faces after edges are selected clears edge/vert selection; clear faces first.
     for f in bm.faces:
         f.select_set(False)
-    for v in bm.verts:
-        v.select_set(v.index in vert_idx)
-    for e in bm.edges:
-        e.select_set(e.index in edge_idx)
+    for v, sel in zip(bm.verts, vert_sel.tolist()):
+        v.select_set(sel)
+    for e, sel in zip(bm.edges, edge_sel.tolist()):
+        e.select_set(sel)
 
 
 class ALEC_OT_mesh_select_open_edges_connected(bpy.types.Operator):
@@ -86,7 +80,7 @@ class ALEC_OT_mesh_select_open_edges_connected(bpy.types.Operator):
             self.report({'WARNING'}, "Select at least one open (boundary) edge")
             return {'CANCELLED'}
 
-        component = _expand_boundary_component(bm, seeds)
+        component = _expand_boundary_component(bm, seeds, mesh)
         _apply_edge_component_selection(bm, component)
 
         context.tool_settings.mesh_select_mode = (False, True, False)
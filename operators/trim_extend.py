@@ -25,6 +25,7 @@ from ..modules import edit_mesh_draw_state as draw_state
 from ..modules import status_bar
 from ..modules import cursor_plane as cp
 from ..modules import edit_mesh_helpers as emh
+from ..modules import hover_pick_index
 
 
 _EPS = emh.DRAFT_EPS
@@ -565,6 +566,7 @@ class _TrimExtendBase:
 
         if applied:
             bmesh.update_edit_mesh(self._obj.data)
+            hover_pick_index.invalidate()
             self._obj.data.update_tag()
             bm.verts.ensure_lookup_table()
             bm.edges.ensure_lookup_table()
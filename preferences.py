@@ -1,5 +1,5 @@
 import bpy
-from bpy.props import BoolProperty, IntProperty
+from bpy.props import BoolProperty, EnumProperty, IntProperty
 from bpy.types import AddonPreferences
 
 
@@ -286,8 +286,9 @@ class ALEC_AddonPreferences(AddonPreferences):
     draw_mesh_snap_max_verts_per_object: IntProperty(
         name="Max vertices per object (world snap)",
         description=(
-            "Draw Mesh Edges: world snap ([W]) skips mesh objects whose evaluated "
-            "vertex count exceeds this limit."
+            "Draw Mesh Edges: world snap ([W]) with the Screen KD-tree index skips "
+            "on-screen mesh objects whose evaluated vertex count exceeds this limit "
+            "(off-screen objects are culled by bounds and never counted)."
         ),
         default=12_000,
         min=1_000,
@@ -296,8 +297,9 @@ class ALEC_AddonPreferences(AddonPreferences):
     draw_mesh_snap_max_verts_total: IntProperty(
         name="Max vertices total (world snap)",
         description=(
-            "Draw Mesh Edges: cap on how many vertices are indexed for world snap "
-            "across the whole scene (dense scenes show a limited notice)."
+            "Draw Mesh Edges: with the Screen KD-tree index, cap on how many on-screen "
+            "vertices are indexed for world snap (dense views show a limited notice). "
+            "The World index has no cap."
         ),
         default=40_000,
         min=5_000,
@@ -313,6 +315,24 @@ class ALEC_AddonPreferences(AddonPreferences):
         min=32,
         max=100_000,
     )
+    draw_mesh_snap_index_mode: EnumProperty(
+        name="Snap index",
+        description="Draw Mesh Edges: acceleration structure used for vertex / midpoint snapping.",
+        items=(
+            (
+                'WORLD',
+                "World (view-independent)",
+                "World-space point index queried with the mouse ray; orbit / pan / zoom "
+                "need no rebuild",
+            ),
+            (
+                'SCREEN',
+                "Screen KD-tree",
+                "Projected 2D KD-tree; rebuilt whenever the view changes",
+            ),
+        ),
+        default='WORLD',
+    )
 
     apply_blender_workflow_defaults: BoolProperty(
         name="Apply Blender workflow defaults",
@@ -497,6 +517,7 @@ class ALEC_AddonPreferences(AddonPreferences):
         col_snap.prop(self, "draw_mesh_snap_max_verts_per_object")
         col_snap.prop(self, "draw_mesh_snap_max_verts_total")
         col_snap.prop(self, "draw_mesh_snap_kdtree_min_elements")
+        col_snap.prop(self, "draw_mesh_snap_index_mode")
 
         box_workflow = layout.box()
         box_workflow.label(text="Blender workflow defaults")
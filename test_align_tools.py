@@ -0,0 +1,102 @@
+"""Batched distribute / align moves (modules/align_tools) with parented selections.
+
+align_tools needs bpy. Run from repo root:
+  blender --background --python test_align_tools.py
+Without Blender the tests are skipped.
+"""
+from __future__ import annotations
+
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+
+ADDON_ROOT = Path(__file__).resolve().parent
+
+if str(ADDON_ROOT) not in sys.path:
+    sys.path.insert(0, str(ADDON_ROOT))
+
+HAS_BPY = importlib.util.find_spec("bpy") is not None
+
+
+@unittest.skipUnless(HAS_BPY, "align_tools needs bpy (run inside Blender)")
+class ParentedMovesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        import bpy
+        from mathutils import Vector
+
+        from modules import align_tools
+
+        self.bpy = bpy
+        self.Vector = Vector
+        self.align_tools = align_tools
+        self.created = []
+
+    def tearDown(self) -> None:
+        for obj in reversed(self.created):
+            self.bpy.data.objects.remove(obj, do_unlink=True)
+
+    def _empty(self, name: str, world, parent=None):
+        obj = self.bpy.data.objects.new(name, None)
+        self.bpy.context.scene.collection.objects.link(obj)
+        obj.parent = parent
+        self.bpy.context.view_layer.update()
+        obj.matrix_world.translation = world
+        self.bpy.context.view_layer.update()
+        self.created.append(obj)
+        return obj
+
+    def _assert_at(self, obj, world) -> None:
+        for got, want in zip(obj.matrix_world.translation, world):
+            self.assertAlmostEqual(got, want, places=4, msg=obj.name)
+
+    def _distribute_pair(self, child_x: float, parent_x: float) -> None:
+        a = self._empty("A", (0.0, 0.0, 0.0))
+        parent = self._empty("Parent", (parent_x, 2.0, 0.0))
+        child = self._empty("Child", (child_x, -1.0, 0.0), parent=parent)
+        b = self._empty("B", (9.0, 0.0, 0.0))
+        ok, _msg = self.align_tools.distribute_objects_positions(
+            [a, parent, child, b], self.Vector((1.0, 0.0, 0.0)), "PIVOT"
+        )
+        self.assertTrue(ok)
+        # Pivots 0 / 3 / 6 / 9 whichever of the pair sorts first.
+        self._assert_at(parent, (3.0 if parent_x < child_x else 6.0, 2.0, 0.0))
+        self._assert_at(child, (3.0 if child_x < parent_x else 6.0, -1.0, 0.0))
+        self._assert_at(b, (9.0, 0.0, 0.0))
+
+    def test_distribute_child_sorted_before_parent(self) -> None:
+        self._distribute_pair(child_x=1.0, parent_x=5.0)
+
+    def test_distribute_child_sorted_after_parent(self) -> None:
+        self._distribute_pair(child_x=5.0, parent_x=1.0)
+
+    def test_distribute_keeps_child_endpoint(self) -> None:
+        parent = self._empty("Parent", (2.0, 0.0, 0.0))
+        end = self._empty("End", (10.0, 0.0, 0.0), parent=parent)
+        start = self._empty("Start", (0.0, 0.0, 0.0))
+        ok, _msg = self.align_tools.distribute_objects_positions(
+            [start, parent, end], self.Vector((1.0, 0.0, 0.0)), "PIVOT", endpoint_objs=(start, end)
+        )
+        self.assertTrue(ok)
+        self._assert_at(parent, (5.0, 0.0, 0.0))
+        self._assert_at(end, (10.0, 0.0, 0.0))
+
+    def test_align_to_target_parented_sources(self) -> None:
+        target = self._empty("Target", (5.0, 5.0, 5.0))
+        parent = self._empty("Parent", (2.0, 0.0, 0.0))
+        # The child hangs from an unselected intermediate object.
+        middle = self._empty("Middle", (0.0, 1.0, 0.0), parent=parent)
+        child = self._empty("Child", (0.0, 3.0, -1.0), parent=middle)
+        for sources in ((child, parent), (parent, child)):
+            with self.subTest(order=[o.name for o in sources]):
+                self.align_tools.align_to_target(sources, target)
+                self._assert_at(parent, (5.0, 5.0, 5.0))
+                self._assert_at(child, (5.0, 5.0, 5.0))
+                parent.matrix_world.translation = (2.0, 0.0, 0.0)
+                self.bpy.context.view_layer.update()
+                child.matrix_world.translation = (0.0, 3.0, -1.0)
+                self.bpy.context.view_layer.update()
+
+
+if __name__ == "__main__":
+    unittest.main(argv=[sys.argv[0]])
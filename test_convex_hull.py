@@ -0,0 +1,85 @@
+"""Convex-hull vertex reduction (modules/convex_hull) vs. projections of all points.
+
+convex_hull hulls with bmesh. Run from repo root:
+  blender --background --python test_convex_hull.py
+Without Blender the tests are skipped.
+"""
+from __future__ import annotations
+
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+ADDON_ROOT = Path(__file__).resolve().parent
+
+if str(ADDON_ROOT) not in sys.path:
+    sys.path.insert(0, str(ADDON_ROOT))
+
+HAS_BMESH = importlib.util.find_spec("bmesh") is not None
+
+
+def _random_directions(n: int, seed: int = 0) -> np.ndarray:
+    dirs = np.random.default_rng(seed).normal(size=(n, 3))
+    return dirs / np.linalg.norm(dirs, axis=1)[:, None]
+
+
+@unittest.skipUnless(HAS_BMESH, "convex_hull needs bmesh (run inside Blender)")
+class HullVerticesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        from modules import convex_hull
+
+        self.convex_hull = convex_hull
+
+    def _check(self, points: np.ndarray) -> np.ndarray:
+        rows = self.convex_hull.hull_vertices(points)
+        self.assertTrue(np.all(np.diff(rows) > 0))
+        self.assertTrue(0 <= rows.min() and rows.max() < points.shape[0])
+        # Affine images (rotated boxes) only see projections: those must be unchanged.
+        dirs = _random_directions(200)
+        full = points @ dirs.T
+        kept = points[rows] @ dirs.T
+        np.testing.assert_allclose(kept.max(axis=0), full.max(axis=0), atol=1e-12)
+        np.testing.assert_allclose(kept.min(axis=0), full.min(axis=0), atol=1e-12)
+        return rows
+
+    def test_cube_keeps_corners(self) -> None:
+        rng = np.random.default_rng(1)
+        corners = np.array([(x, y, z) for x in (-1.0, 1.0) for y in (-1.0, 1.0) for z in (-1.0, 1.0)])
+        points = np.vstack((rng.uniform(-0.9, 0.9, (5000, 3)), corners))
+        rows = self._check(points)
+        np.testing.assert_array_equal(rows, np.arange(5000, 5008))
+
+    def test_random_cloud(self) -> None:
+        rng = np.random.default_rng(2)
+        rows = self._check(rng.normal(size=(20000, 3)) * (3.0, 1.0, 0.5))
+        self.assertLess(rows.size, 1000)
+
+    def test_sphere_surface(self) -> None:
+        # Every point is a hull vertex: nothing may be dropped.
+        rng = np.random.default_rng(3)
+        pts = rng.normal(size=(2000, 3))
+        rows = self._check(pts / np.linalg.norm(pts, axis=1)[:, None])
+        self.assertEqual(rows.size, 2000)
+
+    def test_coplanar(self) -> None:
+        rng = np.random.default_rng(4)
+        flat = np.column_stack((rng.uniform(-1.0, 1.0, (3000, 2)), np.zeros(3000)))
+        rot = np.linalg.qr(rng.normal(size=(3, 3)))[0]
+        self._check(flat @ rot.T + (1.0, 2.0, 3.0))
+
+    def test_collinear(self) -> None:
+        t = np.random.default_rng(5).uniform(-2.0, 2.0, 500)
+        points = np.outer(t, (1.0, -2.0, 0.5)) + (0.3, 0.0, 1.0)
+        rows = self._check(points)
+        np.testing.assert_array_equal(rows, np.unique((np.argmin(t), np.argmax(t))))
+
+    def test_small_and_degenerate(self) -> None:
+        np.testing.assert_array_equal(self.convex_hull.hull_vertices(np.zeros((3, 3))), np.arange(3))
+        self.assertEqual(self.convex_hull.hull_vertices(np.ones((10, 3))).size, 1)
+
+
+if __name__ == "__main__":
+    unittest.main(argv=[sys.argv[0]])
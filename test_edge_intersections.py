@@ -0,0 +1,128 @@
+"""Edge crossing grid (modules/edge_intersections) vs. an all-pairs reference.
+
+edge_intersections imports cursor_plane, which needs bpy. Run from repo root:
+  blender --background --python test_edge_intersections.py
+Without Blender the tests are skipped.
+"""
+from __future__ import annotations
+
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+ADDON_ROOT = Path(__file__).resolve().parent
+
+if str(ADDON_ROOT) not in sys.path:
+    sys.path.insert(0, str(ADDON_ROOT))
+
+HAS_BPY = importlib.util.find_spec("bpy") is not None
+
+ORIGIN = (0.0, 0.0, 0.0)
+U_AXIS = (1.0, 0.0, 0.0)
+V_AXIS = (0.0, 1.0, 0.0)
+
+
+def _brute_crossings(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    out = []
+    for i in range(a.shape[0]):
+        for j in range(i + 1, a.shape[0]):
+            da = b[i, :2] - a[i, :2]
+            db = b[j, :2] - a[j, :2]
+            den = da[0] * db[1] - da[1] * db[0]
+            if abs(den) < 1e-9:
+                continue
+            diff = a[j, :2] - a[i, :2]
+            t = (diff[0] * db[1] - diff[1] * db[0]) / den
+            s = (diff[0] * da[1] - diff[1] * da[0]) / den
+            if 1e-6 < t < 1.0 - 1e-6 and 1e-6 < s < 1.0 - 1e-6:
+                out.append((a[i] + (b[i] - a[i]) * t + a[j] + (b[j] - a[j]) * s) * 0.5)
+    return np.array(out, dtype=np.float64).reshape(-1, 3)
+
+
+def _sorted_rows(pts: np.ndarray) -> np.ndarray:
+    pts = np.round(pts, 9)
+    return pts[np.lexsort(pts.T[::-1])]
+
+
+@unittest.skipUnless(HAS_BPY, "edge_intersections needs bpy (run inside Blender)")
+class EdgeCrossingsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        from modules.edge_intersections import EdgeCrossings
+
+        self.EdgeCrossings = EdgeCrossings
+        rng = np.random.default_rng(7)
+        self.a = np.column_stack((rng.uniform(-5.0, 5.0, (300, 2)), np.zeros(300)))
+        self.b = self.a + np.column_stack((rng.uniform(-1.5, 1.5, (300, 2)), np.zeros(300)))
+        # A few long edges exercise the unbucketed path.
+        self.a[:3, :2] = ((-5.0, -5.0), (-5.0, 5.0), (-5.0, 0.3))
+        self.b[:3, :2] = ((5.0, 5.0), (5.0, -5.0), (5.0, 0.2))
+
+    def test_matches_all_pairs(self) -> None:
+        crossings = self.EdgeCrossings(self.a, self.b, ORIGIN, U_AXIS, V_AXIS)
+        expected = _brute_crossings(self.a, self.b)
+        self.assertFalse(crossings.truncated)
+        self.assertEqual(crossings.points.shape, expected.shape)
+        np.testing.assert_allclose(_sorted_rows(crossings.points), _sorted_rows(expected), atol=1e-9)
+
+    def test_shared_endpoints_are_not_crossings(self) -> None:
+        a = np.array(((0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0)))
+        b = np.array(((1.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 0.0, 0.0)))
+        crossings = self.EdgeCrossings(a, b, ORIGIN, U_AXIS, V_AXIS)
+        self.assertEqual(crossings.points.shape, (0, 3))
+
+    def test_skew_edges_are_not_crossings(self) -> None:
+        # Front and back edges of a solid overlap along the plane normal but never meet.
+        a = np.array(((-1.0, 0.0, 0.0), (0.0, -1.0, 2.0)))
+        b = np.array(((1.0, 0.0, 0.0), (0.0, 1.0, 2.0)))
+        crossings = self.EdgeCrossings(a, b, ORIGIN, U_AXIS, V_AXIS)
+        self.assertEqual(crossings.points.shape, (0, 3))
+        self.assertEqual(crossings.add_edge((-1.0, 0.5, 1.0), (1.0, 0.5, 1.0)).shape, (0, 3))
+
+    def test_edges_meeting_off_the_plane(self) -> None:
+        # Edges crossing in 3D above the plane are kept at their meeting point.
+        a = np.array(((-1.0, 0.0, 2.0), (0.0, -1.0, 1.0)))
+        b = np.array(((1.0, 0.0, 2.0), (0.0, 1.0, 3.0)))
+        crossings = self.EdgeCrossings(a, b, ORIGIN, U_AXIS, V_AXIS)
+        np.testing.assert_allclose(crossings.points, ((0.0, 0.0, 2.0),))
+        added = crossings.add_edge((0.5, -1.0, 2.0), (0.5, 1.0, 2.0))
+        np.testing.assert_allclose(added, ((0.5, 0.0, 2.0),))
+
+    def test_band_crossings(self) -> None:
+        crossings = self.EdgeCrossings(self.a, self.b, ORIGIN, U_AXIS, V_AXIS)
+        p0 = np.array((-4.0, -3.0, 0.0))
+        p1 = np.array((4.5, 2.0, 0.0))
+        band = crossings.band_crossings(p0, p1)
+        both_a = np.vstack((self.a, p0))
+        both_b = np.vstack((self.b, p1))
+        expected = [pt for pt in _brute_crossings(both_a, both_b)]
+        # Keep crossings that involve the band: they lie on the band segment.
+        d = p1 - p0
+        on_band = [pt for pt in expected if np.linalg.norm(np.cross(pt - p0, d)) < 1e-9]
+        self.assertEqual(band.shape[0], len(on_band))
+        np.testing.assert_allclose(_sorted_rows(band), _sorted_rows(np.array(on_band)), atol=1e-9)
+
+    def test_add_and_pop_edge(self) -> None:
+        crossings = self.EdgeCrossings(self.a, self.b, ORIGIN, U_AXIS, V_AXIS)
+        p0 = (-4.0, 4.0, 0.0)
+        p1 = (4.0, -4.0, 0.0)
+        added = crossings.add_edge(p0, p1)
+        self.assertGreater(added.shape[0], 0)
+        # The recent edge takes part in later band queries.
+        band = crossings.band_crossings((-4.0, -4.0, 0.0), (4.0, 4.0, 0.0))
+        self.assertTrue(np.any(np.all(np.abs(band) < 1e-9, axis=1)))
+        popped = crossings.pop_edge(p1, p0)
+        self.assertIs(popped, added)
+        self.assertIsNone(crossings.pop_edge(p0, p1))
+
+    def test_empty(self) -> None:
+        empty = np.empty((0, 3), dtype=np.float64)
+        crossings = self.EdgeCrossings(empty, empty, ORIGIN, U_AXIS, V_AXIS)
+        self.assertEqual(crossings.points.shape, (0, 3))
+        self.assertEqual(crossings.band_crossings((0.0, 0.0, 0.0), (1.0, 1.0, 0.0)).shape, (0, 3))
+
+
+if __name__ == "__main__":
+    unittest.main(argv=[sys.argv[0]])
@@ -0,0 +1,75 @@
+"""Farthest pair (modules/farthest_pair) vs. a brute-force diameter; no Blender needed.
+
+Run from repo root:
+  python -m unittest test_farthest_pair
+"""
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+ADDON_ROOT = Path(__file__).resolve().parent
+
+if str(ADDON_ROOT) not in sys.path:
+    sys.path.insert(0, str(ADDON_ROOT))
+
+from modules import farthest_pair  # noqa: E402
+
+
+def _diameter_sq(points: np.ndarray) -> float:
+    best = 0.0
+    for s in range(0, points.shape[0], 512):
+        diff = points[s:s + 512, None, :] - points[None, :, :]
+        best = max(best, float(np.einsum("ijk,ijk->ij", diff, diff).max()))
+    return best
+
+
+class FarthestPairTest(unittest.TestCase):
+    def _check(self, points: np.ndarray) -> None:
+        i, j = farthest_pair.farthest_pair_indices(points)
+        self.assertLess(i, j)
+        d = points[i] - points[j]
+        self.assertAlmostEqual(float(d @ d), _diameter_sq(points), places=9)
+
+    def test_small_sets_keep_first_pair_on_ties(self) -> None:
+        square = np.array(((0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 1.0, 0.0)))
+        self.assertEqual(farthest_pair.farthest_pair_indices(square), (0, 2))
+
+    def test_fewer_than_two_points(self) -> None:
+        self.assertIsNone(farthest_pair.farthest_pair_indices(np.zeros((1, 3))))
+        self.assertIsNone(farthest_pair.farthest_pair_indices(np.zeros((0, 3))))
+
+    def test_random_cloud(self) -> None:
+        rng = np.random.default_rng(11)
+        self._check(rng.normal(size=(5000, 3)) * (3.0, 1.0, 0.5))
+
+    def test_sphere_surface(self) -> None:
+        # Prunes little: exercises the blockwise fallback.
+        rng = np.random.default_rng(12)
+        pts = rng.normal(size=(3000, 3))
+        self._check(pts / np.linalg.norm(pts, axis=1)[:, None])
+
+    def test_coplanar_circle(self) -> None:
+        # A circle prunes nothing; the coplanar survivors take the 2D hull + calipers path.
+        rng = np.random.default_rng(13)
+        angle = rng.uniform(0.0, 2.0 * np.pi, 6000)
+        flat = np.column_stack((np.cos(angle), np.sin(angle), np.zeros_like(angle)))
+        rot = np.linalg.qr(rng.normal(size=(3, 3)))[0]
+        self._check(flat @ rot.T + (2.0, -1.0, 0.5))
+
+    def test_hull_2d(self) -> None:
+        xy = np.array(((0.0, 0.0), (2.0, 0.0), (1.0, 1.0), (2.0, 2.0), (0.0, 2.0), (1.0, 0.0)))
+        self.assertEqual(farthest_pair.hull_2d(xy), [0, 1, 3, 4])
+
+    def test_fibonacci_directions(self) -> None:
+        dirs = farthest_pair.fibonacci_directions(64)
+        self.assertEqual(dirs.shape, (64, 3))
+        np.testing.assert_allclose(np.linalg.norm(dirs, axis=1), 1.0)
+        np.testing.assert_allclose(dirs.mean(axis=0), 0.0, atol=0.05)
+
+
+if __name__ == "__main__":
+    unittest.main(argv=[sys.argv[0]])
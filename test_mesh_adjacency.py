@@ -0,0 +1,112 @@
+"""CSR vertex adjacency (modules/mesh_adjacency) on edge arrays; no Blender needed.
+
+Only the array paths are covered (face incidence reads a bmesh). Run from repo root:
+  python -m unittest test_mesh_adjacency
+"""
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+ADDON_ROOT = Path(__file__).resolve().parent
+
+if str(ADDON_ROOT) not in sys.path:
+    sys.path.insert(0, str(ADDON_ROOT))
+
+from modules import mesh_adjacency  # noqa: E402
+from modules.mesh_adjacency import MeshAdjacency  # noqa: E402
+
+
+def _grid_edges(cols: int, rows: int, offset: int = 0) -> np.ndarray:
+    """Edges of a cols x rows vertex grid, vertex index offset + y * cols + x."""
+    idx = np.arange(cols * rows).reshape(rows, cols) + offset
+    horizontal = np.stack((idx[:, :-1].ravel(), idx[:, 1:].ravel()), axis=1)
+    vertical = np.stack((idx[:-1, :].ravel(), idx[1:, :].ravel()), axis=1)
+    return np.concatenate((horizontal, vertical))
+
+
+class MeshAdjacencyTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # Two 4 x 3 grids (islands 0..11 and 12..23) plus one loose vertex (24).
+        edges = np.concatenate((_grid_edges(4, 3), _grid_edges(4, 3, offset=12)))
+        self.adj = MeshAdjacency(25, edges)
+
+    def test_csr_neighbours(self) -> None:
+        adj = self.adj
+        for v in range(adj.n_verts):
+            rows = slice(adj.indptr[v], adj.indptr[v + 1])
+            expected = set()
+            for e, (a, b) in enumerate(adj.edge_verts.tolist()):
+                if a == v:
+                    expected.add((b, e))
+                elif b == v:
+                    expected.add((a, e))
+            self.assertEqual(set(zip(adj.nbr[rows].tolist(), adj.nbr_edge[rows].tolist())), expected)
+
+    def test_bfs_depth_is_grid_distance(self) -> None:
+        depth = self.adj.bfs_depth([0])
+        for v in range(12):
+            self.assertEqual(depth[v], v % 4 + v // 4)
+        self.assertTrue(np.all(depth[12:] == -1))
+        limited = self.adj.bfs_depth([0], max_depth=2)
+        self.assertEqual(int(limited.max()), 2)
+        np.testing.assert_array_equal(limited >= 0, (depth >= 0) & (depth <= 2))
+
+    def test_edge_mask_blocks_walks(self) -> None:
+        # Drop the vertical edges: each grid row becomes its own island.
+        mask = np.zeros(self.adj.edge_verts.shape[0], dtype=bool)
+        horizontal = self.adj.edge_verts[:, 1] - self.adj.edge_verts[:, 0] == 1
+        mask[horizontal] = True
+        reach = self.adj.reachable([5], edge_mask=mask)
+        np.testing.assert_array_equal(np.nonzero(reach)[0], [4, 5, 6, 7])
+
+    def test_component_labels(self) -> None:
+        labels = self.adj.component_labels()
+        np.testing.assert_array_equal(labels, [0] * 12 + [12] * 12 + [24])
+        np.testing.assert_array_equal(self.adj.islands_of([3, 13, 20]), [0, 12])
+
+    def test_reachable(self) -> None:
+        np.testing.assert_array_equal(np.nonzero(self.adj.reachable([13]))[0], np.arange(12, 24))
+        self.assertFalse(self.adj.reachable([]).any())
+
+    def test_island_members(self) -> None:
+        np.testing.assert_array_equal(np.sort(self.adj.island_verts([12, 24])), np.arange(12, 25))
+        edges = self.adj.island_edges([0])
+        self.assertEqual(edges.shape[0], 17)
+        self.assertTrue(np.all(self.adj.edge_verts[edges] < 12))
+
+    def test_edges_within(self) -> None:
+        mask = np.zeros(25, dtype=bool)
+        mask[[0, 1, 4]] = True
+        within = self.adj.edge_verts[self.adj.edges_within(mask)].tolist()
+        self.assertEqual(sorted(map(sorted, within)), [[0, 1], [0, 4]])
+
+
+class SharedAdjacencyTest(unittest.TestCase):
+    def test_clear_bumps_revision(self) -> None:
+        before = mesh_adjacency._revision
+        mesh_adjacency.clear()
+        self.assertGreater(mesh_adjacency._revision, before)
+        self.assertIsNone(mesh_adjacency._shared)
+
+    def test_handler_bumps_on_geometry_updates_only(self) -> None:
+        class Update:
+            def __init__(self, geometry: bool) -> None:
+                self.is_updated_geometry = geometry
+
+        class Depsgraph:
+            def __init__(self, *updates) -> None:
+                self.updates = updates
+
+        before = mesh_adjacency._revision
+        mesh_adjacency.depsgraph_update_handler(None, Depsgraph(Update(False)))
+        self.assertEqual(mesh_adjacency._revision, before)
+        mesh_adjacency.depsgraph_update_handler(None, Depsgraph(Update(False), Update(True)))
+        self.assertEqual(mesh_adjacency._revision, before + 1)
+
+
+if __name__ == "__main__":
+    unittest.main(argv=[sys.argv[0]])
@@ -0,0 +1,85 @@
+"""Minimum-volume oriented box (modules/oriented_box) on rotated boxes; no Blender needed.
+
+Run from repo root:
+  python -m unittest test_oriented_box
+"""
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+ADDON_ROOT = Path(__file__).resolve().parent
+
+if str(ADDON_ROOT) not in sys.path:
+    sys.path.insert(0, str(ADDON_ROOT))
+
+from modules import oriented_box  # noqa: E402
+
+
+def _rotation(seed: int) -> np.ndarray:
+    q, r = np.linalg.qr(np.random.default_rng(seed).normal(size=(3, 3)))
+    q = q * np.sign(np.diag(r))
+    if np.linalg.det(q) < 0.0:
+        q[:, 2] *= -1.0
+    return q
+
+
+def _box_points(size, rot: np.ndarray, n: int, seed: int) -> np.ndarray:
+    """Corners plus interior samples of a box with the given size, rotated and moved."""
+    half = np.asarray(size, dtype=np.float64) * 0.5
+    corners = np.array([(x, y, z) for x in (-1.0, 1.0) for y in (-1.0, 1.0) for z in (-1.0, 1.0)])
+    inner = np.random.default_rng(seed).uniform(-1.0, 1.0, (n, 3))
+    return np.vstack((corners, inner)) * half @ rot.T + (1.5, -2.0, 0.25)
+
+
+class MinimumVolumeBoxTest(unittest.TestCase):
+    def _check(self, points: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        rows, mn, mx = oriented_box.minimum_volume_box(points)
+        np.testing.assert_allclose(rows @ rows.T, np.eye(3), atol=1e-12)
+        self.assertAlmostEqual(float(np.linalg.det(rows)), 1.0, places=12)
+        proj = points @ rows.T
+        np.testing.assert_allclose(proj.min(axis=0), mn)
+        np.testing.assert_allclose(proj.max(axis=0), mx)
+        return rows, mn, mx
+
+    def test_rotated_box(self) -> None:
+        size = (4.0, 2.0, 1.0)
+        rot = _rotation(1)
+        points = _box_points(size, rot, 500, seed=2)
+        rows, mn, mx = self._check(points)
+        self.assertAlmostEqual(float(np.prod(mx - mn)), float(np.prod(size)), delta=1e-3)
+        # Each box axis lines up with one of the source axes.
+        align = np.abs(rows @ rot)
+        np.testing.assert_allclose(align.max(axis=1), 1.0, atol=1e-6)
+
+    def test_not_worse_than_principal_axes(self) -> None:
+        rng = np.random.default_rng(3)
+        points = rng.normal(size=(2000, 3)) * (3.0, 1.0, 0.4) @ _rotation(4).T
+        _rows, mn, mx = self._check(points)
+        local = points - points.mean(axis=0)
+        _w, pca = np.linalg.eigh(local.T @ local)
+        proj = points @ pca
+        pca_volume = float(np.prod(proj.max(axis=0) - proj.min(axis=0)))
+        self.assertLessEqual(float(np.prod(mx - mn)), pca_volume * (1.0 + 1e-9))
+
+    def test_flat_input_minimises_area(self) -> None:
+        rot = _rotation(5)
+        points = _box_points((3.0, 1.0, 0.0), rot, 200, seed=6)
+        _rows, mn, mx = self._check(points)
+        ext = np.sort(mx - mn)
+        self.assertLess(ext[0], 1e-9)
+        self.assertAlmostEqual(float(ext[1] * ext[2]), 3.0, delta=1e-3)
+
+    def test_empty_and_single_point(self) -> None:
+        self.assertIsNone(oriented_box.minimum_volume_box(np.empty((0, 3))))
+        rows, mn, mx = oriented_box.minimum_volume_box(np.array(((1.0, 2.0, 3.0),)))
+        np.testing.assert_array_equal(rows, np.eye(3))
+        np.testing.assert_array_equal(mn, (1.0, 2.0, 3.0))
+        np.testing.assert_array_equal(mx, (1.0, 2.0, 3.0))
+
+
+if __name__ == "__main__":
+    unittest.main(argv=[sys.argv[0]])
@@ -0,0 +1,80 @@
+"""LINES vertex packing for overlay batches (modules/overlay_buffers); no Blender needed.
+
+Run from repo root:
+  python -m unittest test_overlay_buffers
+"""
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+ADDON_ROOT = Path(__file__).resolve().parent
+
+if str(ADDON_ROOT) not in sys.path:
+    sys.path.insert(0, str(ADDON_ROOT))
+
+from modules import overlay_buffers  # noqa: E402
+
+
+def _assert_buffer(test: unittest.TestCase, buf: np.ndarray, rows: int) -> None:
+    test.assertEqual(buf.shape, (rows, 3))
+    test.assertEqual(buf.dtype, np.float32)
+    test.assertTrue(buf.flags.c_contiguous)
+
+
+class BoxWireLinesTest(unittest.TestCase):
+    def test_cube_edges(self) -> None:
+        edges = overlay_buffers.CUBE_EDGES
+        self.assertEqual(edges.shape, (12, 2))
+        # Every corner has three edges and no edge repeats.
+        np.testing.assert_array_equal(np.bincount(edges.ravel()), [3] * 8)
+        self.assertEqual(len({tuple(sorted(e)) for e in edges.tolist()}), 12)
+
+    def test_edge_order(self) -> None:
+        rng = np.random.default_rng(1)
+        corners = rng.normal(size=(3, 8, 3))
+        buf = overlay_buffers.box_wire_lines(corners)
+        _assert_buffer(self, buf, 3 * 24)
+        pairs = buf.reshape(3, 12, 2, 3)
+        for b in range(3):
+            for k, (i, j) in enumerate(overlay_buffers.CUBE_EDGES.tolist()):
+                np.testing.assert_array_equal(pairs[b, k, 0], corners[b, i].astype(np.float32))
+                np.testing.assert_array_equal(pairs[b, k, 1], corners[b, j].astype(np.float32))
+
+    def test_flat_corner_list(self) -> None:
+        # A flat (B * 8, 3) corner list packs the same as (B, 8, 3).
+        corners = np.arange(2 * 8 * 3, dtype=np.float64).reshape(2, 8, 3)
+        np.testing.assert_array_equal(
+            overlay_buffers.box_wire_lines(corners.reshape(-1, 3).tolist()),
+            overlay_buffers.box_wire_lines(corners),
+        )
+
+    def test_empty(self) -> None:
+        _assert_buffer(self, overlay_buffers.box_wire_lines(np.empty((0, 8, 3))), 0)
+        _assert_buffer(self, overlay_buffers.box_wire_lines([]), 0)
+
+
+class SegmentLinesTest(unittest.TestCase):
+    def test_pairs_in_order(self) -> None:
+        segments = [((0.0, 0.0, 0.0), (1.0, 2.0, 3.0)), ((-1.0, 0.5, 2.0), (4.0, 4.0, 4.0))]
+        buf = overlay_buffers.segment_lines(segments)
+        _assert_buffer(self, buf, 4)
+        np.testing.assert_array_equal(buf, np.array(segments, dtype=np.float32).reshape(-1, 3))
+
+    def test_non_contiguous_input(self) -> None:
+        points = np.arange(40, dtype=np.float64).reshape(-1, 5)[:, :3]
+        self.assertFalse(points.flags.c_contiguous)
+        buf = overlay_buffers.segment_lines(points)
+        _assert_buffer(self, buf, 8)
+        np.testing.assert_array_equal(buf, points.astype(np.float32))
+
+    def test_empty(self) -> None:
+        _assert_buffer(self, overlay_buffers.segment_lines([]), 0)
+        _assert_buffer(self, overlay_buffers.segment_lines(np.empty((0, 2, 3))), 0)
+
+
+if __name__ == "__main__":
+    unittest.main(argv=[sys.argv[0]])
@@ -0,0 +1,94 @@
+"""Plane fits for Make Coplanar (modules/plane_fit); NumPy only, no Blender needed.
+
+Run from repo root:
+  python -m unittest test_plane_fit
+"""
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+ADDON_ROOT = Path(__file__).resolve().parent
+
+if str(ADDON_ROOT) not in sys.path:
+    sys.path.insert(0, str(ADDON_ROOT))
+
+from modules import plane_fit  # noqa: E402
+
+
+def _plane_points(n: int, normal, offset: float, noise: float, seed: int = 1) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    normal = np.asarray(normal, dtype=np.float64)
+    normal /= np.linalg.norm(normal)
+    u = np.cross(normal, (1.0, 0.0, 0.0) if abs(normal[0]) < 0.9 else (0.0, 1.0, 0.0))
+    u /= np.linalg.norm(u)
+    v = np.cross(normal, u)
+    st = rng.uniform(-3.0, 3.0, (n, 2))
+    return st[:, :1] * u + st[:, 1:] * v + normal * (offset + rng.normal(0.0, noise, (n, 1)))
+
+
+def _normal_angle(a: np.ndarray, b: np.ndarray) -> float:
+    return float(np.degrees(np.arccos(min(1.0, abs(float(a @ b))))))
+
+
+class FitPlaneTest(unittest.TestCase):
+    normal = np.array((0.3, -0.5, 0.81))
+
+    def test_least_squares_exact_plane(self) -> None:
+        pts = _plane_points(200, self.normal, 1.5, 0.0)
+        point, normal = plane_fit.fit_plane(pts)
+        unit = self.normal / np.linalg.norm(self.normal)
+        self.assertAlmostEqual(float(np.linalg.norm(normal)), 1.0, places=12)
+        self.assertLess(_normal_angle(normal, unit), 1e-6)
+        self.assertAlmostEqual(float((point @ unit)), 1.5, places=9)
+
+    def test_degenerate_inputs(self) -> None:
+        self.assertIsNone(plane_fit.fit_plane(np.zeros((2, 3))))
+        self.assertIsNone(plane_fit.fit_plane(np.ones((10, 3))))
+        line = np.outer(np.linspace(0.0, 1.0, 10), (1.0, 2.0, 3.0))
+        for method in (plane_fit.FIT_LEAST_SQUARES, plane_fit.FIT_TRIMMED, plane_fit.FIT_RANSAC):
+            self.assertIsNone(plane_fit.fit_plane(line, method))
+
+    def test_robust_fits_ignore_outliers(self) -> None:
+        pts = _plane_points(300, self.normal, 0.0, 1e-4)
+        rng = np.random.default_rng(5)
+        outliers = rng.uniform(-3.0, 3.0, (60, 3)) + self.normal * 4.0
+        pts = np.vstack((pts, outliers))
+        unit = self.normal / np.linalg.norm(self.normal)
+        _p, ls_normal = plane_fit.fit_plane(pts, plane_fit.FIT_LEAST_SQUARES)
+        _p, ransac_normal = plane_fit.fit_plane(pts, plane_fit.FIT_RANSAC)
+        _p, trimmed_normal = plane_fit.fit_plane(pts, plane_fit.FIT_TRIMMED)
+        self.assertLess(_normal_angle(ransac_normal, unit), 0.05)
+        self.assertLess(_normal_angle(trimmed_normal, unit), _normal_angle(ls_normal, unit))
+
+    def test_ransac_is_deterministic(self) -> None:
+        pts = _plane_points(120, self.normal, 0.2, 0.01)
+        a = plane_fit.fit_plane(pts, plane_fit.FIT_RANSAC)
+        b = plane_fit.fit_plane(pts, plane_fit.FIT_RANSAC)
+        np.testing.assert_array_equal(a[0], b[0])
+        np.testing.assert_array_equal(a[1], b[1])
+
+
+class ThreePointTest(unittest.TestCase):
+    def test_matches_legacy_pick(self) -> None:
+        rng = np.random.default_rng(3)
+        pts = rng.normal(size=(40, 3))
+        ia, ib, ic = plane_fit.three_point_indices(pts)
+        d2 = ((pts[:, None, :] - pts[None, :, :]) ** 2).sum(axis=2)
+        self.assertAlmostEqual(float(d2[ia, ib]), float(d2.max()))
+        line = pts[ib] - pts[ia]
+        cross = np.cross(pts - pts[ia], line)
+        far = np.einsum("ij,ij->i", cross, cross)
+        far[[ia, ib]] = -1.0
+        self.assertEqual(ic, int(np.argmax(far)))
+
+    def test_degenerate(self) -> None:
+        self.assertIsNone(plane_fit.three_point_indices(np.zeros((2, 3))))
+        self.assertIsNone(plane_fit.three_point_indices(np.zeros((5, 3))))
+
+
+if __name__ == "__main__":
+    unittest.main(argv=[sys.argv[0]])
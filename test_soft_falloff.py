@@ -0,0 +1,88 @@
+"""Proportional falloff blending (modules/soft_falloff) vs. all pairs; no Blender needed.
+
+Run from repo root:
+  python -m unittest test_soft_falloff
+"""
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+ADDON_ROOT = Path(__file__).resolve().parent
+
+if str(ADDON_ROOT) not in sys.path:
+    sys.path.insert(0, str(ADDON_ROOT))
+
+from modules import soft_falloff  # noqa: E402
+
+
+def _brute_offsets(src, delta, query, radius, falloff_type):
+    d = np.linalg.norm(query[:, None, :] - src[None, :, :], axis=2)
+    w = soft_falloff.falloff_weights(d / radius, falloff_type)
+    sum_w = w.sum(axis=1)
+    rows = np.nonzero(sum_w > 0.0)[0]
+    offsets = (w[rows] @ delta) / sum_w[rows, None] * w[rows].max(axis=1)[:, None]
+    return rows, offsets
+
+
+class FalloffWeightsTest(unittest.TestCase):
+    def test_curves(self) -> None:
+        ratio = np.array((0.0, 0.5, 1.0, 2.0))
+        for falloff_type in soft_falloff.FALLOFF_TYPES:
+            w = soft_falloff.falloff_weights(ratio, falloff_type)
+            self.assertEqual(w[0], 1.0, falloff_type)
+            self.assertTrue(0.0 < w[1] < 1.0, falloff_type)
+            np.testing.assert_array_equal(w[2:], 0.0)
+        np.testing.assert_allclose(soft_falloff.falloff_weights(ratio[1:2], 'LINEAR'), 0.5)
+        np.testing.assert_allclose(soft_falloff.falloff_weights(ratio[1:2], 'SMOOTH'), 0.5625)
+
+
+class BlendOffsetsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(21)
+        self.query = rng.uniform(-4.0, 4.0, (3000, 3))
+        self.src = rng.uniform(-2.0, 2.0, (400, 3))
+        self.delta = rng.normal(size=(400, 3))
+
+    def _check(self, radius: float, falloff_type: str) -> None:
+        rows, offsets = soft_falloff.blend_offsets(self.src, self.delta, self.query, radius, falloff_type)
+        want_rows, want = _brute_offsets(self.src, self.delta, self.query, radius, falloff_type)
+        order = np.argsort(rows)
+        np.testing.assert_array_equal(rows[order], want_rows)
+        np.testing.assert_allclose(offsets[order], want, atol=1e-9)
+
+    def test_grid_path(self) -> None:
+        saved = soft_falloff._DENSE_RATIO
+        soft_falloff._DENSE_RATIO = 0
+        try:
+            for falloff_type in soft_falloff.FALLOFF_TYPES:
+                self._check(0.6, falloff_type)
+        finally:
+            soft_falloff._DENSE_RATIO = saved
+
+    def test_dense_path(self) -> None:
+        saved = soft_falloff._DENSE_RATIO
+        soft_falloff._DENSE_RATIO = 1 << 30
+        try:
+            self._check(1.5, 'SMOOTH')
+        finally:
+            soft_falloff._DENSE_RATIO = saved
+
+    def test_empty_cases(self) -> None:
+        empty = np.empty((0, 3), dtype=np.float64)
+        for args in (
+            (self.src, self.delta, self.query, 0.0),
+            (empty, empty, self.query, 1.0),
+            (self.src, self.delta, empty, 1.0),
+            (self.src, self.delta, self.query + 100.0, 1.0),
+        ):
+            rows, offsets = soft_falloff.blend_offsets(*args)
+            self.assertEqual(rows.shape, (0,))
+            self.assertEqual(offsets.shape, (0, 3))
+
+
+if __name__ == "__main__":
+    unittest.main(argv=[sys.argv[0]])